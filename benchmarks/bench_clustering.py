@@ -0,0 +1,84 @@
+"""
+Benchmark idea clustering on synthetic themed ideas.
+
+Times ``IdeaClusterer.fit`` over all N ideas, incremental ``partial_fit``
+in batches of 500, and ``summarize``, and reports how many themes were
+recovered as a single cluster.
+
+Run:
+    python benchmarks/bench_clustering.py [N]
+"""
+
+import random
+import sys
+import time
+
+from cosci.clustering import IdeaClusterer
+from cosci.models import Idea
+
+DEFAULT_COUNT = 50_000
+THEMES = (
+    "graph neural network node embedding message passing",
+    "protein folding structure prediction amino acid",
+    "climate model carbon emission temperature forecast",
+    "robot manipulation grasping reinforcement policy",
+    "language model retrieval augmented generation",
+    "quantum error correction qubit circuit",
+    "drug discovery molecule binding affinity",
+    "federated learning privacy gradient client",
+)
+FILLER = "novel approach method study improve evaluate using based".split()
+
+
+def make_ideas(count: int):
+    rng = random.Random(0)
+    ideas = []
+    for i in range(count):
+        theme = i % len(THEMES)
+        words = THEMES[theme].split()
+        ideas.append(
+            Idea(
+                str(i),
+                title=" ".join(rng.sample(words, 4)),
+                description=" ".join(rng.choices(words + FILLER, k=20)),
+                attributes={"eloRating": round(rng.gauss(1300, 120), 1)},
+                session_id=str(theme),
+            )
+        )
+    return ideas
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def recovered(themes, ideas) -> int:
+    return sum(
+        1
+        for theme in themes
+        if len({ideas[int(i)].session_id for i in theme["idea_ids"]}) == 1
+    )
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    ideas = make_ideas(count)
+    print(f"{count:,} ideas, {len(THEMES)} themes")
+
+    clusterer = IdeaClusterer(n_clusters=len(THEMES))
+    print(f"{'fit':12s} {timed(lambda: clusterer.fit(ideas)):8.0f} ms")
+
+    incremental = IdeaClusterer(n_clusters=len(THEMES))
+
+    def feed():
+        for start in range(0, count, 500):
+            incremental.partial_fit(ideas[start : start + 500])
+
+    print(f"{'partial_fit':12s} {timed(feed):8.0f} ms")
+
+    themes = []
+    summary = timed(lambda: themes.extend(clusterer.summarize(ideas)))
+    print(f"{'summarize':12s} {summary:8.0f} ms")
+    print(f"themes recovered: {recovered(themes, ideas)}/{len(THEMES)}")
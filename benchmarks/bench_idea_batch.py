@@ -0,0 +1,100 @@
+"""
+Benchmark IdeaBatch against IdeaProcessor on a large idea set.
+
+Ranks, filters and summarizes N synthetic ideas spread over many sessions,
+once with the list-based IdeaProcessor and once with the NumPy-backed
+IdeaBatch. Requires NumPy.
+
+Run:
+    python benchmarks/bench_idea_batch.py [N]
+"""
+
+import random
+import sys
+import time
+
+from cosci.batch import IdeaBatch
+from cosci.models import Idea
+from cosci.utils import IdeaProcessor
+
+DEFAULT_COUNT = 300_000
+SESSIONS = 500
+REPEATS = 5
+
+
+def make_ideas(count: int):
+    rng = random.Random(0)
+    return [
+        Idea(
+            str(i),
+            title=f"Idea {i}",
+            attributes={"eloRating": rng.gauss(1300, 120), "ranking": i % 100},
+            session_id=f"session-{i % SESSIONS}",
+        )
+        for i in range(count)
+    ]
+
+
+def group_by_session(ideas):
+    """
+    Pure-Python per-session Elo count/mean/min/max.
+    """
+    groups = {}
+    for idea in ideas:
+        elo = idea.attributes.get("eloRating")
+        if elo is None:
+            continue
+        group = groups.setdefault(idea.session_id, [0, 0.0, elo, elo])
+        group[0] += 1
+        group[1] += elo
+        group[2] = min(group[2], elo)
+        group[3] = max(group[3], elo)
+    return {
+        session: {"count": n, "mean": total / n, "min": low, "max": high}
+        for session, (n, total, low, high) in groups.items()
+    }
+
+
+def best_of(func) -> float:
+    """
+    Return the fastest of several runs, in milliseconds.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    ideas = make_ideas(count)
+
+    start = time.perf_counter()
+    batch = IdeaBatch.from_ideas(ideas)
+    print(
+        f"{count:,} ideas, IdeaBatch built in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+    print(f"{'operation':28s} {'IdeaProcessor':>14s} {'IdeaBatch':>10s}")
+
+    cases = {
+        "rank by Elo (indices)": (
+            lambda: IdeaProcessor.rank_ideas(ideas),
+            lambda: batch.argsort("eloRating"),
+        ),
+        "filter min_elo=1400": (
+            lambda: IdeaProcessor.filter_ideas(ideas, min_elo=1400),
+            lambda: batch.mask(min_elo=1400),
+        ),
+        "Elo min/avg/max": (
+            lambda: IdeaProcessor.summarize_ideas(ideas),
+            lambda: (batch.elo.min(), batch.elo.mean(), batch.elo.max()),
+        ),
+        "per-session Elo stats": (
+            lambda: group_by_session(ideas),
+            lambda: batch.group_by_session(),
+        ),
+    }
+    for label, (baseline, vectorized) in cases.items():
+        print(f"{label:28s} {best_of(baseline):11.1f} ms {best_of(vectorized):7.1f} ms")
@@ -0,0 +1,49 @@
+"""
+Benchmark SDK import time.
+
+Each statement runs in a fresh interpreter; the median wall time over
+several runs is reported. "eager (all modules)" imports every module the
+package used to load from ``cosci/__init__.py``.
+
+Run:
+    python benchmarks/bench_import_time.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+
+STATEMENTS = {
+    "python startup": "pass",
+    "import cosci": "import cosci",
+    "from cosci import CoScientist": "from cosci import CoScientist",
+    "eager (all modules)": (
+        "import cosci.client, cosci.session, cosci.api_client, cosci.auth, "
+        "cosci.transport, cosci.models, cosci.logger, cosci.exceptions; "
+        "import requests, google.auth.transport.requests, google.oauth2.service_account"
+    ),
+}
+
+
+def measure(statement: str) -> float:
+    """
+    Return median seconds to run the statement in a new interpreter.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    timings = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    for label, statement in STATEMENTS.items():
+        print(f"{label:32s} {measure(statement) * 1000:8.1f} ms")
@@ -0,0 +1,108 @@
+"""
+Benchmark memory and construction time per Idea when holding many ideas
+in RAM.
+
+Compares a plain ``__dict__`` class equivalent to the previous Idea model
+with the slotted ``cosci.models.Idea``. Memory is measured with tracemalloc
+while N ideas parsed from the same API-shaped data are alive; construction
+time is measured separately, without tracemalloc.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_model_memory.py [N]
+"""
+
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from cosci.models import Idea, session_id_from_path
+
+DEFAULT_COUNT = 1_000_000
+
+SESSION_PATH = (
+    "projects/p/locations/global/collections/default_collection/"
+    "engines/e/sessions/1234567890"
+)
+
+
+class DictIdea:
+    """
+    Previous Idea model: instance ``__dict__`` and an eager timestamp.
+    """
+
+    def __init__(
+        self, idea_id, title=None, description=None, content=None, attributes=None
+    ):
+        self.idea_id = idea_id
+        self.title = title
+        self.description = description
+        self.content = content or {}
+        self.attributes = attributes or {}
+        self.created_at = datetime.now()
+
+
+def raw_ideas(count: int):
+    """
+    Yield (name, title, attributes) tuples shaped like parsed API responses.
+    """
+    for i in range(count):
+        name = f"{SESSION_PATH}/ideaForgeInstances/1/ideaForgeIdeas/{i}"
+        yield name, f"Idea {i % 1000}", {"ranking": i % 50, "eloRating": 1200.0}
+
+
+def build_dict(count: int):
+    return [
+        DictIdea(name.split("/")[-1], title=title, attributes=attributes)
+        for name, title, attributes in raw_ideas(count)
+    ]
+
+
+def build_slotted(count: int):
+    return [
+        Idea(
+            name.split("/")[-1],
+            title=title,
+            attributes=attributes,
+            session_id=session_id_from_path(name),
+        )
+        for name, title, attributes in raw_ideas(count)
+    ]
+
+
+def measure(build, count: int) -> float:
+    """
+    Return bytes allocated per idea while all ideas are alive.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ideas = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del ideas
+    return (after - before) / count
+
+
+def construction_time(build, count: int) -> float:
+    """
+    Return seconds to build all ideas, excluding the input tuples.
+    """
+    build(min(count, 1000))
+    start = time.perf_counter()
+    ideas = build(count)
+    elapsed = time.perf_counter() - start
+    del ideas
+    return elapsed
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    print(f"{count:,} ideas")
+    builders = {"dict-based Idea": build_dict, "slotted Idea": build_slotted}
+    for label, build in builders.items():
+        per_idea = measure(build, count)
+        seconds = construction_time(build, count)
+        print(
+            f"{label:20s} {per_idea:8.0f} bytes/idea  "
+            f"{per_idea * count / 2**20:8.1f} MiB  {seconds:6.2f} s to build"
+        )
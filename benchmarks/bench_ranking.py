@@ -0,0 +1,52 @@
+"""
+Benchmark top-K selection against full sorting of ideas.
+
+Compares sorting all N ideas and slicing the first K with the heap-based
+``IdeaProcessor.top_k`` for the default Elo/ranking/recency keys.
+
+Run:
+    python benchmarks/bench_ranking.py [N]
+"""
+
+import random
+import sys
+import time
+
+from cosci.models import Idea
+from cosci.utils import DEFAULT_RANK_KEYS, IdeaProcessor
+
+DEFAULT_COUNT = 200_000
+K_VALUES = (3, 10, 100, 1000)
+
+
+def make_ideas(count: int):
+    rng = random.Random(0)
+    return [
+        Idea(
+            str(i),
+            attributes={
+                "eloRating": round(rng.gauss(1300, 120), 1),
+                "ranking": rng.randint(1, 100) if i % 10 else None,
+            },
+            created_at=1_700_000_000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    ideas = make_ideas(count)
+    print(f"{count:,} ideas, keys {', '.join(DEFAULT_RANK_KEYS)}")
+
+    full = timed(lambda: IdeaProcessor.rank_by(ideas))
+    print(f"{'full sort':12s} {full:8.0f} ms")
+    for k in K_VALUES:
+        top = timed(lambda: IdeaProcessor.top_k(ideas, k))
+        print(f"{'top ' + str(k):12s} {top:8.0f} ms")
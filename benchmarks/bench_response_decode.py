@@ -0,0 +1,85 @@
+"""
+Benchmark per-request CPU spent decoding an instance payload.
+
+Compares ``json.loads`` with ``orjson.loads`` on the same UTF-8 bytes,
+then times the full ``TransportResponse.json()`` path used by
+APIClient.request. Both decoders get bytes, so the numbers exclude the
+charset detection that ``requests.Response.text`` adds.
+
+Requires the speedups extra: pip install 'py-cosci[speedups]'
+
+Run from the repository root:
+    PYTHONPATH=. python benchmarks/bench_response_decode.py
+"""
+
+import json
+import sys
+import time
+
+from cosci.transport import TransportResponse
+
+try:
+    import orjson
+except ImportError:
+    sys.exit("orjson is not installed: pip install 'py-cosci[speedups]'")
+
+NUM_IDEAS = 100
+ITERATIONS = 500
+
+
+def build_payload(num_ideas: int) -> bytes:
+    """
+    Build an instance payload shaped like an ideaForgeInstances GET.
+    """
+    base = "projects/p/locations/global/collections/default_collection/engines/e"
+    instance = {
+        "name": f"{base}/sessions/123/ideaForgeInstances/456",
+        "state": "SUCCEEDED",
+        "stats": {"numIdeas": num_ideas},
+        "config": {"goal": "Novel approaches to reduce hospital readmission rates"},
+        "ideaPreviews": [
+            {
+                "ideaForgeIdea": f"{base}/sessions/123/ideaForgeInstances/456/ideaForgeIdeas/{i}",
+                "title": f"Idea {i}: Adaptive re-ranking with learned relevance – ü",
+                "summary": "A multi-stage pipeline that " * 40,
+                "ranking": i + 1,
+                "eloRating": 1200 + i * 3.7,
+            }
+            for i in range(num_ideas)
+        ],
+    }
+    return json.dumps(instance, ensure_ascii=False).encode("utf-8")
+
+
+def transport_path(content: bytes):
+    """
+    Response handling used by APIClient.request with DEBUG disabled.
+    """
+    response = TransportResponse(200, {}, content)
+    return response.json() if response.content else {}
+
+
+def measure(fn, content: bytes) -> float:
+    """
+    Return CPU seconds per call.
+    """
+    fn(content)
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        fn(content)
+    return (time.process_time() - start) / ITERATIONS
+
+
+if __name__ == "__main__":
+    content = build_payload(NUM_IDEAS)
+    assert json.loads(content) == orjson.loads(content) == transport_path(content)
+
+    stdlib = measure(json.loads, content)
+    fast = measure(orjson.loads, content)
+    transport = measure(transport_path, content)
+
+    print(f"Payload: {NUM_IDEAS} ideas, {len(content) / 1024:.1f} KiB")
+    print(f"json.loads:        {stdlib * 1000:.3f} ms CPU per request")
+    print(f"orjson.loads:      {fast * 1000:.3f} ms CPU per request")
+    print(f"TransportResponse: {transport * 1000:.3f} ms CPU per request")
+    print(f"Speedup: {stdlib / fast:.1f}x")
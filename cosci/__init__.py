@@ -3,49 +3,156 @@ Cosci - Python SDK for Google Co-Scientist Discovery Engine
 
 A production-ready SDK for interacting with Google's Co-Scientist API,
 providing research ideation and scientific discovery capabilities.
+
+Public names are imported lazily on first attribute access, so
+``import cosci`` does not pull in requests or google-auth until needed.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from cosci.__version__ import __version__, __author__, __email__, __license__
-from cosci.client import CoScientist
-from cosci.models import ResearchSession, Instance, Idea, SessionState, InstanceState
-from cosci.session import SessionManager
-from cosci.api_client import APIClient
-from cosci.auth import Authenticator, authenticate
-from cosci.logger import Logger, LogLevel, LogIcons, get_logger
-from cosci.exceptions import (
-    CosciError,
-    AuthenticationError,
-    APIError,
-    SessionError,
-    TimeoutError,
-    PollingError
-)
+
+if TYPE_CHECKING:
+    from cosci.client import CoScientist
+    from cosci.sharded import ShardedCoScientist
+    from cosci.models import (
+        ResearchSession,
+        Instance,
+        Idea,
+        SessionState,
+        InstanceState,
+    )
+    from cosci.batch import IdeaBatch
+    from cosci.index import IdeaIndex
+    from cosci.similarity import TfidfIndex
+    from cosci.dedupe import DuplicateDetector
+    from cosci.clustering import IdeaClusterer
+    from cosci.stats import IdeaStats
+    from cosci.session import SessionManager
+    from cosci.api_client import APIClient
+    from cosci.auth import Authenticator, authenticate
+    from cosci.credential_pool import CredentialPool
+    from cosci.metrics import MetricsRegistry
+    from cosci.prometheus import PrometheusExporter
+    from cosci.tracing import Tracer, TimingBreakdown
+    from cosci.logger import (
+        Logger,
+        LogLevel,
+        LogIcons,
+        configure_logging,
+        get_logger,
+        shutdown_logging,
+    )
+    from cosci.exceptions import (
+        CosciError,
+        AuthenticationError,
+        APIError,
+        SessionError,
+        TimeoutError,
+        PollingError,
+        TransportError,
+        TransportTimeout,
+        TransportConnectionError,
+        ValidationError,
+    )
+    from cosci.transport import (
+        Transport,
+        RequestsTransport,
+        HTTP2Transport,
+        create_transport,
+    )
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    # Main client
+    "CoScientist": "cosci.client",
+    "ShardedCoScientist": "cosci.sharded",
+    # Models
+    "ResearchSession": "cosci.models",
+    "Instance": "cosci.models",
+    "Idea": "cosci.models",
+    "SessionState": "cosci.models",
+    "InstanceState": "cosci.models",
+    "IdeaBatch": "cosci.batch",
+    "IdeaIndex": "cosci.index",
+    "TfidfIndex": "cosci.similarity",
+    "DuplicateDetector": "cosci.dedupe",
+    "IdeaClusterer": "cosci.clustering",
+    "IdeaStats": "cosci.stats",
+    # Session management
+    "SessionManager": "cosci.session",
+    # Low-level
+    "APIClient": "cosci.api_client",
+    "Authenticator": "cosci.auth",
+    "authenticate": "cosci.auth",
+    "CredentialPool": "cosci.credential_pool",
+    "MetricsRegistry": "cosci.metrics",
+    "PrometheusExporter": "cosci.prometheus",
+    "Tracer": "cosci.tracing",
+    "TimingBreakdown": "cosci.tracing",
+    "Transport": "cosci.transport",
+    "RequestsTransport": "cosci.transport",
+    "HTTP2Transport": "cosci.transport",
+    "create_transport": "cosci.transport",
+    # Logging
+    "Logger": "cosci.logger",
+    "LogLevel": "cosci.logger",
+    "LogIcons": "cosci.logger",
+    "get_logger": "cosci.logger",
+    "configure_logging": "cosci.logger",
+    "shutdown_logging": "cosci.logger",
+    # Exceptions
+    "CosciError": "cosci.exceptions",
+    "AuthenticationError": "cosci.exceptions",
+    "APIError": "cosci.exceptions",
+    "SessionError": "cosci.exceptions",
+    "TimeoutError": "cosci.exceptions",
+    "PollingError": "cosci.exceptions",
+    "TransportError": "cosci.exceptions",
+    "TransportTimeout": "cosci.exceptions",
+    "TransportConnectionError": "cosci.exceptions",
+    "ValidationError": "cosci.exceptions",
+}
 
 __all__ = [
     # Main client
     "CoScientist",
-    
+    "ShardedCoScientist",
     # Models
     "ResearchSession",
-    "Instance", 
+    "Instance",
     "Idea",
     "SessionState",
     "InstanceState",
-    
+    "IdeaBatch",
+    "IdeaIndex",
+    "TfidfIndex",
+    "DuplicateDetector",
+    "IdeaClusterer",
+    "IdeaStats",
     # Session management
     "SessionManager",
-    
     # Low-level
     "APIClient",
     "Authenticator",
     "authenticate",
-    
+    "CredentialPool",
+    "MetricsRegistry",
+    "PrometheusExporter",
+    "Tracer",
+    "TimingBreakdown",
+    "Transport",
+    "RequestsTransport",
+    "HTTP2Transport",
+    "create_transport",
     # Logging
     "Logger",
     "LogLevel",
     "LogIcons",
     "get_logger",
-    
+    "configure_logging",
+    "shutdown_logging",
     # Exceptions
     "CosciError",
     "AuthenticationError",
@@ -53,10 +160,30 @@ __all__ = [
     "SessionError",
     "TimeoutError",
     "PollingError",
-    
+    "TransportError",
+    "TransportTimeout",
+    "TransportConnectionError",
+    "ValidationError",
     # Version info
     "__version__",
     "__author__",
     "__email__",
     "__license__",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """
+    Import public names on first access.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,15 +5,28 @@ Core API client for interacting with Google's Co-Scientist Discovery Engine.
 """
 
 import json
+import re
 import time
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin
 
-import requests
-
+from cosci.__version__ import __version__
 from cosci.auth import Authenticator
-from cosci.exceptions import APIError
+from cosci.credential_pool import CredentialPool
+from cosci.exceptions import (
+    APIError,
+    AuthenticationError,
+    CosciError,
+    TransportConnectionError,
+    TransportError,
+    TransportTimeout,
+)
 from cosci.logger import LogIcons, LogLevel, get_logger
+from cosci.metrics import MetricsRegistry, endpoint_family
+from cosci.tracing import Span, Tracer, get_tracer
+from cosci.transport import Transport, TransportResponse, create_transport
+
+_SESSION_ID = re.compile(r"sessions/([^/:?]+)")
 
 
 class APIClient:
@@ -30,10 +43,13 @@ class APIClient:
     DEFAULT_CONNECT_TIMEOUT = 10
     MAX_RETRIES = 3
     RETRY_BACKOFF = 2
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    SUPPORTED_METHODS = ("GET", "POST", "PUT", "DELETE")
 
     def __init__(
         self,
-        authenticator: Authenticator,
+        authenticator: Union[Authenticator, CredentialPool],
         project_id: str,
         engine: str,
         location: str = "global",
@@ -43,12 +59,23 @@ class APIClient:
         log_level: LogLevel = LogLevel.INFO,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        base_url: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        warmup_connections: int = 0,
+        transport: Union[str, Transport, None] = None,
+        compression: bool = True,
+        share_auth_session: bool = True,
+        tracer: Optional[Tracer] = None,
     ):
         """
         Initialize the API client.
 
         Args:
-            authenticator: Authenticator instance for handling auth
+            authenticator: Authenticator, or CredentialPool to spread
+                requests across several service accounts
             project_id: Google Cloud project ID
             engine: Discovery Engine name
             location: API location (default: "global")
@@ -58,11 +85,26 @@ class APIClient:
             log_level: Logging level
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            base_url: Override for the API host (default: BASE_URL)
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept alive per host pool
+            pool_block: Block when the pool is exhausted instead of opening
+                extra, non-reused connections
+            keep_alive: Reuse connections between requests
+            warmup_connections: Connections to open in parallel at startup
+            transport: Transport name ("requests" or "http2") or instance
+            compression: Request gzip/deflate-compressed responses
+            share_auth_session: Route token refreshes through this client's
+                pooled session (requests transport only)
+            tracer: Tracer for request spans (default: the global tracer)
         """
         self.logger = get_logger(logger_name, log_level)
         self.logger.section("API Client Initialization", "-", 50)
 
         self.authenticator = authenticator
+        self._pool = (
+            authenticator if isinstance(authenticator, CredentialPool) else None
+        )
         self.project_id = project_id
         self.engine = engine
         self.location = location
@@ -71,35 +113,97 @@ class APIClient:
 
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries or self.MAX_RETRIES
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.pool_connections = pool_connections or self.DEFAULT_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.DEFAULT_POOL_MAXSIZE
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.compression = compression
+        self.transport_name = (
+            transport.name if isinstance(transport, Transport) else transport
+        ) or "requests"
 
         self.logger.info("API Client Configuration:", LogIcons.DATA)
         self.logger.indent()
-        self.logger.info(f"Base URL: {self.BASE_URL}")
+        self.logger.info(f"Base URL: {self.base_url}")
         self.logger.info(f"API Version: {self.API_VERSION}")
         self.logger.info(f"Project: {self.project_id}")
         self.logger.info(f"Engine: {self.engine}")
         self.logger.info(f"Location: {self.location}")
         self.logger.info(f"Timeout: {self.timeout}s")
         self.logger.info(f"Max Retries: {self.max_retries}")
+        self.logger.info(f"Transport: {self.transport_name}")
+        self.logger.info(f"Compression: {self.compression}")
+        self.logger.info(
+            f"Connection Pool: {self.pool_maxsize} per host, "
+            f"{self.pool_connections} hosts, block={self.pool_block}, "
+            f"keep-alive={self.keep_alive}"
+        )
         self.logger.dedent()
 
         self.base_path = self._build_base_path()
         self.logger.info(f"Base Path: {self.base_path}", LogIcons.API)
 
-        self.logger.debug("Creating requests session for connection pooling")
-        self.session = requests.Session()
+        if isinstance(transport, Transport):
+            self.transport = transport
+        else:
+            self.logger.debug(f"Creating {self.transport_name} transport")
+            self.transport = create_transport(
+                self.transport_name,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+                keep_alive=self.keep_alive,
+            )
 
-        self.stats = {
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "total_retries": 0,
-            "total_time": 0.0,
-            "status_codes": {},
-        }
+        self.metrics = MetricsRegistry()
+        self.tracer = tracer or get_tracer()
+
+        if share_auth_session and self.session is not None:
+            self.authenticator.use_session(
+                self.session, timeout=(self.DEFAULT_CONNECT_TIMEOUT, self.timeout)
+            )
+
+        if warmup_connections > 0:
+            self.warm_up(warmup_connections)
 
         self.logger.success("API Client ready", LogIcons.SUCCESS)
 
+    @property
+    def session(self):
+        """
+        Underlying ``requests.Session`` when using the requests transport.
+        """
+        return getattr(self.transport, "session", None)
+
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Open connections to the API host ahead of the first real request.
+
+        Each connection pays its TCP and TLS handshake here and is returned
+        to the pool, so the first burst of calls can reuse it.
+
+        Args:
+            connections: Number of connections to open in parallel
+
+        Returns:
+            Number of connections successfully opened
+        """
+        self.logger.info(
+            f"Warming up {connections} connection(s) to {self.base_url}",
+            LogIcons.API,
+        )
+
+        start_time = time.time()
+        opened = self.transport.warm_up(
+            self.base_url, connections, timeout=self.DEFAULT_CONNECT_TIMEOUT
+        )
+
+        self.logger.debug(
+            f"Warmed up {opened} connection(s) in {time.time() - start_time:.2f}s"
+        )
+        return opened
+
     def _build_base_path(self) -> str:
         """
         Build the base path for API endpoints.
@@ -133,7 +237,7 @@ class APIClient:
             endpoint = endpoint[1:]
 
         # Build base URL
-        base = f"{self.BASE_URL}/{self.API_VERSION}/"
+        base = f"{self.base_url}/{self.API_VERSION}/"
 
         # Add base path if not already in endpoint
         if not endpoint.startswith(self.base_path):
@@ -143,6 +247,37 @@ class APIClient:
         self.logger.debug(f"Built URL: {url}")
         return url
 
+    def _build_headers(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        credential: Optional[Authenticator] = None,
+    ) -> Dict[str, str]:
+        """
+        Build request headers from auth, compression and custom headers.
+
+        Args:
+            headers: Additional headers, applied last
+            credential: Authenticator to sign with (default: the client's)
+
+        Returns:
+            Merged headers for a request
+        """
+        # Get authentication headers
+        self.logger.debug("Getting authentication headers")
+        request_headers = (credential or self.authenticator).get_headers()
+
+        # Google APIs only gzip responses for user agents containing "gzip"
+        if self.compression:
+            request_headers["Accept-Encoding"] = "gzip, deflate"
+            request_headers["User-Agent"] = f"py-cosci/{__version__} (gzip)"
+
+        # Merge with additional headers
+        if headers:
+            request_headers.update(headers)
+            self.logger.debug(f"Added custom headers: {list(headers.keys())}")
+
+        return request_headers
+
     def request(
         self,
         method: str,
@@ -169,32 +304,73 @@ class APIClient:
         Raises:
             APIError: If request fails after retries
         """
-        url = self._build_url(endpoint)
+        method = method.upper()
+        if method not in self.SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
-        self.logger.subsection(f"{method} Request")
-        self.logger.info(f"URL: {url}", LogIcons.API)
+        labels = {"method": method, "endpoint": endpoint_family(endpoint)}
+        outcome = "failure"
+        start_time = time.time()
+        self.metrics.gauge_add("requests_in_flight", 1)
 
-        # Get authentication headers
-        self.logger.debug("Getting authentication headers")
-        auth_headers = self.authenticator.get_headers()
+        try:
+            with self.tracer.span("http.request", kind="http", **labels) as span:
+                result = self._request(
+                    method, endpoint, labels, span, data, params, headers, retry
+                )
+            outcome = "success"
+            return result
+        finally:
+            self.metrics.gauge_add("requests_in_flight", -1)
+            self.metrics.observe(
+                "request_latency_seconds", time.time() - start_time, labels
+            )
+            self.metrics.inc("requests_total", labels={**labels, "outcome": outcome})
 
-        # Merge with additional headers
-        if headers:
-            auth_headers.update(headers)
-            self.logger.debug(f"Added custom headers: {list(headers.keys())}")
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        labels: Dict[str, str],
+        span: Span,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        retry: bool,
+    ) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Send a request, retrying as needed; see request().
+        """
+        url = self._build_url(endpoint)
+
+        # Stable fields for structured request events
+        session_match = _SESSION_ID.search(endpoint)
+        event_fields = {
+            "method": method,
+            "endpoint": endpoint,
+            "session_id": session_match.group(1) if session_match else None,
+        }
+
+        self.logger.subsection(f"{method} Request")
+        self.logger.event(
+            "http_request", f"URL: {url}", icon=LogIcons.API, **event_fields
+        )
 
-        # Log request details
+        # Log request details; messages are only built at DEBUG level
         if data:
-            self.logger.debug(f"Request body: {json.dumps(data, indent=2)[:500]}...")
+            self.logger.debug(
+                lambda: f"Request body: {json.dumps(data, indent=2)[:500]}..."
+            )
         if params:
-            self.logger.debug(f"Query params: {params}")
+            self.logger.debug(lambda: f"Query params: {params}")
+
+        body = None
+        if data is not None and method in ("POST", "PUT"):
+            body = json.dumps(data).encode("utf-8")
 
-        # Update statistics
-        self.stats["total_requests"] += 1
+        request_number = self.metrics.inc("requests_started_total")
         start_time = time.time()
-        self.logger.info(
-            f"Request #{self.stats['total_requests']} starting", LogIcons.PROCESS
-        )
+        self.logger.info(f"Request #{request_number:.0f} starting", LogIcons.PROCESS)
 
         # Retry logic
         last_error = None
@@ -203,74 +379,66 @@ class APIClient:
 
         while retries < max_attempts:
             attempt_start = time.time()
+            retry_reason = None
+            credential = self._pool.checkout() if self._pool else self.authenticator
+            status_code = None
 
             try:
-                self.logger.info(f"Attempt {retries + 1}/{max_attempts}", LogIcons.TIME)
-
-                # Make the request based on method
-                if method.upper() == "GET":
-                    self.logger.debug("Sending GET request")
-                    response = self.session.get(
-                        url,
-                        headers=auth_headers,
-                        params=params,
-                        timeout=(self.DEFAULT_CONNECT_TIMEOUT, self.timeout),
-                    )
-                elif method.upper() == "POST":
-                    self.logger.debug("Sending POST request")
-                    response = self.session.post(
-                        url,
-                        headers=auth_headers,
-                        json=data,
-                        params=params,
-                        timeout=(self.DEFAULT_CONNECT_TIMEOUT, self.timeout),
-                    )
-                elif method.upper() == "PUT":
-                    self.logger.debug("Sending PUT request")
-                    response = self.session.put(
-                        url,
-                        headers=auth_headers,
-                        json=data,
-                        params=params,
-                        timeout=(self.DEFAULT_CONNECT_TIMEOUT, self.timeout),
-                    )
-                elif method.upper() == "DELETE":
-                    self.logger.debug("Sending DELETE request")
-                    response = self.session.delete(
-                        url,
-                        headers=auth_headers,
-                        params=params,
-                        timeout=(self.DEFAULT_CONNECT_TIMEOUT, self.timeout),
-                    )
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                self.logger.event(
+                    "http_attempt",
+                    f"Attempt {retries + 1}/{max_attempts}",
+                    icon=LogIcons.TIME,
+                    attempt=retries + 1,
+                    **event_fields,
+                )
 
-                # Track status code
-                status_code = response.status_code
-                self.stats["status_codes"][status_code] = (
-                    self.stats["status_codes"].get(status_code, 0) + 1
+                auth_headers = self._build_headers(headers, credential)
+
+                self.logger.debug(f"Sending {method} request")
+                response = self.transport.send(
+                    method,
+                    url,
+                    headers=auth_headers,
+                    params=params,
+                    body=body,
+                    timeout=(self.DEFAULT_CONNECT_TIMEOUT, self.timeout),
                 )
 
+                # Track status code, latency and payload sizes
+                status_code = response.status_code
                 attempt_time = time.time() - attempt_start
+                span.set_attributes(status=status_code, attempts=retries + 1)
+                self.metrics.inc("responses_total", labels={"status": status_code})
+                self.metrics.observe("attempt_latency_seconds", attempt_time, labels)
+                self.metrics.inc("bytes_sent_total", len(body or b""), labels)
+                self.metrics.inc("bytes_received_total", len(response.content), labels)
                 icon = LogIcons.SUCCESS if status_code == 200 else LogIcons.WARNING
-                self.logger.info(
-                    f"Response: {status_code} in {attempt_time:.2f}s", icon
+                self.logger.event(
+                    "http_response",
+                    f"Response: {status_code} in {attempt_time:.2f}s",
+                    icon=icon,
+                    status=status_code,
+                    latency_ms=round(attempt_time * 1000, 1),
+                    attempt=retries + 1,
+                    bytes=len(response.content),
+                    **event_fields,
                 )
 
-                # Log response preview
-                if response.text:
-                    self.logger.debug(f"Response preview: {response.text[:500]}...")
+                # Log response preview, decoding only the previewed bytes
+                content = response.content
+                if content:
+                    self.logger.debug(
+                        lambda: "Response preview: "
+                        f"{content[:500].decode('utf-8', errors='replace')}..."
+                    )
                 else:
                     self.logger.debug("Response: Empty body")
 
                 # Check for success
                 if response.status_code == 200:
-                    # Parse response
+                    # Parse response straight from the raw bytes
                     try:
-                        if response.text:
-                            result = response.json()
-                        else:
-                            result = {}
+                        result = response.json() if content else {}
                     except json.JSONDecodeError as e:
                         self.logger.error(
                             f"Failed to parse JSON response: {e}", LogIcons.ERROR
@@ -281,23 +449,21 @@ class APIClient:
                             response.text,
                         )
 
-                    # Update statistics
-                    self.stats["successful_requests"] += 1
                     total_time = time.time() - start_time
-                    self.stats["total_time"] += total_time
 
-                    self.logger.success(
+                    self.logger.event(
+                        "http_complete",
                         f"Request successful ({total_time:.2f}s total)",
-                        LogIcons.SUCCESS,
+                        level=LogLevel.SUCCESS,
+                        icon=LogIcons.SUCCESS,
+                        status=status_code,
+                        latency_ms=round(total_time * 1000, 1),
+                        attempt=retries + 1,
+                        **event_fields,
                     )
 
                     # Log response structure
-                    if isinstance(result, dict):
-                        self.logger.debug(f"Response keys: {list(result.keys())}")
-                    elif isinstance(result, list):
-                        self.logger.debug(f"Response: List with {len(result)} items")
-                    else:
-                        self.logger.debug(f"Response type: {type(result).__name__}")
+                    self.logger.debug(lambda: self._describe_result(result))
 
                     self.logger.end_subsection()
                     return result
@@ -308,35 +474,52 @@ class APIClient:
                     self.logger.warning(
                         "Got 401 Unauthorized, refreshing token", LogIcons.AUTH
                     )
-                    self.authenticator._refresh_token()
-                    auth_headers = self.authenticator.get_headers()
+                    credential._refresh_token()
                     retries += 1
-                    self.stats["total_retries"] += 1
+                    self._count_retry("unauthorized")
                     continue
 
                 elif response.status_code == 429:
                     # Rate limited
                     wait_time = self._get_retry_after(response)
-                    self.logger.warning(
-                        f"Rate limited (429). Waiting {wait_time}s before retry",
-                        LogIcons.TIME,
+                    if self._pool:
+                        # Retry at once on another credential if one is free
+                        self._pool.eject(credential, wait_time)
+                        wait_time = self._pool.wait_time()
+                    self.logger.event(
+                        "http_retry",
+                        f"Rate limited (429). Waiting {wait_time:.0f}s before retry",
+                        level=LogLevel.WARNING,
+                        icon=LogIcons.TIME,
+                        status=status_code,
+                        attempt=retries + 1,
+                        wait_s=wait_time,
+                        **event_fields,
                     )
-                    time.sleep(wait_time)
+                    if wait_time > 0:
+                        self.metrics.inc("rate_limit_wait_seconds_total", wait_time)
+                        time.sleep(wait_time)
                     retries += 1
-                    self.stats["total_retries"] += 1
+                    self._count_retry("rate_limited")
                     continue
 
                 elif response.status_code >= 500:
                     # Server error - retry with backoff
                     if retries < max_attempts - 1:
                         wait_time = self.RETRY_BACKOFF**retries
-                        self.logger.warning(
+                        self.logger.event(
+                            "http_retry",
                             f"Server error {response.status_code}. Retrying in {wait_time}s",
-                            LogIcons.WARNING,
+                            level=LogLevel.WARNING,
+                            icon=LogIcons.WARNING,
+                            status=status_code,
+                            attempt=retries + 1,
+                            wait_s=wait_time,
+                            **event_fields,
                         )
                         time.sleep(wait_time)
                         retries += 1
-                        self.stats["total_retries"] += 1
+                        self._count_retry("server_error")
                         continue
 
                 # Other errors - don't retry
@@ -349,26 +532,34 @@ class APIClient:
                     response.text,
                 )
 
-            except requests.exceptions.Timeout as e:
+            except TransportTimeout as e:
                 last_error = f"Request timeout after {self.timeout}s: {e}"
+                retry_reason = "timeout"
                 self.logger.error(last_error, LogIcons.TIME)
 
-            except requests.exceptions.ConnectionError as e:
+            except TransportConnectionError as e:
                 last_error = f"Connection error: {e}"
+                retry_reason = "connection_error"
                 self.logger.error(last_error, LogIcons.ERROR)
 
-            except requests.exceptions.RequestException as e:
+            except TransportError as e:
                 last_error = f"Request error: {e}"
+                retry_reason = "transport_error"
                 self.logger.error(last_error, LogIcons.ERROR)
 
-            except APIError:
-                raise  # Re-raise API errors
+            except (APIError, AuthenticationError):
+                raise  # Re-raise API and authentication errors
 
             except Exception as e:
                 last_error = f"Unexpected error: {e}"
+                retry_reason = "unexpected_error"
                 self.logger.error(last_error, LogIcons.ERROR)
                 self.logger.debug(f"Exception type: {type(e).__name__}")
 
+            finally:
+                if self._pool:
+                    self._pool.release(credential, status_code)
+
             # Retry with backoff
             if retries < max_attempts - 1:
                 wait_time = self.RETRY_BACKOFF**retries
@@ -378,14 +569,11 @@ class APIClient:
                 )
                 time.sleep(wait_time)
                 retries += 1
-                self.stats["total_retries"] += 1
+                self._count_retry(retry_reason)
             else:
                 break
 
         # All retries exhausted
-        self.stats["failed_requests"] += 1
-        self.stats["total_time"] += time.time() - start_time
-
         self.logger.error(
             f"Request failed after {retries + 1} attempts", LogIcons.ERROR
         )
@@ -394,7 +582,24 @@ class APIClient:
 
         raise APIError(f"Request failed after {retries + 1} attempts: {last_error}")
 
-    def _get_retry_after(self, response: requests.Response) -> int:
+    def _count_retry(self, reason: str):
+        """
+        Record a retry and its reason.
+        """
+        self.metrics.inc("retries_total", labels={"reason": reason})
+
+    @staticmethod
+    def _describe_result(result: Any) -> str:
+        """
+        Describe the shape of a parsed response for debug logging.
+        """
+        if isinstance(result, dict):
+            return f"Response keys: {list(result.keys())}"
+        if isinstance(result, list):
+            return f"Response: List with {len(result)} items"
+        return f"Response type: {type(result).__name__}"
+
+    def _get_retry_after(self, response: TransportResponse) -> int:
         """
         Extract retry-after header value or use default.
 
@@ -419,18 +624,31 @@ class APIClient:
         self.logger.debug(f"Using default wait time: {default_wait}s")
         return default_wait
 
-    def get(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], List[Any]]:
+    def get(
+        self,
+        endpoint: str,
+        fields: Union[str, List[str], None] = None,
+        **kwargs,
+    ) -> Union[Dict[str, Any], List[Any]]:
         """
         Convenience method for GET requests.
 
         Args:
             endpoint: API endpoint
+            fields: Partial-response field mask (e.g. "state,stats"), so
+                only the listed fields are serialized and sent back
             **kwargs: Additional arguments for request()
 
         Returns:
             Response data
         """
         self.logger.debug(f"GET request to: {endpoint}")
+
+        if fields:
+            if not isinstance(fields, str):
+                fields = ",".join(fields)
+            kwargs["params"] = {**(kwargs.get("params") or {}), "fields": fields}
+
         return self.request("GET", endpoint, **kwargs)
 
     def post(
@@ -481,15 +699,80 @@ class APIClient:
         self.logger.debug(f"DELETE request to: {endpoint}")
         return self.request("DELETE", endpoint, **kwargs)
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Request statistics; kept for compatibility, see get_stats().
+
+        Each read returns a fresh snapshot, so changes made to the returned
+        dictionary are not kept.
+        """
+        return self.get_stats()
+
+    @stats.setter
+    def stats(self, value: Dict[str, Any]):
+        """
+        Reset request statistics, as assigning zeroed counters used to.
+
+        Only counters that are all zero (or empty) can be assigned; the
+        statistics are derived from ``metrics`` and cannot be set to other
+        values.
+        """
+        if any(value.values()):
+            raise CosciError(
+                "APIClient.stats can only be reset to zero; "
+                "use metrics.reset() or read get_stats()"
+            )
+        self.metrics.reset()
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get request statistics.
 
         Returns:
             Dictionary with request statistics including success rate,
-            average response time, and status code distribution.
+            average response time, status code distribution, per-endpoint
+            latency percentiles, bytes transferred and retry reasons.
+            Use ``metrics.snapshot()`` for the raw series.
         """
-        stats = self.stats.copy()
+        snapshot = self.metrics.snapshot()
+        counters = snapshot["counters"]
+        latencies = snapshot["histograms"].get("request_latency_seconds", [])
+
+        def counter_total(name: str, **label_filter) -> float:
+            return sum(
+                series["value"]
+                for series in counters.get(name, [])
+                if all(series["labels"].get(k) == v for k, v in label_filter.items())
+            )
+
+        stats: Dict[str, Any] = {
+            "total_requests": int(counter_total("requests_started_total")),
+            "successful_requests": int(
+                counter_total("requests_total", outcome="success")
+            ),
+            "failed_requests": int(counter_total("requests_total", outcome="failure")),
+            "total_retries": int(counter_total("retries_total")),
+            "total_time": sum(series["sum"] for series in latencies),
+            "status_codes": {
+                int(series["labels"]["status"]): int(series["value"])
+                for series in counters.get("responses_total", [])
+            },
+            "endpoints": {
+                f"{s['labels']['method']} {s['labels']['endpoint']}": {
+                    key: s[key] for key in ("count", "mean", "p50", "p90", "p99", "max")
+                }
+                for s in latencies
+            },
+            "bytes_sent": int(counter_total("bytes_sent_total")),
+            "bytes_received": int(counter_total("bytes_received_total")),
+            "retry_reasons": {
+                series["labels"]["reason"]: int(series["value"])
+                for series in counters.get("retries_total", [])
+            },
+            "rate_limit_wait_time": counter_total("rate_limit_wait_seconds_total"),
+            "in_flight": int(self.metrics.gauge("requests_in_flight")),
+        }
 
         # Calculate derived statistics
         if stats["successful_requests"] > 0:
@@ -508,7 +791,11 @@ class APIClient:
             stats["success_rate"] = 0.0
             stats["retry_rate"] = 0.0
 
-        self.logger.debug(f"Statistics calculated: {stats}")
+        stats["auth"] = self.authenticator.get_refresh_stats()
+        if self._pool:
+            stats["credentials"] = self._pool.get_pool_stats()
+
+        self.logger.debug(lambda: f"Statistics calculated: {stats}")
         return stats
 
     def log_stats(self):
@@ -533,6 +820,32 @@ class APIClient:
             f"Avg Response Time: {stats['avg_request_time']:.2f}s", LogIcons.TIME
         )
 
+        auth_stats = stats.get("auth")
+        if auth_stats:
+            self.logger.info(
+                f"Token Refreshes: {auth_stats['refresh_count']} "
+                f"(avg {auth_stats['avg_refresh_time']:.2f}s, "
+                f"{auth_stats['cache_hits']} cache hits)",
+                LogIcons.AUTH,
+            )
+
+        if stats["retry_reasons"]:
+            reasons = ", ".join(
+                f"{reason}: {count}"
+                for reason, count in sorted(stats["retry_reasons"].items())
+            )
+            self.logger.info(f"Retry Reasons: {reasons}", LogIcons.TIME)
+
+        if stats["endpoints"]:
+            self.logger.info("Latency by Endpoint:", LogIcons.DATA)
+            self.logger.indent()
+            for name, latency in sorted(stats["endpoints"].items()):
+                self.logger.info(
+                    f"{name}: n={latency['count']} p50={latency['p50']:.3f}s "
+                    f"p90={latency['p90']:.3f}s p99={latency['p99']:.3f}s"
+                )
+            self.logger.dedent()
+
         if stats["status_codes"]:
             self.logger.info("Status Code Distribution:", LogIcons.DATA)
             self.logger.indent()
@@ -553,8 +866,8 @@ class APIClient:
         # Log final statistics
         self.log_stats()
 
-        # Close HTTP session
-        self.logger.info("Closing HTTP session", LogIcons.PROCESS)
-        self.session.close()
+        # Close HTTP transport
+        self.logger.info(f"Closing {self.transport_name} transport", LogIcons.PROCESS)
+        self.transport.close()
 
         self.logger.success("API Client closed", LogIcons.SUCCESS)
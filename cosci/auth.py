@@ -5,14 +5,57 @@ Handles Google Cloud authentication for the Co-Scientist Discovery Engine API.
 """
 
 import os
-from datetime import datetime
-from typing import Dict, Optional
-
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 from cosci.exceptions import AuthenticationError
 from cosci.logger import LogIcons, LogLevel, get_logger
+from cosci.token_cache import TokenCache
+
+
+@lru_cache(maxsize=None)
+def _shared_session_request_class():
+    """
+    Build the shared-session request adapter class.
+
+    Defined on first use so importing this module does not import
+    google-auth's requests transport.
+    """
+    from google.auth.transport.requests import Request
+
+    class SharedSessionRequest(Request):
+        """
+        google-auth request adapter over a session owned by someone else.
+
+        Token refreshes reuse the session's pooled keep-alive connections and
+        proxy settings, and get a default timeout. Unlike the stock adapter,
+        the session is not closed when this object is garbage collected.
+        """
+
+        def __init__(self, session, timeout=None):
+            super().__init__(session=session)
+            self.timeout = timeout
+
+        def __call__(
+            self, url, method="GET", body=None, headers=None, timeout=None, **kwargs
+        ):
+            return super().__call__(
+                url,
+                method=method,
+                body=body,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout,
+                **kwargs,
+            )
+
+        def __del__(self):
+            # The owner closes the shared session
+            pass
+
+    return SharedSessionRequest
 
 
 class Authenticator:
@@ -21,6 +64,10 @@ class Authenticator:
     """
 
     SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+    DEFAULT_REFRESH_MARGIN = 300
+    MIN_REFRESH_RETRY = 5
+    # Shortest wait between two successful background refreshes
+    MIN_REFRESH_INTERVAL = 30
 
     def __init__(
         self,
@@ -28,9 +75,24 @@ class Authenticator:
         project_id: Optional[str] = None,
         logger_name: str = "Auth",
         log_level: LogLevel = LogLevel.INFO,
+        refresh_margin: Optional[int] = None,
+        background_refresh: bool = False,
+        token_cache_path: Optional[str] = None,
     ):
         """
         Initialize the authenticator.
+
+        Args:
+            service_account_path: Path to the service account JSON file
+            project_id: Google Cloud project ID
+            logger_name: Name for logger instance
+            log_level: Logging level
+            refresh_margin: Seconds before expiry at which the background
+                refresher renews the token
+            background_refresh: Renew the token on a background thread so
+                API calls never block on token minting
+            token_cache_path: Optional file for sharing access tokens across
+                processes; valid cached tokens skip the OAuth round-trip
         """
         self.logger = get_logger(logger_name, log_level)
 
@@ -41,9 +103,41 @@ class Authenticator:
         self.project_id = project_id
 
         self._credentials = None
-        self._auth_req = Request()
+        self._auth_req = None
         self._service_account_email = None
 
+        self.refresh_margin = (
+            self.DEFAULT_REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        )
+        self.background_refresh = background_refresh
+        self._refresh_lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresher = threading.Event()
+
+        self._token_cache = TokenCache(token_cache_path) if token_cache_path else None
+        self._cache_key: Optional[str] = None
+
+        self.stats = {
+            "refresh_count": 0,
+            "refresh_failures": 0,
+            "refresh_time": 0.0,
+            "last_refresh_time": 0.0,
+            "cache_hits": 0,
+        }
+
+    def use_session(
+        self, session, timeout: Union[float, Tuple[float, float], None] = None
+    ):
+        """
+        Send token refreshes through an existing pooled HTTP session.
+
+        Args:
+            session: ``requests.Session`` to share, typically the API client's
+            timeout: Default timeout for refresh requests
+        """
+        self.logger.debug("Token refreshes will share the pooled HTTP session")
+        self._auth_req = _shared_session_request_class()(session, timeout)
+
     def authenticate(self) -> str:
         """
         Load service account credentials and return initial access token.
@@ -55,6 +149,10 @@ class Authenticator:
             token = self.get_token()
             self.logger.process_complete("Authentication")
             self._log_auth_info()
+
+            if self.background_refresh:
+                self.start_background_refresh()
+
             return token
 
         except Exception as e:
@@ -74,6 +172,8 @@ class Authenticator:
             )
 
         try:
+            from google.oauth2 import service_account
+
             self._credentials = service_account.Credentials.from_service_account_file(
                 self.service_account_path, scopes=self.SCOPES
             )
@@ -89,6 +189,113 @@ class Authenticator:
                 f"Failed to load service account credentials: {e}"
             )
 
+        if self._token_cache:
+            self._cache_key = TokenCache.make_key(
+                self._service_account_email, self.SCOPES
+            )
+            if self._load_cached_token():
+                self.logger.info("Using cached access token", LogIcons.AUTH)
+
+    def _load_cached_token(self) -> bool:
+        """
+        Adopt a fresh token from the shared cache, if one exists.
+
+        Returns:
+            True if a cached token different from the current one was adopted
+        """
+        if not self._token_cache or not self._cache_key:
+            return False
+
+        try:
+            cached = self._token_cache.load(self._cache_key)
+        except PermissionError as e:
+            self._disable_token_cache(e)
+            return False
+        except OSError as e:
+            self.logger.debug(f"Could not read token cache: {e}")
+            return False
+
+        if not cached or cached[0] == self._credentials.token:
+            return False
+
+        self._credentials.token, self._credentials.expiry = cached
+        return True
+
+    def _store_cached_token(self):
+        """
+        Publish the current token to the shared cache.
+        """
+        if not self._token_cache or not self._cache_key:
+            return
+
+        try:
+            self._token_cache.store(
+                self._cache_key, self._credentials.token, self._credentials.expiry
+            )
+        except PermissionError as e:
+            self._disable_token_cache(e)
+        except OSError as e:
+            self.logger.debug(f"Could not write token cache: {e}")
+
+    def _disable_token_cache(self, error: PermissionError):
+        """
+        Stop using a token cache that cannot be used safely, with a warning.
+        """
+        self._token_cache = None
+        self.logger.warning(f"Token cache disabled: {error}", LogIcons.AUTH)
+
+    def _refresh_credentials(self, force: bool = False):
+        """
+        Refresh credentials, preferring a newer token from the shared cache.
+
+        Must be called with the refresh lock held.
+
+        Args:
+            force: Refresh even if the current token still looks valid
+        """
+        # Another process may already have minted a newer token
+        if self._load_cached_token() and self._credentials.valid:
+            self.logger.debug("Adopted newer token from cache")
+            self.stats["cache_hits"] += 1
+            return
+
+        if not force and self._credentials.valid:
+            return
+
+        if self._auth_req is None:
+            from google.auth.transport.requests import Request
+
+            self._auth_req = Request()
+
+        start_time = time.time()
+        try:
+            self._credentials.refresh(self._auth_req)
+        except Exception:
+            self.stats["refresh_failures"] += 1
+            raise
+        finally:
+            elapsed = time.time() - start_time
+            self.stats["refresh_time"] += elapsed
+            self.stats["last_refresh_time"] = elapsed
+
+        self.stats["refresh_count"] += 1
+        self.logger.debug(f"Token refresh took {elapsed:.3f}s")
+        self._store_cached_token()
+
+    def get_refresh_stats(self) -> Dict[str, Any]:
+        """
+        Get token refresh statistics.
+
+        Returns:
+            Dictionary with refresh counts, timings and cache hits
+        """
+        stats = self.stats.copy()
+        attempts = stats["refresh_count"] + stats["refresh_failures"]
+        stats["avg_refresh_time"] = (
+            stats["refresh_time"] / attempts if attempts else 0.0
+        )
+        return stats
+
     def get_token(self) -> str:
         """
         Get current access token.
@@ -98,15 +305,21 @@ class Authenticator:
 
         self.logger.debug("Getting access token...")
 
+        # Fast path: no locking while the token is valid
+        credentials = self._credentials
+        if credentials.valid:
+            self.logger.debug("Token is valid")
+            return credentials.token
+
         try:
-            if not self._credentials.valid:
-                self.logger.debug("Token expired or not yet fetched, refreshing...")
-                self._credentials.refresh(self._auth_req)
-                self.logger.success("Token refreshed", LogIcons.SUCCESS)
-            else:
-                self.logger.debug("Token is valid")
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited
+                if not credentials.valid:
+                    self.logger.debug("Token expired or not yet fetched, refreshing...")
+                    self._refresh_credentials()
+                    self.logger.success("Token refreshed", LogIcons.SUCCESS)
 
-            return self._credentials.token
+            return credentials.token
 
         except Exception as e:
             raise AuthenticationError(f"Failed to get access token: {e}")
@@ -116,7 +329,93 @@ class Authenticator:
         Refresh the access token.
         """
         if self._credentials:
-            self._credentials.refresh(self._auth_req)
+            with self._refresh_lock:
+                self._refresh_credentials(force=True)
+
+    def seconds_until_expiry(self) -> Optional[float]:
+        """
+        Seconds until the current token expires, or None if unknown.
+        """
+        if not self._credentials or not self._credentials.expiry:
+            return None
+
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (self._credentials.expiry - now).total_seconds()
+
+    def start_background_refresh(self):
+        """
+        Start a daemon thread that renews the token before it expires.
+
+        The token is refreshed ``refresh_margin`` seconds ahead of expiry,
+        so request threads keep finding a valid token on the fast path.
+        """
+        if not self._credentials:
+            raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        if self._refresher and self._refresher.is_alive():
+            return
+
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="cosci-token-refresh", daemon=True
+        )
+        self._refresher.start()
+        self.logger.debug(
+            f"Background token refresh started (margin={self.refresh_margin}s)"
+        )
+
+    def stop_background_refresh(self):
+        """
+        Stop the background refresher thread, if running.
+        """
+        self._stop_refresher.set()
+        if self._refresher and self._refresher is not threading.current_thread():
+            self._refresher.join(timeout=5)
+        self._refresher = None
+
+    def _refresh_loop(self):
+        """
+        Background refresher: sleep until the margin, refresh, repeat.
+
+        The margin is capped at half the lifetime of the last refreshed
+        token, and successive refreshes are at least
+        ``MIN_REFRESH_INTERVAL`` seconds apart, so a margin as long as the
+        token lifetime cannot turn the loop into a busy refresh.
+        """
+        lifetime: Optional[float] = None
+        last_refresh: Optional[float] = None
+        while not self._stop_refresher.is_set():
+            remaining = self.seconds_until_expiry()
+            if remaining is not None:
+                margin = self.refresh_margin
+                if lifetime:
+                    margin = min(margin, lifetime / 2)
+                delay = remaining - margin
+                if last_refresh is not None:
+                    since = time.monotonic() - last_refresh
+                    delay = max(delay, self.MIN_REFRESH_INTERVAL - since)
+                if delay > 0 and self._stop_refresher.wait(delay):
+                    return
+
+            if self._stop_refresher.is_set() or not self._credentials:
+                return
+
+            try:
+                self._refresh_token()
+                last_refresh = time.monotonic()
+                lifetime = self.seconds_until_expiry()
+                self.logger.debug("Token refreshed in background")
+            except Exception as e:
+                # Retry sooner while the current token is still usable
+                remaining = self.seconds_until_expiry() or 0
+                retry_in = max(self.MIN_REFRESH_RETRY, min(60, remaining / 2))
+                self.logger.warning(
+                    f"Background token refresh failed, retrying in {retry_in:.0f}s: {e}",
+                    LogIcons.AUTH,
+                )
+                if self._stop_refresher.wait(retry_in):
+                    return
 
     def get_headers(self) -> Dict[str, str]:
         """
@@ -143,9 +442,10 @@ class Authenticator:
             "service_account": self._service_account_email,
         }
 
-        if self._credentials and self._credentials.expiry:
+        remaining = self.seconds_until_expiry()
+        if remaining is not None:
             info["token_expiry"] = self._credentials.expiry.isoformat()
-            info["token_remaining"] = str(self._credentials.expiry - datetime.now())
+            info["token_remaining"] = str(timedelta(seconds=int(remaining)))
 
         return info
 
@@ -170,6 +470,7 @@ class Authenticator:
         Clear authentication state.
         """
         self.logger.info("Clearing authentication state", LogIcons.AUTH)
+        self.stop_background_refresh()
 
         if self._service_account_email:
             self.logger.debug(
@@ -2,15 +2,18 @@
 High-level client for the Cosci SDK.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from cosci.api_client import APIClient
 from cosci.auth import Authenticator
 from cosci.config import Config
+from cosci.credential_pool import CredentialPool
 from cosci.exceptions import CosciError
-from cosci.logger import LogIcons, LogLevel, get_logger
+from cosci.logger import LogIcons, LogLevel, configure_logging, get_logger
 from cosci.models import Idea, ResearchSession
 from cosci.session import SessionManager
+from cosci.tracing import TimingBreakdown, create_tracer
 
 
 class CoScientist:
@@ -25,6 +28,10 @@ class CoScientist:
         # Or with auto-discovery
         client = CoScientist.from_config()  # Looks for config.yaml
         ideas = client.generate_ideas("Your research question")
+
+    With ``settings.init_mode`` set to "lazy", authentication and client
+    setup happen on first use; with "background" they start on a background
+    thread right away and first use waits for them to finish.
     """
 
     def __init__(self, config: Config, auto_initialize: bool = True):
@@ -33,7 +40,8 @@ class CoScientist:
 
         Args:
             config: Configuration object
-            auto_initialize: Whether to initialize immediately
+            auto_initialize: Whether to initialize automatically, as
+                selected by ``config.init_mode``
         """
         self.config = config
 
@@ -42,17 +50,108 @@ class CoScientist:
 
         # Set up logger
         log_level = LogLevel[config.log_level.upper()]
-        self.logger = get_logger("CoScientist", log_level, file_output=config.log_file)
+        configure_logging(
+            async_output=config.log_async,
+            log_format=config.log_format,
+            sample_rates=config.log_sample_rates or None,
+        )
+        self.logger = get_logger(
+            "CoScientist",
+            log_level,
+            file_output=config.log_file,
+            max_bytes=config.log_max_bytes,
+            backup_count=config.log_backup_count,
+        )
 
         self.logger.section("Co-Scientist SDK Initialization", "=", 60)
 
+        self.tracer = create_tracer(config.tracing_exporter)
+
         # Components
-        self.authenticator = None
-        self.api_client = None
-        self.session_manager = None
+        self._authenticator = None
+        self._api_client = None
+        self._session_manager = None
+        self._exporter = None
+
+        # Deferred initialization
+        self._deferred = auto_initialize and config.init_mode != "eager"
+        self._init_lock = threading.RLock()
+        self._init_thread: Optional[threading.Thread] = None
 
         if auto_initialize:
-            self._initialize()
+            if config.init_mode == "eager":
+                self._initialize()
+            elif config.init_mode == "background":
+                self._init_thread = threading.Thread(
+                    target=self._initialize_in_background,
+                    name="cosci-init",
+                    daemon=True,
+                )
+                self._init_thread.start()
+            else:
+                self.logger.info("Initialization deferred until first use")
+
+    @property
+    def authenticator(self) -> Union[Authenticator, CredentialPool, None]:
+        """
+        Authenticator, initialized on first access in deferred mode.
+        """
+        self._ensure_initialized()
+        return self._authenticator
+
+    @authenticator.setter
+    def authenticator(self, value):
+        self._authenticator = value
+
+    @property
+    def api_client(self) -> Optional[APIClient]:
+        """
+        API client, initialized on first access in deferred mode.
+        """
+        self._ensure_initialized()
+        return self._api_client
+
+    @api_client.setter
+    def api_client(self, value):
+        self._api_client = value
+
+    @property
+    def session_manager(self) -> Optional[SessionManager]:
+        """
+        Session manager, initialized on first access in deferred mode.
+        """
+        self._ensure_initialized()
+        return self._session_manager
+
+    @session_manager.setter
+    def session_manager(self, value):
+        self._session_manager = value
+
+    def _ensure_initialized(self):
+        """
+        Finish deferred initialization before the first API call.
+        """
+        if not self._deferred or self._session_manager is not None:
+            return
+
+        thread = self._init_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        # Retries synchronously if background initialization failed
+        self._initialize_once()
+
+    def _initialize_once(self):
+        with self._init_lock:
+            if self._session_manager is None:
+                self._initialize()
+
+    def _initialize_in_background(self):
+        try:
+            self._initialize_once()
+        except CosciError:
+            # Already logged; first use retries and raises
+            pass
 
     @classmethod
     def from_config(cls, config_path: str = "config.yaml") -> "CoScientist":
@@ -72,17 +171,33 @@ class CoScientist:
         """Initialize authentication and API clients."""
         try:
             # Authenticate
-            self.authenticator = Authenticator(
-                service_account_path=self.config.credentials_path,
-                project_id=self.config.project_id,
-                logger_name="Auth",
-                log_level=LogLevel[self.config.log_level.upper()],
+            auth_kwargs = dict(
+                refresh_margin=self.config.token_refresh_margin,
+                background_refresh=self.config.background_token_refresh,
+                token_cache_path=self.config.token_cache_path,
             )
-            self.authenticator.authenticate()
+            if self.config.additional_credentials:
+                authenticator = CredentialPool.from_files(
+                    [self.config.credentials_path, *self.config.additional_credentials],
+                    project_id=self.config.project_id,
+                    strategy=self.config.credential_strategy,
+                    cooldown=self.config.credential_cooldown,
+                    log_level=LogLevel[self.config.log_level.upper()],
+                    **auth_kwargs,
+                )
+            else:
+                authenticator = Authenticator(
+                    service_account_path=self.config.credentials_path,
+                    project_id=self.config.project_id,
+                    logger_name="Auth",
+                    log_level=LogLevel[self.config.log_level.upper()],
+                    **auth_kwargs,
+                )
+            authenticator.authenticate()
 
             # Create API client
-            self.api_client = APIClient(
-                authenticator=self.authenticator,
+            api_client = APIClient(
+                authenticator=authenticator,
                 project_id=self.config.project_id,
                 engine=self.config.engine,
                 location=self.config.location,
@@ -90,28 +205,61 @@ class CoScientist:
                 logger_name="API",
                 log_level=LogLevel[self.config.log_level.upper()],
                 timeout=self.config.timeout,
+                base_url=self.config.base_url,
+                pool_connections=self.config.pool_connections,
+                pool_maxsize=self.config.pool_maxsize,
+                pool_block=self.config.pool_block,
+                keep_alive=self.config.keep_alive,
+                warmup_connections=self.config.warmup_connections,
+                transport=self.config.transport,
+                compression=self.config.compression,
+                tracer=self.tracer,
             )
 
             # Create session manager
-            self.session_manager = SessionManager(
-                api_client=self.api_client,
+            session_manager = SessionManager(
+                api_client=api_client,
                 logger=get_logger(
                     "SessionManager", LogLevel[self.config.log_level.upper()]
                 ),
+                tracer=self.tracer,
             )
 
+            self._authenticator = authenticator
+            self._api_client = api_client
+            self._session_manager = session_manager
+
+            if self.config.metrics_port is not None or self.config.metrics_textfile:
+                self._start_metrics_exporter()
+
             self.logger.success("Co-Scientist client ready", LogIcons.ROCKET)
 
         except Exception as e:
             self.logger.error(f"Initialization failed: {e}", LogIcons.ERROR)
             raise CosciError(f"Failed to initialize client: {e}")
 
+    def _start_metrics_exporter(self):
+        """
+        Start the Prometheus exporter configured in the metrics section.
+        """
+        # Imported here so the exporter costs nothing when disabled
+        from cosci.prometheus import PrometheusExporter
+
+        self._exporter = PrometheusExporter(self)
+        if self.config.metrics_port is not None:
+            self._exporter.serve(self.config.metrics_port)
+        if self.config.metrics_textfile:
+            self._exporter.start_textfile_writer(
+                self.config.metrics_textfile, self.config.metrics_interval
+            )
+
     def generate_ideas(
         self,
         research_goal: str,
         wait_timeout: Optional[int] = None,
         min_ideas: Optional[int] = None,
-    ) -> List[Idea]:
+        return_timings: bool = False,
+    ) -> Union[List[Idea], Tuple[List[Idea], TimingBreakdown]]:
         """
         Generate research ideas for a given goal.
 
@@ -119,9 +267,11 @@ class CoScientist:
             research_goal: The research question or goal
             wait_timeout: Override timeout from config
             min_ideas: Override min_ideas from config
+            return_timings: Also return where the time was spent
 
         Returns:
-            List of generated ideas
+            List of generated ideas, or (ideas, TimingBreakdown) with
+            ``return_timings``
         """
         # Use config defaults if not specified
         wait_timeout = wait_timeout or self.config.timeout
@@ -132,25 +282,36 @@ class CoScientist:
         self.logger.info(f"Timeout: {wait_timeout}s, Min ideas: {min_ideas}")
 
         try:
-            # Create session
-            session = self.session_manager.create_session(research_goal)
-
-            # Wait for instance
-            instance = self.session_manager.wait_for_instance(
-                session,
-                timeout=min(60, wait_timeout),
-                poll_interval=self.config.poll_interval,
-            )
-
-            # Poll for ideas
-            ideas = self.session_manager.poll_for_ideas(
-                instance,
-                timeout=wait_timeout,
-                poll_interval=self.config.poll_interval,
-                min_ideas=min_ideas,
-            )
-
+            with self.tracer.span("generate_ideas", engine=self.config.engine) as span:
+                # Create session
+                session = self.session_manager.create_session(research_goal)
+
+                # Wait for instance
+                instance = self.session_manager.wait_for_instance(
+                    session,
+                    timeout=min(60, wait_timeout),
+                    poll_interval=self.config.poll_interval,
+                )
+
+                # Poll for ideas
+                ideas = self.session_manager.poll_for_ideas(
+                    instance,
+                    timeout=wait_timeout,
+                    poll_interval=self.config.poll_interval,
+                    min_ideas=min_ideas,
+                )
+                span.set_attributes(session_id=session.session_id, ideas=len(ideas))
+
+            timings = TimingBreakdown(span)
             self.logger.success(f"Generated {len(ideas)} ideas", LogIcons.SUCCESS)
+            self.logger.event(
+                "generate_ideas_timings",
+                lambda: f"Timings: {timings}",
+                level=LogLevel.DEBUG,
+                **timings.to_dict(),
+            )
+            if return_timings:
+                return ideas, timings
             return ideas
 
         except Exception as e:
@@ -174,8 +335,15 @@ class CoScientist:
         """
         Close the client and clean up resources.
         """
-        if self.api_client:
-            self.api_client.close()
+        if self._init_thread is not None:
+            self._init_thread.join()
+        if self._exporter:
+            self._exporter.stop()
+        if self._api_client:
+            self._api_client.close()
+        if self._authenticator:
+            self._authenticator.stop_background_refresh()
+        self.tracer.shutdown()
         self.logger.success("Client closed", LogIcons.SUCCESS)
 
     def __enter__(self):
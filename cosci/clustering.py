@@ -0,0 +1,299 @@
+"""
+Idea Clustering Module for Cosci SDK
+====================================
+Groups ideas into themes with mini-batch spherical k-means.
+
+Ideas are vectorized with the hashing TF-IDF vectorizer from
+``cosci.similarity`` and clustered by cosine similarity. Centroids are
+updated from small batches, so tens of thousands of ideas cluster in
+seconds and new ideas can be folded in with ``partial_fit`` as they
+arrive.
+
+Requires NumPy: pip install 'py-cosci[analysis]'
+
+Example:
+    clusterer = IdeaClusterer(n_clusters=8).fit(ideas)
+    for theme in clusterer.summarize(ideas):
+        print(theme["size"], theme["titles"][0], theme["elo"]["mean"])
+    clusterer.partial_fit(new_ideas)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cosci.exceptions import CosciError
+from cosci.models import Idea
+from cosci.similarity import HashingVectorizer, idea_text
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Rows = Tuple["np.ndarray", "np.ndarray", "np.ndarray"]
+
+
+def _require_numpy():
+    if np is None:
+        raise CosciError(
+            "Idea clustering requires NumPy.\n"
+            "Install it with: pip install 'py-cosci[analysis]'"
+        )
+
+
+def _row_ids(indptr: "np.ndarray") -> "np.ndarray":
+    return np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+
+def _select(rows: Rows, selection: "np.ndarray") -> Rows:
+    """
+    CSR rows at the given positions.
+    """
+    indptr, indices, data = rows
+    starts, ends = indptr[selection], indptr[selection + 1]
+    lengths = ends - starts
+    positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(
+        lengths.sum()
+    )
+    new_indptr = np.concatenate([np.zeros(1, dtype=np.int64), np.cumsum(lengths)])
+    return new_indptr, indices[positions], data[positions]
+
+
+class IdeaClusterer:
+    """
+    Mini-batch spherical k-means over hashed TF-IDF vectors of ideas.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 8,
+        batch_size: int = 1024,
+        max_iter: int = 50,
+        vectorizer: Optional[HashingVectorizer] = None,
+        seed: int = 0,
+    ):
+        """
+        Initialize the clusterer.
+
+        Args:
+            n_clusters: Number of themes
+            batch_size: Ideas per centroid update
+            max_iter: Mini-batch updates made by ``fit``
+            vectorizer: Text vectorizer; defaults to 2**16 hashed features
+            seed: Random seed for initialization and batch sampling
+        """
+        _require_numpy()
+        if n_clusters < 1:
+            raise CosciError(f"n_clusters must be at least 1, got {n_clusters}")
+
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.max_iter = max_iter
+        self.vectorizer = vectorizer or HashingVectorizer(n_features=2**16)
+
+        self.centroids: Optional["np.ndarray"] = None
+        self._counts = np.zeros(n_clusters, dtype=np.float64)
+        self._df = np.zeros(self.vectorizer.n_features, dtype=np.int64)
+        self._documents = 0
+        self._rng = np.random.RandomState(seed)
+
+    def _vectorize(self, ideas: Sequence[Idea], update_df: bool) -> Rows:
+        """
+        L2-normalized TF-IDF rows of ideas.
+        """
+        indptr, indices, data = self.vectorizer.transform_many(
+            [idea_text(idea) for idea in ideas]
+        )
+        if update_df:
+            self._df += np.bincount(indices, minlength=len(self._df))
+            self._documents += len(ideas)
+
+        idf = np.log((1 + self._documents) / (1 + self._df[indices])) + 1
+        data = data * idf.astype(np.float32)
+        rows = _row_ids(indptr)
+        norms = np.sqrt(np.bincount(rows, weights=data**2, minlength=len(ideas)))
+        norms[norms == 0] = 1.0
+        return indptr, indices, (data / norms[rows]).astype(np.float32)
+
+    def _similarities(self, rows: Rows) -> "np.ndarray":
+        """
+        Cosine similarity of each row to each centroid, shape (rows, k).
+        """
+        indptr, indices, data = rows
+        products = self.centroids[:, indices] * data
+        result = np.zeros((len(indptr) - 1, self.n_clusters), dtype=np.float32)
+        nonempty = np.diff(indptr) > 0
+        if nonempty.any():
+            starts = indptr[:-1][nonempty]
+            result[nonempty] = np.add.reduceat(products, starts, axis=1).T
+        return result
+
+    def _initialize(self, rows: Rows):
+        """
+        Pick initial centroids with spherical k-means++.
+        """
+        count = len(rows[0]) - 1
+        if count < self.n_clusters:
+            raise CosciError(
+                f"Need at least {self.n_clusters} ideas to initialize "
+                f"{self.n_clusters} clusters, got {count}"
+            )
+
+        indptr, indices, data = rows
+        row_ids = _row_ids(indptr)
+        self.centroids = np.zeros(
+            (self.n_clusters, self.vectorizer.n_features), dtype=np.float32
+        )
+
+        def place(cluster: int, row: int) -> "np.ndarray":
+            start, end = indptr[row], indptr[row + 1]
+            self.centroids[cluster, indices[start:end]] = data[start:end]
+            similarity = self.centroids[cluster, indices] * data
+            return 1 - np.bincount(row_ids, weights=similarity, minlength=count)
+
+        chosen = [self._rng.randint(count)]
+        distance = place(0, chosen[0])
+        for cluster in range(1, self.n_clusters):
+            weights = np.clip(distance, 0, None)
+            weights[chosen] = 0
+            total = weights.sum()
+            if total > 0:
+                candidate = self._rng.choice(count, p=weights / total)
+            else:
+                candidate = self._rng.choice(np.setdiff1d(np.arange(count), chosen))
+            chosen.append(candidate)
+            distance = np.minimum(distance, place(cluster, candidate))
+
+    def _update(self, rows: Rows):
+        """
+        Move centroids towards the mean of their assigned rows.
+
+        Each centroid is the running mean of every row ever assigned to
+        it, renormalized to unit length.
+        """
+        labels = self._similarities(rows).argmax(axis=1)
+        indptr, indices, data = rows
+
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, (labels[_row_ids(indptr)], indices), data)
+        assigned = np.bincount(labels, minlength=self.n_clusters)
+
+        updated = assigned > 0
+        previous = self._counts[updated][:, None]
+        self.centroids[updated] = (
+            self.centroids[updated] * previous + sums[updated]
+        ) / (previous + assigned[updated][:, None])
+        self._counts += assigned
+
+        norms = np.linalg.norm(self.centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.centroids /= norms
+
+    def fit(self, ideas: Sequence[Idea]) -> "IdeaClusterer":
+        """
+        Cluster ideas from scratch.
+
+        Returns:
+            The clusterer
+        """
+        ideas = list(ideas)
+        self.centroids = None
+        self._counts[:] = 0
+        self._df[:] = 0
+        self._documents = 0
+
+        rows = self._vectorize(ideas, update_df=True)
+        count = len(ideas)
+        size = min(self.batch_size, count)
+        self._initialize(_select(rows, self._rng.choice(count, size, replace=False)))
+        for _ in range(self.max_iter):
+            self._update(_select(rows, self._rng.choice(count, size, replace=False)))
+        return self
+
+    def partial_fit(self, ideas: Sequence[Idea]) -> "IdeaClusterer":
+        """
+        Update the clusters with new ideas.
+
+        The first call initializes the centroids and needs at least
+        ``n_clusters`` ideas.
+
+        Returns:
+            The clusterer
+        """
+        ideas = list(ideas)
+        if not ideas:
+            return self
+        rows = self._vectorize(ideas, update_df=True)
+        if self.centroids is None:
+            self._initialize(rows)
+        for start in range(0, len(ideas), self.batch_size):
+            stop = min(start + self.batch_size, len(ideas))
+            self._update(_select(rows, np.arange(start, stop)))
+        return self
+
+    def _check_fitted(self):
+        if self.centroids is None:
+            raise CosciError("IdeaClusterer is not fitted; call fit() first")
+
+    def predict(self, ideas: Sequence[Idea]) -> "np.ndarray":
+        """
+        Cluster index of each idea.
+        """
+        self._check_fitted()
+        ideas = list(ideas)
+        if not ideas:
+            return np.empty(0, dtype=np.int64)
+        return self._similarities(self._vectorize(ideas, update_df=False)).argmax(
+            axis=1
+        )
+
+    def summarize(self, ideas: Sequence[Idea], titles: int = 3) -> List[Dict[str, Any]]:
+        """
+        Describe the clusters of ideas, largest first.
+
+        Args:
+            ideas: Ideas to assign to the fitted clusters
+            titles: Representative titles per cluster
+
+        Returns:
+            One entry per non-empty cluster with "cluster", "size",
+            "titles" (ideas closest to the centroid first), "idea_ids"
+            and "elo" statistics (count, mean, min, max; None without
+            rated ideas)
+        """
+        self._check_fitted()
+        ideas = list(ideas)
+        if not ideas:
+            return []
+
+        similarities = self._similarities(self._vectorize(ideas, update_df=False))
+        labels = similarities.argmax(axis=1)
+        closeness = similarities[np.arange(len(ideas)), labels]
+
+        summaries = []
+        for cluster in range(self.n_clusters):
+            members = np.flatnonzero(labels == cluster)
+            if not len(members):
+                continue
+            members = members[np.argsort(-closeness[members], kind="stable")]
+
+            elo = [
+                ideas[i].attributes.get("eloRating")
+                for i in members.tolist()
+                if isinstance(ideas[i].attributes.get("eloRating"), (int, float))
+            ]
+            summaries.append(
+                {
+                    "cluster": cluster,
+                    "size": len(members),
+                    "titles": [ideas[i].title for i in members[:titles].tolist()],
+                    "idea_ids": [ideas[i].idea_id for i in members.tolist()],
+                    "elo": {
+                        "count": len(elo),
+                        "mean": sum(elo) / len(elo) if elo else None,
+                        "min": min(elo) if elo else None,
+                        "max": max(elo) if elo else None,
+                    },
+                }
+            )
+        summaries.sort(key=lambda summary: summary["size"], reverse=True)
+        return summaries
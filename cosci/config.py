@@ -2,9 +2,9 @@
 Configuration management for Cosci SDK.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import yaml
 
@@ -24,14 +24,46 @@ class Config:
     location: str = "global"
     collection: str = "default_collection"
 
+    # Authentication settings
+    token_refresh_margin: int = 300
+    background_token_refresh: bool = False
+    token_cache_path: Optional[str] = None
+    additional_credentials: List[str] = field(default_factory=list)
+    credential_strategy: str = "round_robin"
+    credential_cooldown: int = 60
+
     # Logging settings
     log_level: str = "INFO"
     log_file: Optional[str] = None
+    log_async: bool = False
+    log_format: str = "text"
+    log_max_bytes: int = 0
+    log_backup_count: int = 0
+    log_sample_rates: Dict[str, float] = field(default_factory=dict)
+
+    # Tracing settings
+    tracing_exporter: str = "none"
+
+    # Metrics export settings
+    metrics_port: Optional[int] = None
+    metrics_textfile: Optional[str] = None
+    metrics_interval: int = 15
 
     # Operation settings
     timeout: int = 300
     min_ideas: int = 1
     poll_interval: int = 5
+    init_mode: str = "eager"
+
+    # Connection settings
+    base_url: Optional[str] = None
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    warmup_connections: int = 0
+    transport: str = "requests"
+    compression: bool = True
 
     @classmethod
     def from_yaml(cls, path: str = "config.yaml") -> "Config":
@@ -73,6 +105,9 @@ class Config:
         if not gc.get("credentials_path"):
             raise CosciError("Missing 'credentials_path' in config")
 
+        conn = data.get("connection") or {}
+        auth = data.get("auth") or {}
+
         # Create config object
         return cls(
             project_id=gc["project_id"],
@@ -80,11 +115,35 @@ class Config:
             credentials_path=gc["credentials_path"],
             location=gc.get("location", "global"),
             collection=gc.get("collection", "default_collection"),
+            token_refresh_margin=auth.get("token_refresh_margin", 300),
+            background_token_refresh=auth.get("background_refresh", False),
+            token_cache_path=auth.get("token_cache"),
+            additional_credentials=auth.get("additional_credentials") or [],
+            credential_strategy=auth.get("credential_strategy", "round_robin"),
+            credential_cooldown=auth.get("credential_cooldown", 60),
             log_level=data.get("logging", {}).get("level", "INFO"),
             log_file=data.get("logging", {}).get("file"),
+            log_async=data.get("logging", {}).get("async", False),
+            log_format=data.get("logging", {}).get("format", "text"),
+            log_max_bytes=data.get("logging", {}).get("max_bytes", 0),
+            log_backup_count=data.get("logging", {}).get("backup_count", 0),
+            log_sample_rates=data.get("logging", {}).get("sample_rates") or {},
+            tracing_exporter=data.get("tracing", {}).get("exporter", "none"),
+            metrics_port=data.get("metrics", {}).get("port"),
+            metrics_textfile=data.get("metrics", {}).get("textfile"),
+            metrics_interval=data.get("metrics", {}).get("interval", 15),
             timeout=data.get("settings", {}).get("timeout", 300),
             min_ideas=data.get("settings", {}).get("min_ideas", 1),
             poll_interval=data.get("settings", {}).get("poll_interval", 5),
+            init_mode=data.get("settings", {}).get("init_mode", "eager"),
+            base_url=conn.get("base_url"),
+            pool_connections=conn.get("pool_connections", 10),
+            pool_maxsize=conn.get("pool_maxsize", 10),
+            pool_block=conn.get("pool_block", False),
+            keep_alive=conn.get("keep_alive", True),
+            warmup_connections=conn.get("warmup_connections", 0),
+            transport=conn.get("transport", "requests"),
+            compression=conn.get("compression", True),
         )
 
     def validate(self):
@@ -94,12 +153,23 @@ class Config:
         Raises:
             CosciError: If configuration is invalid
         """
-        # Check credentials file exists
-        if not Path(self.credentials_path).exists():
+        # Check credentials files exist
+        for credentials_path in [self.credentials_path, *self.additional_credentials]:
+            if not Path(credentials_path).exists():
+                raise CosciError(
+                    f"Credentials file not found: {credentials_path}\n"
+                    "Please ensure the service account JSON file exists"
+                )
+
+        # Validate credential pool settings
+        valid_strategies = ["round_robin", "least_loaded"]
+        if self.credential_strategy not in valid_strategies:
             raise CosciError(
-                f"Credentials file not found: {self.credentials_path}\n"
-                "Please ensure the service account JSON file exists"
+                f"Invalid credential strategy: {self.credential_strategy}\n"
+                f"Must be one of: {', '.join(valid_strategies)}"
             )
+        if self.credential_cooldown < 0:
+            raise CosciError("credential_cooldown cannot be negative")
 
         # Validate log level
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -109,6 +179,21 @@ class Config:
                 f"Must be one of: {', '.join(valid_levels)}"
             )
 
+        # Validate log format and sampling
+        valid_formats = ["text", "json"]
+        if self.log_format not in valid_formats:
+            raise CosciError(
+                f"Invalid log format: {self.log_format}\n"
+                f"Must be one of: {', '.join(valid_formats)}"
+            )
+        for event_type, rate in self.log_sample_rates.items():
+            if not 0 <= rate <= 1:
+                raise CosciError(
+                    f"Sample rate for {event_type} must be between 0 and 1"
+                )
+        if self.log_max_bytes < 0 or self.log_backup_count < 0:
+            raise CosciError("log max_bytes and backup_count cannot be negative")
+
         # Validate numeric values
         if self.timeout <= 0:
             raise CosciError("Timeout must be positive")
@@ -116,3 +201,42 @@ class Config:
             raise CosciError("min_ideas must be positive")
         if self.poll_interval <= 0:
             raise CosciError("poll_interval must be positive")
+        if self.pool_connections <= 0:
+            raise CosciError("pool_connections must be positive")
+        if self.pool_maxsize <= 0:
+            raise CosciError("pool_maxsize must be positive")
+        if self.warmup_connections < 0:
+            raise CosciError("warmup_connections cannot be negative")
+        if not 0 <= self.token_refresh_margin < 3600:
+            raise CosciError(
+                "token_refresh_margin must be between 0 and 3599 seconds "
+                "(access tokens are valid for one hour)"
+            )
+        if self.metrics_port is not None and not 0 <= self.metrics_port <= 65535:
+            raise CosciError("metrics port must be between 0 and 65535")
+        if self.metrics_interval <= 0:
+            raise CosciError("metrics interval must be positive")
+
+        # Validate initialization mode
+        valid_init_modes = ["eager", "lazy", "background"]
+        if self.init_mode not in valid_init_modes:
+            raise CosciError(
+                f"Invalid init_mode: {self.init_mode}\n"
+                f"Must be one of: {', '.join(valid_init_modes)}"
+            )
+
+        # Validate span exporter
+        valid_exporters = ["none", "memory", "log", "otel"]
+        if self.tracing_exporter not in valid_exporters:
+            raise CosciError(
+                f"Invalid tracing exporter: {self.tracing_exporter}\n"
+                f"Must be one of: {', '.join(valid_exporters)}"
+            )
+
+        # Validate transport
+        valid_transports = ["requests", "http2"]
+        if self.transport not in valid_transports:
+            raise CosciError(
+                f"Invalid transport: {self.transport}\n"
+                f"Must be one of: {', '.join(valid_transports)}"
+            )
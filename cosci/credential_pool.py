@@ -0,0 +1,316 @@
+"""
+Credential Pool Module for Cosci SDK
+====================================
+Shards API quota across several service accounts.
+
+A pool wraps one Authenticator per service account and hands a credential
+to each request attempt, either round-robin or to the least-loaded member.
+Credentials that get rate limited (429) are ejected for a cooldown period,
+so traffic shifts to the principals that still have quota.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from cosci.auth import Authenticator
+from cosci.exceptions import AuthenticationError
+from cosci.logger import LogIcons, LogLevel, get_logger
+
+
+class _PoolMember:
+    """
+    Bookkeeping for one credential in the pool.
+    """
+
+    def __init__(self, authenticator: Authenticator, window: int):
+        self.authenticator = authenticator
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.ejected_until = 0.0
+        self.recent: Deque[bool] = deque(maxlen=window)
+
+    def throttle_rate(self) -> float:
+        """
+        Share of recent responses that were 429s.
+        """
+        if not self.recent:
+            return 0.0
+        return sum(self.recent) / len(self.recent)
+
+
+class CredentialPool:
+    """
+    Pool of service-account credentials used by a single APIClient.
+
+    The pool exposes the same ``get_headers``/``get_token`` interface as
+    ``Authenticator``. APIClient additionally uses ``checkout``/``release``
+    to attribute each attempt to a credential and ``eject`` on 429 responses.
+    """
+
+    STRATEGIES = ("round_robin", "least_loaded")
+    DEFAULT_COOLDOWN = 60
+    RATE_WINDOW = 100
+
+    def __init__(
+        self,
+        authenticators: List[Authenticator],
+        strategy: str = "round_robin",
+        cooldown: int = DEFAULT_COOLDOWN,
+        logger_name: str = "CredentialPool",
+        log_level: LogLevel = LogLevel.INFO,
+    ):
+        """
+        Initialize the credential pool.
+
+        Args:
+            authenticators: One authenticator per service account
+            strategy: "round_robin" or "least_loaded"
+            cooldown: Default seconds a throttled credential stays ejected
+            logger_name: Name for logger instance
+            log_level: Logging level
+        """
+        if not authenticators:
+            raise AuthenticationError("Credential pool needs at least one credential")
+        if strategy not in self.STRATEGIES:
+            raise AuthenticationError(
+                f"Invalid credential strategy: {strategy}\n"
+                f"Must be one of: {', '.join(self.STRATEGIES)}"
+            )
+
+        self.logger = get_logger(logger_name, log_level)
+        self.strategy = strategy
+        self.cooldown = cooldown
+
+        self._members = [_PoolMember(a, self.RATE_WINDOW) for a in authenticators]
+        self._by_auth = {id(m.authenticator): m for m in self._members}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_files(
+        cls,
+        service_account_paths: List[str],
+        project_id: Optional[str] = None,
+        strategy: str = "round_robin",
+        cooldown: int = DEFAULT_COOLDOWN,
+        log_level: LogLevel = LogLevel.INFO,
+        **auth_kwargs,
+    ) -> "CredentialPool":
+        """
+        Create a pool from service account JSON files.
+
+        Args:
+            service_account_paths: Paths to service account files
+            project_id: Google Cloud project ID
+            strategy: "round_robin" or "least_loaded"
+            cooldown: Default seconds a throttled credential stays ejected
+            log_level: Logging level
+            **auth_kwargs: Additional arguments for each Authenticator
+
+        Returns:
+            Unauthenticated credential pool
+        """
+        authenticators = [
+            Authenticator(
+                path,
+                project_id,
+                logger_name=f"Auth[{i}]",
+                log_level=log_level,
+                **auth_kwargs,
+            )
+            for i, path in enumerate(service_account_paths)
+        ]
+        return cls(authenticators, strategy, cooldown, log_level=log_level)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    @property
+    def authenticators(self) -> List[Authenticator]:
+        """
+        Authenticators in the pool.
+        """
+        return [m.authenticator for m in self._members]
+
+    def authenticate(self) -> str:
+        """
+        Authenticate every credential in the pool.
+
+        Returns:
+            Access token of the first credential
+        """
+        self.logger.process_start(f"Authenticating {len(self)} credentials")
+        tokens = [m.authenticator.authenticate() for m in self._members]
+        self.logger.process_complete(f"Authenticating {len(self)} credentials")
+        return tokens[0]
+
+    def checkout(self) -> Authenticator:
+        """
+        Pick a credential for one request attempt.
+
+        Ejected credentials are skipped while any other credential is
+        available; if all are ejected, the one returning soonest is used.
+
+        Returns:
+            Authenticator to use; must be passed back to release()
+        """
+        with self._lock:
+            member = self._select(time.time())
+            member.in_flight += 1
+            member.requests += 1
+            return member.authenticator
+
+    def release(self, authenticator: Authenticator, status_code: Optional[int] = None):
+        """
+        Return a credential after an attempt and record its outcome.
+
+        Args:
+            authenticator: Credential from checkout()
+            status_code: HTTP status of the attempt, if a response arrived
+        """
+        with self._lock:
+            member = self._by_auth[id(authenticator)]
+            member.in_flight = max(0, member.in_flight - 1)
+            if status_code is not None:
+                member.recent.append(status_code == 429)
+
+    def eject(self, authenticator: Authenticator, retry_after: Optional[float] = None):
+        """
+        Take a throttled credential out of rotation.
+
+        Args:
+            authenticator: Credential that received a 429
+            retry_after: Server-provided wait; defaults to the pool cooldown
+        """
+        duration = max(retry_after or 0, self.cooldown)
+        with self._lock:
+            member = self._by_auth[id(authenticator)]
+            member.throttled += 1
+            member.ejected_until = time.time() + duration
+
+        self.logger.warning(
+            f"Credential {authenticator._service_account_email} throttled, "
+            f"ejected for {duration:.0f}s",
+            LogIcons.WARNING,
+        )
+
+    def wait_time(self) -> float:
+        """
+        Seconds until at least one credential is back in rotation.
+        """
+        now = time.time()
+        with self._lock:
+            return max(0.0, min(m.ejected_until for m in self._members) - now)
+
+    def _select(self, now: float) -> _PoolMember:
+        available = [m for m in self._members if m.ejected_until <= now]
+        if not available:
+            return min(self._members, key=lambda m: m.ejected_until)
+
+        if self.strategy == "least_loaded":
+            return min(
+                available,
+                key=lambda m: (m.in_flight, m.throttle_rate(), m.requests),
+            )
+
+        # Round robin over the credentials that are not ejected
+        count = len(self._members)
+        for offset in range(count):
+            member = self._members[(self._next + offset) % count]
+            if member.ejected_until <= now:
+                self._next = (self._next + offset + 1) % count
+                return member
+        return available[0]
+
+    def get_token(self) -> str:
+        """
+        Get an access token from the next credential.
+        """
+        with self._lock:
+            member = self._select(time.time())
+        return member.authenticator.get_token()
+
+    def get_headers(self) -> Dict[str, str]:
+        """
+        Get HTTP headers with authentication from the next credential.
+        """
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.get_token()}",
+        }
+
+    def _refresh_token(self):
+        """
+        Refresh every credential's access token.
+        """
+        for member in self._members:
+            member.authenticator._refresh_token()
+
+    def use_session(
+        self, session, timeout: Union[float, Tuple[float, float], None] = None
+    ):
+        """
+        Send token refreshes for all credentials through a shared session.
+        """
+        for member in self._members:
+            member.authenticator.use_session(session, timeout)
+
+    def is_authenticated(self) -> bool:
+        """
+        Check if every credential is authenticated.
+        """
+        return all(m.authenticator.is_authenticated() for m in self._members)
+
+    def get_refresh_stats(self) -> Dict[str, Any]:
+        """
+        Get token refresh statistics summed over all credentials.
+        """
+        totals: Dict[str, Any] = {}
+        for member in self._members:
+            for key, value in member.authenticator.get_refresh_stats().items():
+                if key != "avg_refresh_time":
+                    totals[key] = totals.get(key, 0) + value
+
+        attempts = totals["refresh_count"] + totals["refresh_failures"]
+        totals["last_refresh_time"] = max(
+            m.authenticator.stats["last_refresh_time"] for m in self._members
+        )
+        totals["avg_refresh_time"] = (
+            totals["refresh_time"] / attempts if attempts else 0.0
+        )
+        return totals
+
+    def get_pool_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-credential load and throttling statistics.
+        """
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    "service_account": m.authenticator._service_account_email,
+                    "requests": m.requests,
+                    "in_flight": m.in_flight,
+                    "throttled": m.throttled,
+                    "throttle_rate": m.throttle_rate(),
+                    "ejected_for": max(0.0, m.ejected_until - now),
+                }
+                for m in self._members
+            ]
+
+    def stop_background_refresh(self):
+        """
+        Stop background refreshers of all credentials.
+        """
+        for member in self._members:
+            member.authenticator.stop_background_refresh()
+
+    def revoke(self):
+        """
+        Clear authentication state of all credentials.
+        """
+        for member in self._members:
+            member.authenticator.revoke()
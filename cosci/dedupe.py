@@ -0,0 +1,311 @@
+"""
+Near-Duplicate Detection Module for Cosci SDK
+=============================================
+Finds near-identical ideas with MinHash signatures and LSH banding.
+
+Each idea's title and description is split into word shingles and
+summarized by a MinHash signature, whose agreement rate between two
+ideas estimates the Jaccard similarity of their shingle sets. Signatures
+are cut into bands; only ideas sharing a band bucket are compared, so
+the work grows roughly linearly with the number of ideas instead of with
+the number of pairs. Matching pairs are grouped with union-find.
+
+Requires NumPy: pip install 'py-cosci[analysis]'
+
+Example:
+    detector = DuplicateDetector(threshold=0.8)
+    for cluster in detector.clusters(ideas):
+        print([idea.title for idea in cluster])
+
+    # Across many exported sessions, holding only signatures in memory
+    groups = detector.cluster_exports(Path("out/ideas").glob("ideas_*.json"))
+"""
+
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from cosci.exceptions import CosciError
+from cosci.index import tokenize
+from cosci.models import Idea
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Ideas signed per vectorized chunk, bounding temporary memory
+_CHUNK = 2000
+
+# Buckets larger than this are compared against their first member only
+_MAX_BUCKET = 100
+
+
+def _require_numpy():
+    if np is None:
+        raise CosciError(
+            "Duplicate detection requires NumPy.\n"
+            "Install it with: pip install 'py-cosci[analysis]'"
+        )
+
+
+def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Bands and rows per band for an LSH threshold just below ``threshold``.
+
+    Two ideas with Jaccard similarity s share a bucket in at least one of
+    b bands of r rows with probability 1 - (1 - s^r)^b, which rises
+    steeply around (1/b)^(1/r). Candidates are verified afterwards, so
+    erring low only costs comparisons while erring high misses duplicates.
+    """
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    below = [br for br in options if (1 / br[0]) ** (1 / br[1]) <= threshold]
+    if not below:
+        return options[-1]
+    return max(below, key=lambda br: (1 / br[0]) ** (1 / br[1]))
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class DuplicateDetector:
+    """
+    MinHash/LSH near-duplicate detector.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            threshold: Estimated Jaccard similarity of word shingles at
+                which two ideas count as duplicates
+            num_perm: Signature length; longer is more accurate and slower
+            shingle_size: Words per shingle
+            seed: Seed of the hash permutations
+        """
+        _require_numpy()
+        if not 0 < threshold <= 1:
+            raise CosciError(f"threshold must be in (0, 1], got {threshold}")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+
+        # Multiply-shift hashing: h(x) = (a * x + b) mod 2**64 >> 32, odd a
+        rng = np.random.RandomState(seed)
+        high = np.iinfo(np.int64).max
+        self._a = (rng.randint(0, high, size=num_perm, dtype=np.uint64) * 2 + 1)[
+            :, None
+        ]
+        self._b = rng.randint(0, high, size=num_perm, dtype=np.uint64)[:, None]
+
+    def shingles(self, text: str) -> List[int]:
+        """
+        Hashed word shingles of a text.
+        """
+        words = tokenize(text)
+        size = self.shingle_size
+        if len(words) <= size:
+            grams = [" ".join(words)] if words else []
+        else:
+            grams = [
+                " ".join(words[i : i + size]) for i in range(len(words) - size + 1)
+            ]
+        return [zlib.crc32(gram.encode("utf-8")) for gram in set(grams)]
+
+    def signatures(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        MinHash signatures of texts.
+
+        Returns:
+            uint32 array of shape (len(texts), num_perm); texts without
+            words get an all-ones row that matches nothing
+        """
+        result = np.full((len(texts), self.num_perm), 0xFFFFFFFF, dtype=np.uint32)
+        for start in range(0, len(texts), _CHUNK):
+            chunk = [self.shingles(text) for text in texts[start : start + _CHUNK]]
+            present = [i for i, shingles in enumerate(chunk) if shingles]
+            if not present:
+                continue
+
+            hashes = np.array([h for i in present for h in chunk[i]], dtype=np.uint64)
+            offsets = np.cumsum([0] + [len(chunk[i]) for i in present[:-1]])
+            values = self._a * hashes[None, :] + self._b
+            values >>= np.uint64(32)
+            minimums = np.minimum.reduceat(values, offsets, axis=1)
+            result[start + np.array(present)] = minimums.T.astype(np.uint32)
+        return result
+
+    def duplicate_pairs(self, signatures: "np.ndarray") -> "np.ndarray":
+        """
+        Index pairs whose estimated similarity reaches the threshold.
+
+        Returns:
+            Array of shape (pairs, 2) with i < j
+        """
+        empty = (signatures == 0xFFFFFFFF).all(axis=1)
+        candidates = set()
+        for band in range(self.bands):
+            columns = signatures[:, band * self.rows : (band + 1) * self.rows]
+            buckets: Dict[bytes, List[int]] = {}
+            for i, row in enumerate(columns):
+                if not empty[i]:
+                    buckets.setdefault(row.tobytes(), []).append(i)
+
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                if len(members) > _MAX_BUCKET:
+                    first = members[0]
+                    candidates.update((first, other) for other in members[1:])
+                    continue
+                for x, i in enumerate(members):
+                    for j in members[x + 1 :]:
+                        candidates.add((i, j))
+
+        if not candidates:
+            return np.empty((0, 2), dtype=np.int64)
+
+        pairs = np.array(sorted(candidates), dtype=np.int64)
+        agreement = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        return pairs[agreement >= self.threshold]
+
+    def cluster_indices(self, signatures: "np.ndarray") -> List[List[int]]:
+        """
+        Groups of two or more duplicate rows, each in ascending order.
+        """
+        union_find = _UnionFind(len(signatures))
+        for i, j in self.duplicate_pairs(signatures).tolist():
+            union_find.union(i, j)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(signatures)):
+            groups.setdefault(union_find.find(i), []).append(i)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def clusters(self, ideas: Sequence[Idea]) -> List[List[Idea]]:
+        """
+        Groups of near-duplicate ideas, each in input order.
+        """
+        ideas = list(ideas)
+        texts = [f"{idea.title or ''}\n{idea.description or ''}" for idea in ideas]
+        return [
+            [ideas[i] for i in members]
+            for members in self.cluster_indices(self.signatures(texts))
+        ]
+
+    def cluster_exports(
+        self, sessions: Iterable[Union[str, Dict[str, Any]]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Cluster near-duplicate ideas across exported sessions.
+
+        Sessions are read one at a time and only signatures and a short
+        reference per idea are kept, so the corpus never has to fit in
+        memory as ideas.
+
+        Args:
+            sessions: Export file paths or already loaded session data
+
+        Returns:
+            Groups of {"session_id", "idea_id", "title", "eloRating"}
+            references, largest group first
+        """
+        references: List[Dict[str, Any]] = []
+        blocks = []
+        for source in sessions:
+            if isinstance(source, (str, Path)):
+                with open(source, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                data = source
+
+            ideas = data.get("ideas", [])
+            texts = []
+            for idea in ideas:
+                references.append(
+                    {
+                        "session_id": idea.get("session_id") or data.get("session_id"),
+                        "idea_id": idea.get("idea_id"),
+                        "title": idea.get("title"),
+                        "eloRating": (idea.get("attributes") or {}).get("eloRating"),
+                    }
+                )
+                texts.append(
+                    f"{idea.get('title') or ''}\n{idea.get('description') or ''}"
+                )
+            if texts:
+                blocks.append(self.signatures(texts))
+
+        if not blocks:
+            return []
+        groups = self.cluster_indices(np.concatenate(blocks))
+        groups.sort(key=len, reverse=True)
+        return [[references[i] for i in members] for members in groups]
+
+
+def dedupe_ideas(
+    ideas: Sequence[Idea],
+    threshold: float = 0.8,
+    keep: str = "best",
+    detector: Optional[DuplicateDetector] = None,
+) -> List[Idea]:
+    """
+    Drop near-duplicate ideas, keeping one per group.
+
+    Args:
+        ideas: Ideas to deduplicate
+        threshold: Estimated Jaccard similarity counting as duplicate
+        keep: "best" keeps the highest-Elo idea of each group, "first"
+            the earliest
+        detector: Detector to use instead of a default one
+
+    Returns:
+        Remaining ideas in input order
+    """
+    if keep not in ("best", "first"):
+        raise CosciError(f"Invalid keep: {keep}\nMust be one of: best, first")
+
+    ideas = list(ideas)
+    detector = detector or DuplicateDetector(threshold=threshold)
+    positions = {id(idea): i for i, idea in enumerate(ideas)}
+
+    dropped = set()
+    for cluster in detector.clusters(ideas):
+        if keep == "best":
+            kept = max(
+                cluster,
+                key=lambda idea: (
+                    idea.attributes.get("eloRating") is not None,
+                    idea.attributes.get("eloRating") or 0,
+                    -positions[id(idea)],
+                ),
+            )
+        else:
+            kept = cluster[0]
+        dropped.update(positions[id(idea)] for idea in cluster if idea is not kept)
+
+    return [idea for i, idea in enumerate(ideas) if i not in dropped]
@@ -59,3 +59,35 @@ class PollingError(CosciError):
     """
 
     pass
+
+
+class TransportError(CosciError):
+    """
+    Low-level HTTP transport errors.
+    """
+
+    pass
+
+
+class TransportTimeout(TransportError):
+    """
+    HTTP request timed out.
+    """
+
+    pass
+
+
+class TransportConnectionError(TransportError):
+    """
+    HTTP connection could not be established or was dropped.
+    """
+
+    pass
+
+
+class ValidationError(CosciError):
+    """
+    Invalid data passed to a model constructor.
+    """
+
+    pass
@@ -0,0 +1,301 @@
+"""
+Keyword Index Module for Cosci SDK
+==================================
+Inverted index over idea titles and descriptions.
+
+Ideas are tokenized once when added; keyword and phrase queries are then
+answered from posting lists instead of scanning every idea's text.
+
+Query syntax:
+    graph neural            both terms (AND is implicit)
+    "graph neural network"  exact phrase
+    retrieval OR reranking  either side
+    -survey, NOT survey     exclude a term or phrase
+
+Example:
+    index = IdeaIndex(stemming=True)
+    index.add(ideas)
+    matches = index.search('"knowledge graph" OR retrieval -survey')
+"""
+
+import functools
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from cosci.models import Idea
+
+_TOKEN = re.compile(r"\w+")
+
+# A quoted phrase (optionally negated) or a bare word
+_QUERY_PART = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+# Longest suffixes first; a suffix is only removed if three letters remain
+_SUFFIXES = (
+    "ational",
+    "ization",
+    "fulness",
+    "iveness",
+    "ations",
+    "ingly",
+    "ation",
+    "ement",
+    "ments",
+    "ities",
+    "ness",
+    "ment",
+    "able",
+    "ible",
+    "ings",
+    "ing",
+    "ies",
+    "ied",
+    "ers",
+    "est",
+    "ed",
+    "er",
+    "ly",
+    "es",
+    "s",
+)
+
+
+@functools.lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """
+    Strip a common English suffix ("networks" -> "network").
+
+    A light suffix stripper rather than a full Porter stemmer; it only
+    needs to map inflections of a word to the same key.
+    """
+    if len(token) <= 3 or token.endswith("ss"):
+        return token
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            base = token[: -len(suffix)]
+            return base + "y" if suffix in ("ies", "ied") else base
+    return token
+
+
+def tokenize(text: str, stemming: bool = False) -> List[str]:
+    """
+    Lowercased word tokens of a text, optionally stemmed.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if stemming:
+        tokens = [stem(token) for token in tokens]
+    return tokens
+
+
+class IdeaIndex:
+    """
+    Inverted index of ideas, with incremental updates.
+
+    Posting lists map each term to the ideas containing it; each idea's
+    token stream is kept for phrase matching.
+
+    Re-adding an idea with a known ID replaces its entry, so the index can
+    be fed every polling result as new ideas arrive.
+    """
+
+    def __init__(self, ideas: Optional[Iterable[Idea]] = None, stemming: bool = False):
+        """
+        Initialize the index.
+
+        Args:
+            ideas: Ideas to index
+            stemming: Match inflections of query terms ("network" matches
+                "networks")
+        """
+        self.stemming = stemming
+
+        self._postings: Dict[str, Set[int]] = {}
+        self._tokens: Dict[int, Tuple[Optional[str], ...]] = {}
+        self._ideas: Dict[int, Idea] = {}
+        self._doc_ids: Dict[str, int] = {}
+        self._next_doc = 0
+        self._lock = threading.RLock()
+
+        if ideas is not None:
+            self.add(ideas)
+
+    def __len__(self) -> int:
+        return len(self._ideas)
+
+    def __contains__(self, idea_id: str) -> bool:
+        return idea_id in self._doc_ids
+
+    def __repr__(self) -> str:
+        return f"IdeaIndex(ideas={len(self)}, terms={len(self._postings)})"
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Lowercased word tokens of a text, stemmed if enabled.
+        """
+        return tokenize(text, self.stemming)
+
+    def add(self, ideas: Iterable[Idea]) -> int:
+        """
+        Index ideas, replacing earlier entries with the same ID.
+
+        Returns:
+            Number of ideas that were not indexed before
+        """
+        added = 0
+        with self._lock:
+            for idea in ideas:
+                if idea.idea_id in self._doc_ids:
+                    self._remove_doc(self._doc_ids[idea.idea_id])
+                else:
+                    added += 1
+                self._add_doc(idea)
+        return added
+
+    def remove(self, idea_id: str) -> bool:
+        """
+        Remove an idea from the index.
+
+        Returns:
+            True if the idea was indexed
+        """
+        with self._lock:
+            doc = self._doc_ids.get(idea_id)
+            if doc is None:
+                return False
+            self._remove_doc(doc)
+            return True
+
+    def _add_doc(self, idea: Idea):
+        doc = self._next_doc
+        self._next_doc += 1
+
+        # Fields are one token stream separated by None, so phrases never
+        # span the end of the title and the start of the description
+        tokens = self.tokenize(idea.title or "")
+        tokens.append(None)
+        tokens += self.tokenize(idea.description or "")
+
+        postings = self._postings
+        for term in set(tokens):
+            if term is not None:
+                postings.setdefault(term, set()).add(doc)
+
+        self._ideas[doc] = idea
+        self._doc_ids[idea.idea_id] = doc
+        self._tokens[doc] = tuple(tokens)
+
+    def _remove_doc(self, doc: int):
+        for term in set(self._tokens.pop(doc)):
+            if term is None:
+                continue
+            postings = self._postings[term]
+            postings.discard(doc)
+            if not postings:
+                del self._postings[term]
+        idea = self._ideas.pop(doc)
+        del self._doc_ids[idea.idea_id]
+
+    def _phrase_docs(self, terms: Sequence[str]) -> Set[int]:
+        """
+        Documents containing the terms consecutively.
+        """
+        postings = [self._postings.get(term) for term in terms]
+        if not terms or any(p is None for p in postings):
+            return set()
+
+        # Intersect starting from the rarest term
+        docs = set(min(postings, key=len))
+        for p in postings:
+            docs.intersection_update(p)
+        if len(terms) == 1:
+            return docs
+
+        # Check word order in the candidates' token streams
+        phrase = tuple(terms)
+        length = len(phrase)
+        matches = set()
+        for doc in docs:
+            tokens = self._tokens[doc]
+            for start, token in enumerate(tokens):
+                if token == phrase[0] and tokens[start : start + length] == phrase:
+                    matches.add(doc)
+                    break
+        return matches
+
+    def _parse(self, query: str) -> List[Tuple[List[List[str]], List[List[str]]]]:
+        """
+        Parse a query into OR-groups of (required, excluded) phrases.
+        """
+        groups = []
+        required: List[List[str]] = []
+        excluded: List[List[str]] = []
+        negate = False
+        for minus, phrase, word in _QUERY_PART.findall(query):
+            if phrase or minus:
+                terms = self.tokenize(phrase)
+                if terms:
+                    (excluded if negate or minus else required).append(terms)
+                negate = False
+                continue
+            if word == "OR":
+                groups.append((required, excluded))
+                required, excluded = [], []
+                continue
+            if word == "NOT":
+                negate = True
+                continue
+            if word.startswith("-") and len(word) > 1:
+                negate, word = True, word[1:]
+            if word == "AND":
+                continue
+
+            terms = self.tokenize(word)
+            if terms:
+                (excluded if negate else required).append(terms)
+            negate = False
+        groups.append((required, excluded))
+        return [group for group in groups if group[0] or group[1]]
+
+    def _search_docs(self, query: str) -> Set[int]:
+        matches: Set[int] = set()
+        for required, excluded in self._parse(query):
+            if required:
+                phrase_sets = sorted(
+                    (self._phrase_docs(terms) for terms in required), key=len
+                )
+                docs = set(phrase_sets[0])
+                for other in phrase_sets[1:]:
+                    docs &= other
+            else:
+                docs = set(self._ideas)
+            for terms in excluded:
+                docs -= self._phrase_docs(terms)
+            matches |= docs
+        return matches
+
+    def search(self, query: str) -> List[Idea]:
+        """
+        Ideas matching a query, in the order they were indexed.
+        """
+        with self._lock:
+            docs = self._search_docs(query)
+            return [self._ideas[doc] for doc in sorted(docs)]
+
+    def match_ids(self, keywords: Sequence[str], match_all: bool = False) -> Set[str]:
+        """
+        IDs of ideas containing any (or all) of the keywords.
+
+        Each keyword is matched as a phrase, so "graph neural" must appear
+        as consecutive words.
+        """
+        with self._lock:
+            phrase_sets = [
+                self._phrase_docs(self.tokenize(keyword)) for keyword in keywords
+            ]
+            if not phrase_sets:
+                docs: Set[int] = set()
+            elif match_all:
+                docs = set.intersection(*phrase_sets)
+            else:
+                docs = set.union(*phrase_sets)
+            return {self._ideas[doc].idea_id for doc in docs}
@@ -4,10 +4,16 @@ Co-Scientist SDK Logger Module
 Professional logging system with colored output and multiple log levels.
 """
 
+import atexit
 import json
 import logging
+import queue
+import random
+import threading
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 # Use try-except for colorama to make it optional
 try:
@@ -41,6 +47,72 @@ class LogLevel(Enum):
     SUCCESS = 25  # Custom level between INFO and WARNING
 
 
+# Register custom SUCCESS level once
+logging.addLevelName(LogLevel.SUCCESS.value, "SUCCESS")
+
+# A message, or a callable building it only if the level is enabled
+Message = Union[str, Callable[[], str]]
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+
+    Every line has ``ts``, ``level``, ``logger`` and ``message``; records
+    from Logger.event() add ``event`` and their fields (e.g. endpoint,
+    status, latency_ms, attempt, session_id).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        event = getattr(record, "event", None)
+        if event:
+            entry["event"] = event
+        entry["message"] = record.getMessage()
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock handler formats every record on the calling thread to make it
+    picklable; records here never leave the process, so that work is skipped.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Listener per logger name, so reconfiguring a logger stops the old one
+_listeners: Dict[str, QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def shutdown_logging():
+    """
+    Stop all background log listeners, writing out queued records.
+
+    Registered with ``atexit``; safe to call more than once. Loggers that
+    were asynchronous stop emitting until they are configured again.
+    """
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(shutdown_logging)
+
+
 class LogIcons:
     """
     Unicode icons for different log types.
@@ -69,6 +141,8 @@ class Logger:
     Main logger class for Co-Scientist SDK.
     """
 
+    FORMATS = ("text", "json")
+
     def __init__(
         self,
         name: str = "Cosci",
@@ -76,81 +150,230 @@ class Logger:
         console_output: bool = True,
         file_output: Optional[str] = None,
         include_timestamp: bool = True,
+        async_output: bool = False,
+        log_format: str = "text",
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        sample_rates: Optional[Dict[str, float]] = None,
     ):
-        """Initialize the logger."""
+        """
+        Initialize the logger.
+
+        With ``async_output``, records are handed to a queue and formatted
+        and written by a background listener thread.
+
+        With ``log_format="json"``, each record is written as a JSON line
+        and banners and icons are left out. ``sample_rates`` maps event
+        types to the share of Logger.event() calls that are emitted.
+        ``max_bytes`` enables rotation of ``file_output`` with
+        ``backup_count`` old files kept.
+        """
         self.name = name
         self.logger = logging.getLogger(name)
+        self._indent_level = 0
+        self.configure(
+            level,
+            console_output=console_output,
+            file_output=file_output,
+            include_timestamp=include_timestamp,
+            async_output=async_output,
+            log_format=log_format,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            sample_rates=sample_rates,
+        )
+
+    def configure(
+        self,
+        level: LogLevel = LogLevel.INFO,
+        console_output: bool = True,
+        file_output: Optional[str] = None,
+        include_timestamp: bool = True,
+        async_output: bool = False,
+        log_format: str = "text",
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        sample_rates: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Replace the handlers and options of this logger.
 
-        # Register custom SUCCESS level
-        logging.addLevelName(25, "SUCCESS")
+        Takes the same options as the constructor. A background listener
+        from an earlier asynchronous configuration is stopped first, which
+        flushes its queued records.
+        """
+        if log_format not in self.FORMATS:
+            raise ValueError(
+                f"Invalid log format: {log_format}\n"
+                f"Must be one of: {', '.join(self.FORMATS)}"
+            )
+
+        self.structured = log_format == "json"
+        self.sample_rates = dict(sample_rates or {})
 
         # Set base level
         self.logger.setLevel(level.value)
         self.logger.propagate = False
         self.logger.handlers = []
 
+        with _listeners_lock:
+            old_listener = _listeners.pop(self.name, None)
+        if old_listener:
+            old_listener.stop()
+
+        handlers = []
+
         # Console handler
         if console_output:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(level.value)
 
-            if include_timestamp:
-                fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            if self.structured:
+                formatter = JsonFormatter()
             else:
-                fmt = "%(name)s - %(levelname)s - %(message)s"
+                if include_timestamp:
+                    fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                else:
+                    fmt = "%(name)s - %(levelname)s - %(message)s"
+                formatter = logging.Formatter(fmt, datefmt="%H:%M:%S")
 
-            formatter = logging.Formatter(fmt, datefmt="%H:%M:%S")
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
 
         # File handler
         if file_output:
-            file_handler = logging.FileHandler(file_output, mode="a", encoding="utf-8")
+            if max_bytes > 0:
+                file_handler = RotatingFileHandler(
+                    file_output,
+                    mode="a",
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
+                )
+            else:
+                file_handler = logging.FileHandler(
+                    file_output, mode="a", encoding="utf-8"
+                )
             file_handler.setLevel(level.value)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
+            if self.structured:
+                formatter = JsonFormatter()
+            else:
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                    datefmt="%Y-%m-%d %H:%M:%S",
+                )
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
 
-        self._indent_level = 0
+        if async_output and handlers:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            with _listeners_lock:
+                _listeners[self.name] = listener
+            self.logger.addHandler(_DeferredQueueHandler(log_queue))
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        self._handlers = list(self.logger.handlers)
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Check whether messages at the given level would be emitted.
+        """
+        return self.logger.isEnabledFor(level.value)
+
+    def _log(self, level: int, message: Message, icon: str = ""):
+        """
+        Emit a message, building it only if the level is enabled.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if callable(message):
+            message = message()
+        if icon and not self.structured:
+            message = f"{icon} {message}"
+        self.logger.log(level, message)
+
+    def event(
+        self,
+        event_type: str,
+        message: Message = "",
+        level: LogLevel = LogLevel.INFO,
+        icon: str = "",
+        **fields,
+    ):
+        """
+        Log a typed event with structured fields.
+
+        In text mode only the message is written; in JSON mode the event
+        type and fields are written as keys. Events are sampled according
+        to ``sample_rates``.
 
-    def debug(self, message: str, icon: str = ""):
+        Args:
+            event_type: Event name, e.g. "http_response" or "poll_attempt"
+            message: Human-readable message or a callable building it
+            level: Log level
+            icon: Icon prefix in text mode
+            **fields: Structured fields
+        """
+        if not self.logger.isEnabledFor(level.value):
+            return
+
+        rate = self.sample_rates.get(event_type, 1.0)
+        if rate < 1.0:
+            if random.random() >= rate:
+                return
+            fields["sample_rate"] = rate
+
+        if callable(message):
+            message = message()
+
+        if self.structured:
+            self.logger.log(
+                level.value,
+                message,
+                extra={"event": event_type, "fields": fields},
+            )
+        else:
+            self.logger.log(level.value, f"{icon} {message}" if icon else message)
+
+    def debug(self, message: Message, icon: str = ""):
         """
         Log a debug message.
         """
-        self.logger.debug(f"{icon} {message}" if icon else message)
+        self._log(logging.DEBUG, message, icon)
 
-    def info(self, message: str, icon: str = ""):
+    def info(self, message: Message, icon: str = ""):
         """
         Log an info message.
         """
-        self.logger.info(f"{icon} {message}" if icon else message)
+        self._log(logging.INFO, message, icon)
 
-    def warning(self, message: str, icon: str = ""):
+    def warning(self, message: Message, icon: str = ""):
         """
         Log a warning message.
         """
-        self.logger.warning(f"{icon} {message}" if icon else message)
+        self._log(logging.WARNING, message, icon)
 
-    def error(self, message: str, icon: str = ""):
+    def error(self, message: Message, icon: str = ""):
         """
         Log an error message.
         """
-        self.logger.error(f"{icon} {message}" if icon else message)
+        self._log(logging.ERROR, message, icon)
 
-    def critical(self, message: str, icon: str = ""):
+    def critical(self, message: Message, icon: str = ""):
         """
         Log a critical message.
         """
-        self.logger.critical(f"{icon} {message}" if icon else message)
+        self._log(logging.CRITICAL, message, icon)
 
-    def success(self, message: str, icon: str = ""):
+    def success(self, message: Message, icon: str = ""):
         """
         Log a success message.
         """
-        self.logger.log(25, f"{icon} {message}" if icon else message)
+        self._log(LogLevel.SUCCESS.value, message, icon)
 
     def indent(self):
         """
@@ -168,6 +391,8 @@ class Logger:
         """
         Log a section header.
         """
+        if self.structured:
+            return
         sep_line = separator * width
         self.info("")
         self.info(sep_line)
@@ -178,6 +403,8 @@ class Logger:
         """
         Log a subsection header.
         """
+        if self.structured:
+            return
         self.info(f"\n=> {title}")
         self.indent()
 
@@ -193,7 +420,7 @@ class Logger:
         """
         Log JSON data.
         """
-        self.logger.log(level.value, f"{message}\n{json.dumps(data, indent=2)}")
+        self._log(level.value, lambda: f"{message}\n{json.dumps(data, indent=2)}")
 
     def list(
         self, items: list, message: str = "Items:", level: LogLevel = LogLevel.INFO
@@ -201,6 +428,8 @@ class Logger:
         """
         Log a list.
         """
+        if not self.logger.isEnabledFor(level.value):
+            return
         self.logger.log(level.value, message)
         for item in items:
             self.logger.log(level.value, f"  - {item}")
@@ -209,11 +438,18 @@ class Logger:
         """
         Log progress information.
         """
+        self.info(self.format_progress(current, total, message))
+
+    @staticmethod
+    def format_progress(current: int, total: int, message: str = "Progress") -> str:
+        """
+        Build a progress bar message.
+        """
         percentage = (current / total) * 100 if total > 0 else 0
         bar_length = 20
         filled_length = int(bar_length * current // total) if total > 0 else 0
         bar = "#" * filled_length + "-" * (bar_length - filled_length)
-        self.info(f"{message}: [{bar}] {percentage:.1f}% ({current}/{total})")
+        return f"{message}: [{bar}] {percentage:.1f}% ({current}/{total})"
 
     def process_start(self, process_name: str):
         """
@@ -240,10 +476,67 @@ class Logger:
         self.error(message, LogIcons.ERROR)
 
 
+_registry: Dict[Tuple[Any, ...], Logger] = {}
+_registry_lock = threading.Lock()
+_defaults: Dict[str, Any] = {}
+
+
+def _registry_key(name: str, level: LogLevel, options: Dict[str, Any]) -> tuple:
+    return (
+        name,
+        level,
+        tuple(
+            (k, tuple(sorted(v.items())) if isinstance(v, dict) else v)
+            for k, v in sorted(options.items())
+        ),
+    )
+
+
+def configure_logging(**defaults):
+    """
+    Set the default Logger options used by get_logger().
+
+    Replaces the previous defaults. Calling it again with the same options
+    does nothing; with different ones, loggers already handed out are
+    reconfigured in place, keeping the options passed to get_logger()
+    explicitly, which take precedence over the defaults.
+
+    Args:
+        **defaults: Logger keyword arguments, e.g. ``async_output=True``
+    """
+    with _registry_lock:
+        if defaults == _defaults:
+            return
+        _defaults.clear()
+        _defaults.update(defaults)
+
+        loggers = list(_registry.values())
+        _registry.clear()
+        for logger in loggers:
+            level, explicit = logger._requested
+            options = {**_defaults, **explicit}
+            logger.configure(level, **options)
+            _registry[_registry_key(logger.name, level, options)] = logger
+
+
 def get_logger(
     name: str = "Cosci", level: LogLevel = LogLevel.INFO, **kwargs
 ) -> Logger:
     """
     Get or create a logger instance.
+
+    Loggers are cached by name, level and options, so repeated calls reuse
+    the existing handlers instead of rebuilding them.
     """
-    return Logger(name, level, **kwargs)
+    options = {**_defaults, **kwargs}
+    key = _registry_key(name, level, options)
+
+    with _registry_lock:
+        logger = _registry.get(key)
+        # Another configuration of the same name may have replaced the handlers
+        if logger is None or logger.logger.handlers != logger._handlers:
+            logger = Logger(name, level, **options)
+            # Kept so configure_logging() can re-apply new defaults
+            logger._requested = (level, dict(kwargs))
+            _registry[key] = logger
+        return logger
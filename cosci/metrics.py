@@ -0,0 +1,244 @@
+"""
+Metrics Module for Cosci SDK
+============================
+Thread-safe counters, gauges and latency histograms.
+
+APIClient records every request into a MetricsRegistry; snapshot() returns
+a consistent, plain-dict copy suitable for logging or export.
+"""
+
+import math
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_RESOURCE_PREFIX = re.compile(r"^.*?/engines/[^/]+/")
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Reduce an endpoint to its family by replacing resource IDs.
+
+    Google resource paths alternate collection names and IDs, so every
+    second segment is an ID; custom methods (":startInstance") are kept.
+
+    Example:
+        "sessions/123/ideaForgeInstances/456" -> "sessions/{id}/ideaForgeInstances/{id}"
+    """
+    path = endpoint.split("?", 1)[0]
+    path = _RESOURCE_PREFIX.sub("", path).strip("/")
+
+    segments = path.split("/")
+    for i in range(1, len(segments), 2):
+        _, colon, verb = segments[i].partition(":")
+        segments[i] = "{id}" + colon + verb
+    return "/".join(segments)
+
+
+def _label_key(labels: Optional[Dict[str, Any]]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """
+    Histogram with logarithmic buckets.
+
+    Bucket boundaries grow by ``GROWTH`` from ``MIN_VALUE``, so quantiles are
+    accurate to a few percent over many orders of magnitude with a small,
+    bounded number of buckets.
+    """
+
+    MIN_VALUE = 1e-4
+    GROWTH = 1.05
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._buckets: Dict[int, int] = {}
+        self._log_growth = math.log(self.GROWTH)
+
+    def observe(self, value: float):
+        """
+        Record a value.
+        """
+        if value <= self.MIN_VALUE:
+            index = 0
+        else:
+            index = math.ceil(math.log(value / self.MIN_VALUE) / self._log_growth)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def upper_bound(self, index: int) -> float:
+        """
+        Upper bound of a bucket.
+        """
+        return self.MIN_VALUE * self.GROWTH**index
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(max(self.upper_bound(index), self.min), self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        Non-empty buckets as (upper bound, count), in increasing order.
+        """
+        return [(self.upper_bound(i), self._buckets[i]) for i in sorted(self._buckets)]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Count, sum, extremes and p50/p90/p99.
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+            "buckets": self.buckets(),
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of labelled counters, gauges and histograms.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+
+    def inc(
+        self, name: str, amount: float = 1, labels: Optional[Dict[str, Any]] = None
+    ) -> float:
+        """
+        Increase a counter.
+
+        Returns:
+            New counter value
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+            return series[key]
+
+    def gauge_add(
+        self, name: str, delta: float, labels: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Move a gauge up or down.
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0) + delta
+
+    def gauge_set(
+        self, name: str, value: float, labels: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Set a gauge.
+        """
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None):
+        """
+        Record a value in a histogram.
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def total(self, name: str, **label_filter) -> float:
+        """
+        Sum a counter over all series matching the given labels.
+        """
+        wanted = {k: str(v) for k, v in label_filter.items()}
+        with self._lock:
+            return sum(
+                value
+                for key, value in self._counters.get(name, {}).items()
+                if all(dict(key).get(k) == v for k, v in wanted.items())
+            )
+
+    def gauge(self, name: str, **labels) -> float:
+        """
+        Current value of a gauge.
+        """
+        with self._lock:
+            return self._gauges.get(name, {}).get(_label_key(labels), 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Copy of all metrics.
+
+        Returns:
+            Dictionary with "counters", "gauges" and "histograms", each
+            mapping a metric name to a list of {"labels": ..., ...} series;
+            histogram series carry their summary() fields.
+        """
+        with self._lock:
+            return {
+                "counters": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in series.items()
+                    ]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in series.items()
+                    ]
+                    for name, series in self._gauges.items()
+                },
+                "histograms": {
+                    name: [
+                        {"labels": dict(key), **histogram.summary()}
+                        for key, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def reset(self):
+        """
+        Drop recorded counters and histograms.
+
+        Gauges hold current values, such as requests in flight, that are
+        still being adjusted, so they are kept.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
@@ -1,10 +1,157 @@
 """
 Data models for the Cosci SDK.
+
+Models use ``__slots__`` so large result sets stay compact in memory.
+Creation timestamps are kept in their raw form (epoch seconds or ISO
+string) and only converted to ``datetime`` when ``created_at`` is read.
+IDs repeated across many objects are interned. Objects can be frozen,
+after which assigning attributes raises ``AttributeError``. Idea content
+can be loaded lazily on first access through a content loader.
 """
 
+import re
+import sys
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from cosci.exceptions import ValidationError
+
+Timestamp = Union[datetime, float, str]
+
+_SESSION_IN_PATH = re.compile(r"(?:^|/)sessions/([^/:]+)")
+
+# Constructors assign slots directly, skipping _Model.__setattr__
+_set = object.__setattr__
+
+
+def session_id_from_path(path: str) -> Optional[str]:
+    """
+    Extract the session ID from a resource path, if it contains one.
+    """
+    match = _SESSION_IN_PATH.search(path)
+    return sys.intern(match.group(1)) if match else None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _to_datetime(value: Timestamp) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value)
+
+
+def _to_isoformat(value: Timestamp) -> str:
+    if isinstance(value, str):
+        return value
+    return _to_datetime(value).isoformat()
+
+
+def _check_timestamp(value: Any, model: str) -> Timestamp:
+    if value is None:
+        return time.time()
+    if isinstance(value, str):
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            raise ValidationError(f"{model}: invalid created_at: {value!r}")
+        return value
+    if isinstance(value, (datetime, int, float)) and not isinstance(value, bool):
+        return value
+    raise ValidationError(f"{model}: invalid created_at: {value!r}")
+
+
+def _check_type(data: Dict[str, Any], key: str, types, model: str, required=False):
+    value = data.get(key)
+    if value is None:
+        if required:
+            raise ValidationError(f"{model}: missing required field {key!r}")
+        return None
+    if not isinstance(value, types):
+        raise ValidationError(f"{model}: field {key!r} has type {type(value).__name__}")
+    return value
+
+
+def _check_mapping(data: Any, model: str) -> Dict[str, Any]:
+    if not isinstance(data, dict):
+        raise ValidationError(
+            f"{model}.from_dict expects a dict, got {type(data).__name__}"
+        )
+    return data
+
+
+class _Model:
+    """
+    Base for slotted models with optional freezing.
+    """
+
+    __slots__ = ("_frozen",)
+
+    def __setattr__(self, name: str, value: Any):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                f"Cannot set {name!r}: {type(self).__name__} is frozen"
+            )
+        object.__setattr__(self, name, value)
+
+    def freeze(self):
+        """
+        Make the object read-only; nested dicts stay mutable.
+
+        Returns:
+            The object itself
+        """
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return getattr(self, "_frozen", False)
+
+    def _slot_names(self):
+        for cls in type(self).__mro__:
+            yield from getattr(cls, "__slots__", ())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            name: getattr(self, name)
+            for name in self._slot_names()
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def created_at(self) -> datetime:
+        """
+        Creation time, converted from its stored form on first access.
+        """
+        created = self._created
+        if not isinstance(created, datetime):
+            created = _to_datetime(created)
+            object.__setattr__(self, "_created", created)
+        return created
+
+    @created_at.setter
+    def created_at(self, value: Timestamp):
+        self._created = value
+
+    @property
+    def created_timestamp(self) -> float:
+        """
+        Creation time as epoch seconds, without building a datetime.
+        """
+        created = self._created
+        if isinstance(created, (int, float)):
+            return float(created)
+        return _to_datetime(created).timestamp()
 
 
 class SessionState(Enum):
@@ -30,25 +177,35 @@ class InstanceState(Enum):
     FAILED = "FAILED"
 
 
-class ResearchSession:
+class ResearchSession(_Model):
     """
     Represents a Co-Scientist research session.
     """
 
+    __slots__ = (
+        "session_id",
+        "research_goal",
+        "state",
+        "_created",
+        "metadata",
+        "instance",
+    )
+
     def __init__(
         self,
         session_id: str,
         research_goal: Optional[str] = None,
         state: SessionState = SessionState.CREATED,
-        created_at: Optional[datetime] = None,
+        created_at: Optional[Timestamp] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        instance: Optional["Instance"] = None,
     ):
-        self.session_id = session_id
-        self.research_goal = research_goal
-        self.state = state
-        self.created_at = created_at or datetime.now()
-        self.metadata = metadata or {}
-        self.instance: Optional[Instance] = None
+        _set(self, "session_id", sys.intern(session_id))
+        _set(self, "research_goal", research_goal)
+        _set(self, "state", state)
+        _set(self, "_created", created_at if created_at is not None else time.time())
+        _set(self, "metadata", metadata or {})
+        _set(self, "instance", instance)
 
     def __repr__(self) -> str:
         return f"ResearchSession(id={self.session_id}, state={self.state.value})"
@@ -61,31 +218,78 @@ class ResearchSession:
             "session_id": self.session_id,
             "research_goal": self.research_goal,
             "state": self.state.value,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _to_isoformat(self._created),
             "instance": self.instance.to_dict() if self.instance else None,
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], frozen: bool = False) -> "ResearchSession":
+        """
+        Build a session from to_dict() output.
+
+        Args:
+            data: Session dictionary
+            frozen: Freeze the session and its instance and ideas
+
+        Raises:
+            ValidationError: If a field is missing or invalid
+        """
+        data = _check_mapping(data, cls.__name__)
+        session_id = _check_type(data, "session_id", str, cls.__name__, required=True)
+        state = data.get("state", SessionState.CREATED.value)
+        try:
+            state = SessionState(state)
+        except ValueError:
+            raise ValidationError(f"{cls.__name__}: invalid state: {state!r}")
+
+        instance_data = data.get("instance")
+        instance = (
+            Instance.from_dict(instance_data, frozen=frozen)
+            if instance_data is not None
+            else None
+        )
+
+        session = cls(
+            session_id=session_id,
+            research_goal=_check_type(data, "research_goal", str, cls.__name__),
+            state=state,
+            created_at=_check_timestamp(data.get("created_at"), cls.__name__),
+            metadata=_check_type(data, "metadata", dict, cls.__name__),
+            instance=instance,
+        )
+        return session.freeze() if frozen else session
 
-class Instance:
+
+class Instance(_Model):
     """
     Represents a Co-Scientist instance.
     """
 
+    __slots__ = (
+        "instance_id",
+        "session_id",
+        "state",
+        "_created",
+        "metadata",
+        "ideas",
+    )
+
     def __init__(
         self,
         instance_id: str,
         session_id: str,
         state: InstanceState = InstanceState.CREATING,
-        created_at: Optional[datetime] = None,
+        created_at: Optional[Timestamp] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        ideas: Optional[List["Idea"]] = None,
     ):
-        self.instance_id = instance_id
-        self.session_id = session_id
-        self.state = state
-        self.created_at = created_at or datetime.now()
-        self.metadata = metadata or {}
-        self.ideas: List[Idea] = []
+        _set(self, "instance_id", sys.intern(instance_id))
+        _set(self, "session_id", sys.intern(session_id))
+        _set(self, "state", state)
+        _set(self, "_created", created_at if created_at is not None else time.time())
+        _set(self, "metadata", metadata or {})
+        _set(self, "ideas", ideas if ideas is not None else [])
 
     def __repr__(self) -> str:
         return f"Instance(id={self.instance_id}, state={self.state.value}, ideas={len(self.ideas)})"
@@ -98,17 +302,69 @@ class Instance:
             "instance_id": self.instance_id,
             "session_id": self.session_id,
             "state": self.state.value,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _to_isoformat(self._created),
             "ideas": [idea.to_dict() for idea in self.ideas],
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], frozen: bool = False) -> "Instance":
+        """
+        Build an instance from to_dict() output.
+
+        Args:
+            data: Instance dictionary
+            frozen: Freeze the instance and its ideas
+
+        Raises:
+            ValidationError: If a field is missing or invalid
+        """
+        data = _check_mapping(data, cls.__name__)
+        instance_id = _check_type(data, "instance_id", str, cls.__name__, required=True)
+        session_id = _check_type(data, "session_id", str, cls.__name__, required=True)
+        state = data.get("state", InstanceState.CREATING.value)
+        try:
+            state = InstanceState(state)
+        except ValueError:
+            raise ValidationError(f"{cls.__name__}: invalid state: {state!r}")
+
+        ideas_data = _check_type(data, "ideas", list, cls.__name__) or []
+        ideas = [
+            Idea.from_dict(idea, frozen=frozen, session_id=session_id)
+            for idea in ideas_data
+        ]
+
+        instance = cls(
+            instance_id=instance_id,
+            session_id=session_id,
+            state=state,
+            created_at=_check_timestamp(data.get("created_at"), cls.__name__),
+            metadata=_check_type(data, "metadata", dict, cls.__name__),
+            ideas=ideas,
+        )
+        return instance.freeze() if frozen else instance
 
-class Idea:
+
+class Idea(_Model):
     """
     Represents a research idea.
+
+    When created with a ``content_loader``, ``content`` is fetched by
+    calling ``content_loader(idea)`` on first access. The loader is not
+    pickled, so unpickled ideas only keep content that was already loaded.
     """
 
+    __slots__ = (
+        "idea_id",
+        "title",
+        "description",
+        "_content",
+        "_loader",
+        "attributes",
+        "session_id",
+        "_created",
+    )
+
     def __init__(
         self,
         idea_id: str,
@@ -116,27 +372,117 @@ class Idea:
         description: Optional[str] = None,
         content: Optional[Dict[str, Any]] = None,
         attributes: Optional[Dict[str, Any]] = None,
-        created_at: Optional[datetime] = None,
+        created_at: Optional[Timestamp] = None,
+        session_id: Optional[str] = None,
+        content_loader: Optional[Callable[["Idea"], Dict[str, Any]]] = None,
     ):
-        self.idea_id = idea_id
-        self.title = title
-        self.description = description
-        self.content = content or {}
-        self.attributes = attributes or {}
-        self.created_at = created_at or datetime.now()
+        _set(self, "idea_id", idea_id)
+        _set(self, "title", title)
+        _set(self, "description", description)
+        _set(self, "_content", content or None)
+        _set(self, "_loader", content_loader if not content else None)
+        _set(self, "attributes", attributes or {})
+        _set(self, "session_id", _intern(session_id))
+        _set(self, "_created", created_at if created_at is not None else time.time())
 
     def __repr__(self) -> str:
         return f"Idea(id={self.idea_id}, title={self.title})"
 
+    @property
+    def content(self) -> Dict[str, Any]:
+        """
+        Full idea details, loaded on first access when a loader is set.
+
+        A loader returning None signals a failed load: ``{}`` is returned
+        and the next access calls the loader again.
+        """
+        content = self._content
+        if content is None:
+            loader = self._loader
+            if loader is not None:
+                content = loader(self)
+                if content is None:
+                    return {}
+            object.__setattr__(self, "_content", content or {})
+            object.__setattr__(self, "_loader", None)
+            content = self._content
+        return content
+
+    @content.setter
+    def content(self, value: Optional[Dict[str, Any]]):
+        self._content = value
+        self._loader = None
+
+    def set_content_loader(self, loader: Callable[["Idea"], Dict[str, Any]]):
+        """
+        Load content with ``loader(idea)`` on first access, unless it is
+        already loaded.
+        """
+        if self._content is None:
+            self._loader = loader
+
+    @property
+    def content_loaded(self) -> bool:
+        """
+        Whether reading ``content`` will not trigger a fetch.
+        """
+        return self._content is not None or self._loader is None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["_loader"] = None
+        return state
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary.
         """
-        return {
+        data = {
             "idea_id": self.idea_id,
             "title": self.title,
             "description": self.description,
             "content": self.content,
             "attributes": self.attributes,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _to_isoformat(self._created),
         }
+        if self.session_id is not None:
+            data["session_id"] = self.session_id
+        return data
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        frozen: bool = False,
+        session_id: Optional[str] = None,
+    ) -> "Idea":
+        """
+        Build an idea from to_dict() output.
+
+        Args:
+            data: Idea dictionary
+            frozen: Freeze the idea
+            session_id: Session to attribute the idea to when the
+                dictionary does not name one
+
+        Raises:
+            ValidationError: If a field is missing or invalid
+        """
+        data = _check_mapping(data, cls.__name__)
+        name = cls.__name__
+        attributes = _check_type(data, "attributes", dict, name)
+
+        idea = cls(
+            idea_id=_check_type(data, "idea_id", str, name, required=True),
+            title=_check_type(data, "title", str, name),
+            description=_check_type(data, "description", str, name),
+            content=_check_type(data, "content", dict, name),
+            attributes=(
+                {sys.intern(k): v for k, v in attributes.items()}
+                if attributes
+                else None
+            ),
+            created_at=_check_timestamp(data.get("created_at"), name),
+            session_id=_check_type(data, "session_id", str, name) or session_id,
+        )
+        return idea.freeze() if frozen else idea
@@ -0,0 +1,296 @@
+"""
+Prometheus Exporter Module for Cosci SDK
+========================================
+Exposes SDK and session health in the Prometheus text format.
+
+The exporter reads the clients' existing statistics when scraped, so it adds
+no work to the request path; it is only imported when enabled in the
+``metrics`` config section or created directly.
+"""
+
+import math
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from cosci.logger import LogIcons, get_logger
+
+# Latency bucket bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape(str(v))}"' for k, v in sorted(labels.items()))
+    return "{" + inner + "}"
+
+
+class _MetricFamily:
+    """
+    Samples of one metric, rendered with its HELP and TYPE lines.
+    """
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.name = name
+        self.type = metric_type
+        self.help = help_text
+        self.samples: List[Sample] = []
+
+    def add(self, value: float, labels: Dict[str, str], suffix: str = ""):
+        self.samples.append((self.name + suffix, labels, value))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for name, labels, value in self.samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class PrometheusExporter:
+    """
+    Prometheus exporter for one or more Co-Scientist clients.
+
+    Exports request counters and latency histograms from ``APIClient``,
+    token refresh timings, sessions by instance state, sessions awaiting
+    ideas and ideas generated per minute. Every sample carries an
+    ``engine`` label.
+
+    Example:
+        exporter = PrometheusExporter(client)
+        exporter.serve(9464)                       # scrape /metrics
+        exporter.write_textfile("/var/lib/node_exporter/cosci.prom")
+    """
+
+    def __init__(
+        self,
+        clients: Union[Any, Sequence[Any]],
+        namespace: str = "cosci",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            clients: CoScientist, ShardedCoScientist, or a list of CoScientist
+            namespace: Prefix of all metric names
+            buckets: Upper bounds of exported latency buckets, in seconds
+        """
+        if hasattr(clients, "shards"):
+            clients = [shard.client for shard in clients.shards]
+        elif not isinstance(clients, (list, tuple)):
+            clients = [clients]
+
+        self.clients = list(clients)
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self.logger = get_logger("Metrics")
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text format.
+        """
+        families: Dict[str, _MetricFamily] = {}
+
+        def family(name: str, metric_type: str, help_text: str) -> _MetricFamily:
+            full_name = f"{self.namespace}_{name}"
+            if full_name not in families:
+                families[full_name] = _MetricFamily(full_name, metric_type, help_text)
+            return families[full_name]
+
+        for client in self.clients:
+            engine = {"engine": client.config.engine}
+            self._collect_requests(client.api_client, engine, family)
+            self._collect_auth(client.authenticator, engine, family)
+            self._collect_sessions(client.session_manager, engine, family)
+
+        lines = []
+        for metric in families.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _collect_requests(self, api_client, engine: Dict[str, str], family):
+        snapshot = api_client.metrics.snapshot()
+
+        for name, series_list in snapshot["counters"].items():
+            metric = family(
+                name, "counter", f"Cosci API client {name.replace('_', ' ')}"
+            )
+            for series in series_list:
+                metric.add(series["value"], {**series["labels"], **engine})
+
+        for name, series_list in snapshot["gauges"].items():
+            metric = family(name, "gauge", f"Cosci API client {name.replace('_', ' ')}")
+            for series in series_list:
+                metric.add(series["value"], {**series["labels"], **engine})
+
+        for name, series_list in snapshot["histograms"].items():
+            metric = family(
+                name, "histogram", f"Cosci API client {name.replace('_', ' ')}"
+            )
+            for series in series_list:
+                labels = {**series["labels"], **engine}
+                # Re-bucket the fine log buckets onto the exported bounds
+                for bound in self.buckets:
+                    count = sum(c for upper, c in series["buckets"] if upper <= bound)
+                    metric.add(count, {**labels, "le": _format_value(bound)}, "_bucket")
+                metric.add(series["count"], {**labels, "le": "+Inf"}, "_bucket")
+                metric.add(series["sum"], labels, "_sum")
+                metric.add(series["count"], labels, "_count")
+
+    def _collect_auth(self, authenticator, engine: Dict[str, str], family):
+        stats = authenticator.get_refresh_stats()
+        family("token_refreshes_total", "counter", "Access token refreshes").add(
+            stats["refresh_count"], engine
+        )
+        family(
+            "token_refresh_failures_total", "counter", "Failed access token refreshes"
+        ).add(stats["refresh_failures"], engine)
+        family(
+            "token_refresh_seconds_total", "counter", "Time spent refreshing tokens"
+        ).add(stats["refresh_time"], engine)
+        family(
+            "token_last_refresh_seconds", "gauge", "Duration of the last token refresh"
+        ).add(stats["last_refresh_time"], engine)
+        family(
+            "token_cache_hits_total", "counter", "Tokens adopted from the token cache"
+        ).add(stats["cache_hits"], engine)
+
+    def _collect_sessions(self, session_manager, engine: Dict[str, str], family):
+        counts = session_manager.get_instance_state_counts()
+        metric = family("sessions", "gauge", "Tracked sessions by instance state")
+        for state, count in counts.items():
+            metric.add(count, {**engine, "state": state})
+
+        family(
+            "sessions_pending",
+            "gauge",
+            "Tracked sessions whose instance has not finished",
+        ).add(
+            sum(n for s, n in counts.items() if s not in ("SUCCEEDED", "FAILED")),
+            engine,
+        )
+        family("ideas_generated_total", "counter", "Ideas returned by polling").add(
+            session_manager.ideas_generated, engine
+        )
+        family(
+            "ideas_per_minute",
+            "gauge",
+            "Ideas generated per minute over the recent window",
+        ).add(session_manager.ideas_per_minute(), engine)
+
+    def write_textfile(self, path: str):
+        """
+        Write metrics for the node_exporter textfile collector.
+
+        The file is replaced atomically, so the collector never reads a
+        partial file.
+        """
+        target = Path(path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def start_textfile_writer(self, path: str, interval: float = 15):
+        """
+        Rewrite the textfile every ``interval`` seconds on a daemon thread.
+        """
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except Exception as e:
+                    self.logger.warning(f"Could not write metrics textfile: {e}")
+
+        self.write_textfile(path)
+        thread = threading.Thread(
+            target=loop, name="cosci-metrics-textfile", daemon=True
+        )
+        thread.start()
+        self._threads.append(thread)
+        self.logger.info(f"Writing metrics to {path} every {interval}s", LogIcons.DATA)
+
+    def serve(self, port: int, address: str = "") -> ThreadingHTTPServer:
+        """
+        Serve ``/metrics`` over HTTP on a daemon thread.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            address: Address to bind, all interfaces by default
+
+        Returns:
+            The running server; its ``server_port`` is the bound port
+        """
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4; charset=utf-8"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((address, port), MetricsHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(
+            target=server.serve_forever, name="cosci-metrics-http", daemon=True
+        )
+        thread.start()
+        self._server = server
+        self._threads.append(thread)
+        self.logger.info(f"Serving metrics on port {server.server_port}", LogIcons.DATA)
+        return server
+
+    def stop(self):
+        """
+        Stop the HTTP server and the textfile writer.
+        """
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
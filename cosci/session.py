@@ -3,15 +3,154 @@ Session management for the Cosci SDK.
 """
 
 import json
+import threading
 import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
 
 from cosci.api_client import APIClient
 from cosci.exceptions import SessionError, TimeoutError
 from cosci.logger import LogIcons, get_logger
-from cosci.models import Idea, Instance, InstanceState, ResearchSession, SessionState
+from cosci.models import (
+    Idea,
+    Instance,
+    InstanceState,
+    ResearchSession,
+    SessionState,
+    session_id_from_path,
+)
+from cosci.tracing import Tracer, current_span, get_tracer, traced
+
+
+class IdeaDetailsLoader:
+    """
+    Content loader fetching idea details on first access.
+
+    Reading one idea's content also starts background fetches for the next
+    ``prefetch`` ideas in list order, so iterating over the ideas overlaps
+    the detail requests instead of paying for them one by one.
+
+    Failed fetches are not cached; the next read of the idea tries again.
+    Prefetch threads are stopped by ``close()``, once every idea has been
+    scheduled, or when the loader is garbage collected.
+    """
+
+    def __init__(
+        self,
+        session_manager: "SessionManager",
+        session_id: str,
+        instance_id: str,
+        ideas: Sequence[Idea],
+        prefetch: int = 4,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            session_manager: Manager used to fetch details
+            session_id: Session the ideas belong to
+            instance_id: Instance the ideas belong to
+            ideas: Ideas in iteration order
+            prefetch: Ideas to fetch ahead of the one being read (0 disables)
+        """
+        self.session_manager = session_manager
+        self.session_id = session_id
+        self.instance_id = instance_id
+        self.prefetch = max(0, prefetch)
+
+        self._ideas = list(ideas)
+        self._positions = {idea.idea_id: i for i, idea in enumerate(self._ideas)}
+        self._futures: Dict[str, Future] = {}
+        self._scheduled: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def attach(self):
+        """
+        Set this loader on all of its ideas.
+        """
+        for idea in self._ideas:
+            idea.set_content_loader(self)
+
+    def __call__(self, idea: Idea) -> Optional[Dict[str, Any]]:
+        position = self._positions.get(idea.idea_id)
+        if position is not None:
+            with self._lock:
+                self._scheduled.add(idea.idea_id)
+            self._schedule(position + 1, position + 1 + self.prefetch)
+
+        with self._lock:
+            future = self._futures.pop(idea.idea_id, None)
+        details = future.result() if future is not None else None
+        if details is None:
+            details = self._fetch(idea.idea_id)
+        if details is None:
+            with self._lock:
+                self._scheduled.discard(idea.idea_id)
+        return details
+
+    def _schedule(self, start: int, stop: int):
+        with self._lock:
+            if self._closed:
+                return
+            for idea in self._ideas[start:stop]:
+                if idea.idea_id in self._scheduled:
+                    continue
+                self._scheduled.add(idea.idea_id)
+                if idea.content_loaded:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.prefetch,
+                        thread_name_prefix="cosci-prefetch",
+                    )
+                    self._finalizer = weakref.finalize(
+                        self, self._executor.shutdown, wait=False
+                    )
+                self._futures[idea.idea_id] = self._executor.submit(
+                    self._fetch, idea.idea_id
+                )
+            if self._executor is not None and len(self._scheduled) == len(self._ideas):
+                # Everything is queued; let the workers exit when done
+                self._stop_executor()
+
+    def _stop_executor(self):
+        self._finalizer.detach()
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        self._finalizer = None
+
+    def close(self):
+        """
+        Cancel pending prefetches and stop the prefetch threads.
+
+        Ideas can still be read afterwards; their details are then fetched
+        on access without prefetching.
+        """
+        with self._lock:
+            self._closed = True
+            for idea_id, future in list(self._futures.items()):
+                if future.cancel():
+                    del self._futures[idea_id]
+            if self._executor is not None:
+                self._stop_executor()
+
+    def _fetch(self, idea_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.session_manager.get_idea_details(
+                self.session_id, self.instance_id, idea_id
+            )
+        except Exception as e:
+            self.session_manager.logger.debug(
+                f"Could not fetch details for idea {idea_id}: {e}"
+            )
+            return None
 
 
 class SessionManager:
@@ -19,14 +158,31 @@ class SessionManager:
     Manages research sessions and their lifecycle.
     """
 
-    def __init__(self, api_client: APIClient, logger=None):
+    # Partial-response field masks for status-only polling
+    SESSION_INSTANCE_FIELDS = "ideaForgeInstance"
+    INSTANCE_STATUS_FIELDS = "state,stats"
+    INSTANCE_POLL_FIELDS = "state,stats,ideas.name,ideaPreviews.ideaForgeIdea"
+
+    # Seconds of history used for the ideas-per-minute rate
+    IDEA_RATE_WINDOW = 600
+
+    def __init__(
+        self, api_client: APIClient, logger=None, tracer: Optional[Tracer] = None
+    ):
         """
         Initialize the session manager.
         """
         self.api_client = api_client
         self.logger = logger or get_logger("SessionManager")
+        self.tracer = tracer or get_tracer()
         self._sessions: Dict[str, ResearchSession] = {}
 
+        # Generated idea counts for throughput reporting
+        self.ideas_generated = 0
+        self._idea_events: Deque[Tuple[float, int]] = deque()
+        self._ideas_lock = threading.Lock()
+
+    @traced("create_session")
     def create_session(self, research_goal: str) -> ResearchSession:
         """
         Create a new research session and start execution.
@@ -41,6 +197,7 @@ class SessionManager:
         session_id = self._extract_session_id(response)
         if not session_id:
             raise SessionError("Failed to extract session ID from response")
+        current_span().set_attribute("session_id", session_id)
 
         session = ResearchSession(
             session_id=session_id,
@@ -58,7 +215,8 @@ class SessionManager:
         self.logger.info(
             f"Waiting {wait_time}s for session to be ready...", LogIcons.WAIT
         )
-        time.sleep(wait_time)
+        with self.tracer.span("session_ready_wait", kind="phase"):
+            time.sleep(wait_time)
 
         # Step 3: Try to start execution
         self.logger.info("Starting session execution...", LogIcons.PROCESS)
@@ -74,7 +232,8 @@ class SessionManager:
                 LogIcons.WARNING,
             )
 
-            time.sleep(5)  # Wait another 5 seconds
+            with self.tracer.span("session_ready_wait", kind="phase"):
+                time.sleep(5)  # Wait another 5 seconds
 
             try:
                 status = self.get_session_status(session_id)
@@ -99,6 +258,7 @@ class SessionManager:
 
         return session
 
+    @traced("start_session_execution")
     def _start_session_execution(self, session_id: str):
         """
         Start the execution of a created session.
@@ -116,7 +276,9 @@ class SessionManager:
 
         try:
             result = self.api_client.post(endpoint, data)
-            self.logger.debug(f"Session execution started via :startInstance: {result}")
+            self.logger.debug(
+                lambda: f"Session execution started via :startInstance: {result}"
+            )
             return result
         except Exception as e:
             self.logger.warning(f":startInstance endpoint failed: {e}")
@@ -150,7 +312,7 @@ class SessionManager:
         """
         Get detailed status for a session.
         """
-        info = self.get_session_info(session_id)
+        info = self.get_session_info(session_id, fields=self.SESSION_INSTANCE_FIELDS)
         instance_path = info.get("ideaForgeInstance", "")
 
         status = {
@@ -166,8 +328,10 @@ class SessionManager:
             status["instance_id"] = instance_id
 
             try:
-                instance = self.api_client.get(
-                    f"sessions/{session_id}/ideaForgeInstances/{instance_id}"
+                instance = self._get_instance_info(
+                    session_id,
+                    instance_id,
+                    fields=f"{self.INSTANCE_STATUS_FIELDS},config",
                 )
                 status["state"] = instance.get("state", "UNKNOWN")
                 status["ideas_count"] = instance.get("stats", {}).get("numIdeas", 0)
@@ -178,39 +342,48 @@ class SessionManager:
         return status
 
     def get_ideas_from_session(
-        self, session_id: str, fetch_details: bool = False
+        self,
+        session_id: str,
+        fetch_details: bool = False,
+        lazy_details: bool = False,
+        prefetch: int = 4,
     ) -> List[Idea]:
         """
         Get ideas from a session without waiting.
+
+        Args:
+            session_id: Session ID
+            fetch_details: Fetch full details for every idea before returning
+            lazy_details: Fetch each idea's details when its ``content`` is
+                first read
+            prefetch: Ideas whose details are fetched ahead in the
+                background when one is read
         """
-        info = self.get_session_info(session_id)
+        info = self.get_session_info(session_id, fields=self.SESSION_INSTANCE_FIELDS)
         instance_path = info.get("ideaForgeInstance", "")
 
         if not instance_path:
             return []
 
         instance_id = instance_path.split("/")[-1]
-        instance = self.api_client.get(
-            f"sessions/{session_id}/ideaForgeInstances/{instance_id}"
-        )
+        instance = self._get_instance_info(session_id, instance_id)
 
         ideas_data = instance.get("ideas", [])
         idea_previews = instance.get("ideaPreviews", [])
 
         ideas = self._parse_ideas(ideas_data or idea_previews)
 
-        # Optionally fetch full details for each idea
-        if fetch_details and ideas:
-            for idea in ideas:
-                try:
-                    details = self.get_idea_details(
-                        session_id, instance_id, idea.idea_id
-                    )
-                    idea.content = details
-                except Exception as e:
-                    self.logger.debug(
-                        f"Could not fetch details for idea {idea.idea_id}: {e}"
-                    )
+        if (fetch_details or lazy_details) and ideas:
+            loader = IdeaDetailsLoader(
+                self, session_id, instance_id, ideas, prefetch=prefetch
+            )
+            loader.attach()
+
+            # Reading in order keeps the prefetch window full
+            if fetch_details:
+                for idea in ideas:
+                    idea.content
+                loader.close()
 
         return ideas
 
@@ -250,6 +423,7 @@ class SessionManager:
         )
         return str(filepath)
 
+    @traced("wait_for_instance")
     def wait_for_instance(
         self, session: ResearchSession, timeout: int = 60, poll_interval: int = 2
     ) -> Instance:
@@ -265,7 +439,9 @@ class SessionManager:
             attempts += 1
 
             try:
-                session_info = self.get_session_info(session.session_id)
+                session_info = self.get_session_info(
+                    session.session_id, fields=self.SESSION_INSTANCE_FIELDS
+                )
 
                 instance_path = session_info.get("ideaForgeInstance", "")
                 if instance_path:
@@ -295,6 +471,7 @@ class SessionManager:
 
         raise TimeoutError(f"Instance not created within {timeout} seconds")
 
+    @traced("poll_for_ideas")
     def poll_for_ideas(
         self,
         instance: Instance,
@@ -314,34 +491,66 @@ class SessionManager:
             attempts += 1
 
             try:
+                # Poll status and idea names only; fetch the full instance
+                # once it holds enough ideas to return
                 instance_info = self._get_instance_info(
-                    instance.session_id, instance.instance_id
+                    instance.session_id,
+                    instance.instance_id,
+                    fields=self.INSTANCE_POLL_FIELDS,
                 )
 
                 state_str = instance_info.get("state", "UNKNOWN")
                 if state_str in [s.value for s in InstanceState]:
                     instance.state = InstanceState(state_str)
 
+                # proto3 JSON omits numIdeas while it is 0
+                num_ideas = int(instance_info.get("stats", {}).get("numIdeas", 0))
+                succeeded = instance.state == InstanceState.SUCCEEDED
+                available = len(instance_info.get("ideas", []))
+                if succeeded:
+                    available = max(
+                        available,
+                        len(instance_info.get("ideaPreviews", [])),
+                        num_ideas,
+                    )
+                if available >= min_ideas:
+                    instance_info = self._get_instance_info(
+                        instance.session_id, instance.instance_id
+                    )
+                else:
+                    instance_info = {}
+
                 ideas_data = instance_info.get("ideas", [])
                 idea_previews = instance_info.get("ideaPreviews", [])
 
-                if ideas_data or (
-                    instance.state == InstanceState.SUCCEEDED and idea_previews
-                ):
+                if ideas_data or (succeeded and idea_previews):
                     ideas = self._parse_ideas(ideas_data or idea_previews)
 
                     if len(ideas) >= min_ideas:
                         instance.ideas = ideas
+                        self._record_ideas(len(ideas))
+                        current_span().set_attributes(
+                            attempts=attempts, ideas=len(ideas)
+                        )
                         self.logger.success(
                             f"Generated {len(ideas)} ideas", LogIcons.SUCCESS
                         )
                         return ideas
 
                 elapsed = time.time() - start_time
-                self.logger.progress(
-                    int(elapsed),
-                    timeout,
-                    f"Waiting for ideas (attempt {attempts}, state: {instance.state.value})",
+                self.logger.event(
+                    "poll_attempt",
+                    lambda: self.logger.format_progress(
+                        int(elapsed),
+                        timeout,
+                        f"Waiting for ideas (attempt {attempts}, state: {instance.state.value})",
+                    ),
+                    session_id=instance.session_id,
+                    instance_id=instance.instance_id,
+                    attempt=attempts,
+                    state=instance.state.value,
+                    num_ideas=num_ideas,
+                    elapsed_s=round(elapsed, 1),
                 )
 
             except Exception as e:
@@ -351,12 +560,58 @@ class SessionManager:
 
         raise TimeoutError(f"Ideas not generated within {timeout} seconds")
 
-    def get_session_info(self, session_id: str) -> Dict[str, Any]:
+    def _record_ideas(self, count: int):
+        """
+        Record ideas returned by a finished poll.
+        """
+        now = time.time()
+        cutoff = now - self.IDEA_RATE_WINDOW
+        with self._ideas_lock:
+            self.ideas_generated += count
+            self._idea_events.append((now, count))
+            while self._idea_events and self._idea_events[0][0] < cutoff:
+                self._idea_events.popleft()
+
+    def ideas_per_minute(self) -> float:
+        """
+        Ideas generated per minute over the last IDEA_RATE_WINDOW seconds.
+        """
+        cutoff = time.time() - self.IDEA_RATE_WINDOW
+        with self._ideas_lock:
+            recent = sum(count for t, count in self._idea_events if t >= cutoff)
+        return recent * 60 / self.IDEA_RATE_WINDOW
+
+    def get_tracked_session(self, session_id: str) -> Optional[ResearchSession]:
+        """
+        Session created by this manager, or None if it is not tracked.
+        """
+        return self._sessions.get(session_id)
+
+    def get_instance_state_counts(self) -> Dict[str, int]:
+        """
+        Count tracked sessions by the last seen state of their instance.
+
+        Sessions without an instance yet are counted as CREATING.
+        """
+        counts = {state.value: 0 for state in InstanceState}
+        for session in list(self._sessions.values()):
+            instance = session.instance
+            state = instance.state if instance else InstanceState.CREATING
+            counts[state.value] += 1
+        return counts
+
+    def get_session_info(
+        self, session_id: str, fields: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get session information from API.
+
+        Args:
+            session_id: Session ID
+            fields: Optional field mask to limit the response
         """
         endpoint = f"sessions/{session_id}"
-        return self.api_client.get(endpoint)
+        return self.api_client.get(endpoint, fields=fields)
 
     def get_idea_details(
         self, session_id: str, instance_id: str, idea_id: str
@@ -367,6 +622,7 @@ class SessionManager:
         endpoint = f"sessions/{session_id}/ideaForgeInstances/{instance_id}/ideaForgeIdeas/{idea_id}"
         return self.api_client.get(endpoint)
 
+    @traced("query_assistant")
     def _query_assistant(self, query: str) -> Any:
         """
         Query the assistant to create a session.
@@ -375,12 +631,14 @@ class SessionManager:
         data = {"query": {"text": query}, "answer_generation_mode": "IDEA_FORGE"}
         return self.api_client.post(endpoint, data)
 
-    def _get_instance_info(self, session_id: str, instance_id: str) -> Dict[str, Any]:
+    def _get_instance_info(
+        self, session_id: str, instance_id: str, fields: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get instance information from API.
         """
         endpoint = f"sessions/{session_id}/ideaForgeInstances/{instance_id}"
-        return self.api_client.get(endpoint)
+        return self.api_client.get(endpoint, fields=fields)
 
     def _extract_session_id(self, response: Any) -> Optional[str]:
         """
@@ -426,6 +684,7 @@ class SessionManager:
                             "ranking": data.get("ranking"),
                             "eloRating": data.get("eloRating"),
                         },
+                        session_id=session_id_from_path(idea_path),
                     )
                 elif "name" in data:
                     idea_id = data["name"].split("/")[-1]
@@ -435,6 +694,7 @@ class SessionManager:
                         description=data.get("description"),
                         content=data.get("content", {}),
                         attributes=data.get("attributes", {}),
+                        session_id=session_id_from_path(data["name"]),
                     )
                 else:
                     continue
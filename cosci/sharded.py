@@ -0,0 +1,431 @@
+"""
+Sharded client for the Cosci SDK.
+
+Spreads research sessions over several Discovery Engine engines (and
+projects), so batch ideation throughput scales with the number of engines.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from cosci.client import CoScientist
+from cosci.config import Config
+from cosci.exceptions import APIError, SessionError
+from cosci.logger import LogIcons, get_logger
+from cosci.models import Idea, InstanceState, ResearchSession, SessionState
+
+SessionRef = Union[str, ResearchSession]
+
+_SESSION_PATH = re.compile(
+    r"(?P<base>projects/[^/]+/locations/[^/]+/collections/[^/]+/engines/(?P<engine>[^/]+))"
+    r"/sessions/(?P<session>[^/:]+)"
+)
+
+
+class _Shard:
+    """
+    One engine and its routing statistics.
+    """
+
+    def __init__(self, client: CoScientist, failure_window: int):
+        self.client = client
+        self.pending = 0
+        # Session ID -> time.monotonic() when it was started
+        self.active: Dict[str, float] = {}
+        self.sessions_created = 0
+        self.outcomes: Deque[bool] = deque(maxlen=failure_window)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Sessions being started or generating ideas on this engine.
+        """
+        return self.pending + len(self.active)
+
+    @property
+    def base_path(self) -> str:
+        return self.client.api_client.base_path
+
+    @property
+    def engine(self) -> str:
+        return self.client.config.engine
+
+    def finished(self, active: Dict[str, float], ttl: float) -> List[str]:
+        """
+        Sessions in ``active`` that finished or were started over ``ttl``
+        seconds ago.
+
+        Finished sessions are recognized from the state their owning
+        client last saw, so sessions polled outside the sharded client
+        stop counting too.
+        """
+        cutoff = time.monotonic() - ttl
+        session_manager = self.client.session_manager
+        finished = []
+        for session_id, started in active.items():
+            session = session_manager.get_tracked_session(session_id)
+            instance = session.instance if session else None
+            if started < cutoff or (
+                instance
+                and instance.state in (InstanceState.SUCCEEDED, InstanceState.FAILED)
+            ):
+                finished.append(session_id)
+        return finished
+
+    def failure_rate(self) -> float:
+        """
+        Share of recent session starts that failed.
+        """
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+class ShardedCoScientist:
+    """
+    Co-Scientist client that routes work across several engines.
+
+    New research goals go to the engine with the lowest load, where load is
+    the number of in-flight sessions plus a penalty for recent failures.
+    Status and idea calls are routed back to the engine that owns the
+    session, found from the session's resource path or the local registry.
+
+    Example:
+        client = ShardedCoScientist.from_config_files(
+            ["engine-a.yaml", "engine-b.yaml"]
+        )
+        session = client.create_session("Your research question")
+        status = client.get_session_status(session)
+    """
+
+    FAILURE_WINDOW = 20
+    # A shard whose recent sessions all failed counts as this many extra sessions
+    FAILURE_PENALTY = 5.0
+    # Sessions stop counting as load this many seconds after they started
+    ACTIVE_SESSION_TTL = 3600.0
+    # Most recently used session owners remembered for routing
+    OWNER_CACHE_SIZE = 10000
+
+    def __init__(self, engines: List[Union[Config, CoScientist]]):
+        """
+        Initialize the sharded client.
+
+        Args:
+            engines: Engine configurations, or already-built clients
+        """
+        if not engines:
+            raise SessionError("ShardedCoScientist needs at least one engine")
+
+        self.logger = get_logger("ShardedCoScientist")
+        self.logger.section("Sharded Co-Scientist Initialization", "=", 60)
+
+        self.shards = [
+            _Shard(
+                engine if isinstance(engine, CoScientist) else CoScientist(engine),
+                self.FAILURE_WINDOW,
+            )
+            for engine in engines
+        ]
+        self._owners: "OrderedDict[str, _Shard]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.logger.success(
+            f"Sharded client ready with {len(self.shards)} engines", LogIcons.ROCKET
+        )
+
+    @classmethod
+    def from_config_files(cls, config_paths: List[str]) -> "ShardedCoScientist":
+        """
+        Create a sharded client from one YAML config file per engine.
+
+        Args:
+            config_paths: Paths to config YAML files
+
+        Returns:
+            Configured ShardedCoScientist client
+        """
+        return cls([Config.from_yaml(path) for path in config_paths])
+
+    def _expire_finished(self):
+        """
+        Stop counting finished and expired sessions as load.
+
+        Runs outside ``self._lock``: reading a shard's session manager may
+        initialize a deferred client, which authenticates over the network.
+        """
+        for shard in self.shards:
+            with self._lock:
+                active = dict(shard.active)
+            if not active:
+                continue
+            finished = shard.finished(active, self.ACTIVE_SESSION_TTL)
+            with self._lock:
+                for session_id in finished:
+                    shard.active.pop(session_id, None)
+
+    def _select_shard(self) -> _Shard:
+        """
+        Pick the least-loaded shard for a new session.
+        """
+        return min(
+            self.shards,
+            key=lambda s: s.in_flight + self.FAILURE_PENALTY * s.failure_rate(),
+        )
+
+    def _acquire_shard(self) -> _Shard:
+        self._expire_finished()
+        with self._lock:
+            shard = self._select_shard()
+            shard.pending += 1
+            return shard
+
+    def _release_shard(
+        self, shard: _Shard, succeeded: bool, session_id: Optional[str] = None
+    ):
+        with self._lock:
+            shard.pending -= 1
+            shard.outcomes.append(succeeded)
+            if succeeded:
+                shard.sessions_created += 1
+            if session_id:
+                # Counted as in flight until it is seen as finished or expires
+                shard.active[session_id] = time.monotonic()
+                self._remember(session_id, shard)
+
+    def _remember(self, session_id: str, shard: _Shard):
+        """
+        Record the owner of a session, dropping the least recently used
+        owners beyond ``OWNER_CACHE_SIZE``. Call with ``self._lock`` held.
+        """
+        self._owners[session_id] = shard
+        self._owners.move_to_end(session_id)
+        while len(self._owners) > self.OWNER_CACHE_SIZE:
+            self._owners.popitem(last=False)
+
+    def _register(self, session_id: str, shard: _Shard):
+        with self._lock:
+            self._remember(session_id, shard)
+
+    def _resolve(self, session: SessionRef):
+        """
+        Find the shard owning a session and the bare session ID.
+
+        Accepts a ResearchSession, a full session resource path or a bare
+        session ID. Unknown IDs are looked up on each engine once and then
+        remembered.
+        """
+        if isinstance(session, ResearchSession):
+            session = session.metadata.get("name") or session.session_id
+
+        match = _SESSION_PATH.search(session)
+        if match:
+            session_id = match.group("session")
+            for shard in self.shards:
+                if shard.base_path == match.group("base"):
+                    return shard, session_id
+            for shard in self.shards:
+                if shard.engine == match.group("engine"):
+                    return shard, session_id
+            raise SessionError(f"No configured engine owns session: {session}")
+
+        session_id = session
+        with self._lock:
+            shard = self._owners.get(session_id)
+            if shard:
+                self._owners.move_to_end(session_id)
+        if shard:
+            return shard, session_id
+
+        # Sessions started through a shard's own client
+        for shard in self.shards:
+            if shard.client.session_manager.get_tracked_session(session_id):
+                self._register(session_id, shard)
+                return shard, session_id
+
+        # Fall back to asking each engine
+        for shard in self.shards:
+            try:
+                shard.client.session_manager.get_session_info(session_id, fields="name")
+            except APIError:
+                continue
+            self._register(session_id, shard)
+            return shard, session_id
+
+        raise SessionError(f"Session not found on any engine: {session_id}")
+
+    def session_path(self, session: SessionRef) -> str:
+        """
+        Full resource path of a session on its owning engine.
+        """
+        shard, session_id = self._resolve(session)
+        return f"{shard.base_path}/sessions/{session_id}"
+
+    def create_session(self, research_goal: str) -> ResearchSession:
+        """
+        Start a research session on the least-loaded engine.
+
+        The session's resource path is stored in ``session.metadata["name"]``.
+        """
+        shard = self._acquire_shard()
+        self.logger.info(f"Routing new session to engine {shard.engine}", LogIcons.API)
+
+        try:
+            session = shard.client.session_manager.create_session(research_goal)
+        except Exception:
+            self._release_shard(shard, succeeded=False)
+            raise
+
+        session.metadata["name"] = f"{shard.base_path}/sessions/{session.session_id}"
+        session.metadata["engine"] = shard.engine
+        self._release_shard(shard, succeeded=True, session_id=session.session_id)
+        return session
+
+    def generate_ideas(
+        self,
+        research_goal: str,
+        wait_timeout: Optional[int] = None,
+        min_ideas: Optional[int] = None,
+    ) -> List[Idea]:
+        """
+        Generate research ideas on the least-loaded engine.
+
+        Args:
+            research_goal: The research question or goal
+            wait_timeout: Override timeout from config
+            min_ideas: Override min_ideas from config
+
+        Returns:
+            List of generated ideas
+        """
+        shard = self._acquire_shard()
+        self.logger.info(f"Routing ideation to engine {shard.engine}", LogIcons.API)
+
+        succeeded = False
+        try:
+            ideas = shard.client.generate_ideas(
+                research_goal, wait_timeout=wait_timeout, min_ideas=min_ideas
+            )
+            succeeded = True
+            return ideas
+        finally:
+            self._release_shard(shard, succeeded)
+
+    def get_session(self, session: SessionRef) -> ResearchSession:
+        """
+        Get an existing session from its owning engine.
+
+        Sessions started by this client are returned as tracked; others
+        are built from the engine's session information, which is stored
+        in ``session.metadata``.
+        """
+        shard, session_id = self._resolve(session)
+        tracked = shard.client.session_manager.get_tracked_session(session_id)
+        if tracked:
+            return tracked
+
+        info = shard.client.session_manager.get_session_info(session_id)
+        metadata = dict(info)
+        metadata["name"] = f"{shard.base_path}/sessions/{session_id}"
+        metadata["engine"] = shard.engine
+        return ResearchSession(
+            session_id=session_id,
+            state=(
+                SessionState.IN_PROGRESS
+                if info.get("ideaForgeInstance")
+                else SessionState.CREATED
+            ),
+            metadata=metadata,
+        )
+
+    def get_session_info(self, session: SessionRef) -> Dict[str, Any]:
+        """
+        Get raw session information from the owning engine.
+        """
+        shard, session_id = self._resolve(session)
+        return shard.client.session_manager.get_session_info(session_id)
+
+    def get_session_status(self, session: SessionRef) -> Dict[str, Any]:
+        """
+        Get detailed status for a session from the owning engine.
+        """
+        shard, session_id = self._resolve(session)
+        status = shard.client.session_manager.get_session_status(session_id)
+        status["engine"] = shard.engine
+
+        if status["state"] in ("SUCCEEDED", "FAILED"):
+            with self._lock:
+                shard.active.pop(session_id, None)
+
+        return status
+
+    def get_ideas_from_session(self, session: SessionRef, **kwargs) -> List[Idea]:
+        """
+        Get ideas from a session on the owning engine.
+
+        Keyword arguments are passed to
+        ``SessionManager.get_ideas_from_session``.
+        """
+        shard, session_id = self._resolve(session)
+        return shard.client.session_manager.get_ideas_from_session(session_id, **kwargs)
+
+    def export_session_ideas(self, session: SessionRef, **kwargs) -> str:
+        """
+        Export session ideas to file from the owning engine.
+        """
+        shard, session_id = self._resolve(session)
+        return shard.client.session_manager.export_session_ideas(session_id, **kwargs)
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """
+        List sessions across all engines.
+        """
+        sessions = []
+        for shard in self.shards:
+            sessions.extend(shard.client.list_sessions())
+        return sessions
+
+    def get_shard_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-engine routing statistics.
+        """
+        self._expire_finished()
+        with self._lock:
+            counts = [
+                (shard.in_flight, shard.sessions_created, shard.failure_rate())
+                for shard in self.shards
+            ]
+        return [
+            {
+                "engine": shard.engine,
+                "base_path": shard.base_path,
+                "in_flight": in_flight,
+                "sessions_created": sessions_created,
+                "failure_rate": failure_rate,
+            }
+            for shard, (in_flight, sessions_created, failure_rate) in zip(
+                self.shards, counts
+            )
+        ]
+
+    def close(self):
+        """
+        Close all engine clients.
+        """
+        for shard in self.shards:
+            shard.client.close()
+        self.logger.success("Sharded client closed", LogIcons.SUCCESS)
+
+    def __enter__(self):
+        """
+        Context manager entry.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Context manager exit.
+        """
+        self.close()
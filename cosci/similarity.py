@@ -0,0 +1,456 @@
+"""
+Similarity Search Module for Cosci SDK
+======================================
+TF-IDF similarity search over ideas.
+
+Idea text (title, description and loaded content) is turned into hashed
+bag-of-words vectors, stored as a sparse CSR matrix in NumPy arrays. For
+queries, the matrix is also kept column-wise, so a query only touches the
+ideas that share a term with it. Indexes can be saved to a directory and
+loaded back with memory-mapped arrays, so large archives can be searched
+offline without reading them into memory.
+
+Requires NumPy: pip install 'py-cosci[analysis]'
+
+Example:
+    index = TfidfIndex()
+    index.add(ideas)
+    index.similar(ideas[0], k=5)
+    index.save("out/similarity")
+    index = TfidfIndex.load("out/similarity")
+    index.query("retrieval augmented reranking", k=10)
+"""
+
+import functools
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from cosci.exceptions import CosciError
+from cosci.index import tokenize
+from cosci.models import Idea
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Array files of a saved index
+_ARRAYS = ("indptr", "indices", "data", "df", "col_ptr", "col_rows", "col_weights")
+
+
+def _require_numpy():
+    if np is None:
+        raise CosciError(
+            "Similarity search requires NumPy.\n"
+            "Install it with: pip install 'py-cosci[analysis]'"
+        )
+
+
+@functools.lru_cache(maxsize=2**18)
+def _hash_token(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def _content_text(value: Any) -> List[str]:
+    """
+    String leaves of nested content.
+    """
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _content_text(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _content_text(item)]
+    return []
+
+
+def idea_text(idea: Idea, include_content: bool = True) -> str:
+    """
+    Searchable text of an idea.
+
+    Content is only included when it is already loaded, so lazily loaded
+    ideas are not fetched just to be indexed.
+    """
+    parts = [idea.title or "", idea.description or ""]
+    if include_content and idea.content_loaded:
+        parts.extend(_content_text(idea.content))
+    return "\n".join(parts)
+
+
+class HashingVectorizer:
+    """
+    Maps text to sparse term-frequency vectors by hashing tokens.
+
+    Hashing needs no vocabulary, so vectors of new ideas can be added
+    without refitting. CRC32 is used because it is stable across processes,
+    unlike ``hash()``.
+    """
+
+    def __init__(self, n_features: int = 2**18, stemming: bool = True, ngrams: int = 1):
+        """
+        Initialize the vectorizer.
+
+        Args:
+            n_features: Vector dimension; collisions get rarer as it grows
+            stemming: Strip common suffixes from tokens
+            ngrams: Also hash word sequences up to this length
+        """
+        self.n_features = n_features
+        self.stemming = stemming
+        self.ngrams = ngrams
+
+    def config(self) -> Dict[str, Any]:
+        return {
+            "n_features": self.n_features,
+            "stemming": self.stemming,
+            "ngrams": self.ngrams,
+        }
+
+    def tokens(self, text: str) -> List[str]:
+        """
+        Tokens and n-grams of a text.
+        """
+        words = tokenize(text, self.stemming)
+        tokens = list(words)
+        for n in range(2, self.ngrams + 1):
+            tokens.extend(" ".join(words[i : i + n]) for i in range(len(words) - n + 1))
+        return tokens
+
+    def transform(self, text: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Sparse vector of a text.
+
+        Returns:
+            Sorted feature indices and their sublinear term frequencies
+            (1 + log(count))
+        """
+        _, indices, data = self.transform_many([text])
+        return indices, data
+
+    def transform_many(
+        self, texts: Sequence[str]
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Sparse vectors of several texts as CSR arrays.
+
+        Counting is done for all texts at once, on (row, feature) keys.
+
+        Returns:
+            ``indptr``, ``indices`` and ``data`` of the rows, with features
+            sorted within each row
+        """
+        hashes = []
+        lengths = []
+        for text in texts:
+            tokens = self.tokens(text)
+            hashes.extend(map(_hash_token, tokens))
+            lengths.append(len(tokens))
+
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        keys = (
+            rows * self.n_features + np.array(hashes, dtype=np.int64) % self.n_features
+        )
+        keys, counts = np.unique(keys, return_counts=True)
+
+        row_lengths = np.bincount(keys // self.n_features, minlength=len(texts))
+        indptr = np.concatenate([np.zeros(1, dtype=np.int64), np.cumsum(row_lengths)])
+        indices = (keys % self.n_features).astype(np.int32)
+        data = (1.0 + np.log(counts)).astype(np.float32)
+        return indptr, indices, data
+
+
+class TfidfIndex:
+    """
+    Cosine-similarity index of idea TF-IDF vectors.
+
+    Rows are stored in CSR form (``indptr``, ``indices``, ``data``) with
+    raw term frequencies; IDF weights and row norms are derived when the
+    index is first queried after a change. Ideas are only added once: IDs
+    already in the index are skipped.
+    """
+
+    def __init__(
+        self,
+        vectorizer: Optional[HashingVectorizer] = None,
+        include_content: bool = True,
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            vectorizer: Text vectorizer, hashing with default settings if
+                omitted
+            include_content: Index loaded idea content as well as title
+                and description
+        """
+        _require_numpy()
+
+        self.vectorizer = vectorizer or HashingVectorizer()
+        self.include_content = include_content
+
+        self.idea_ids: List[str] = []
+        self.titles: List[Optional[str]] = []
+        self.session_ids: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._data = np.empty(0, dtype=np.float32)
+        self._df = np.zeros(self.vectorizer.n_features, dtype=np.int64)
+
+        # Column-wise copy of the normalized TF-IDF matrix, built on demand
+        self._idf: Optional["np.ndarray"] = None
+        self._col_ptr: Optional["np.ndarray"] = None
+        self._col_rows: Optional["np.ndarray"] = None
+        self._col_weights: Optional["np.ndarray"] = None
+
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.idea_ids)
+
+    def __contains__(self, idea_id: str) -> bool:
+        return idea_id in self._positions
+
+    def __repr__(self) -> str:
+        return f"TfidfIndex(ideas={len(self)}, features={self.vectorizer.n_features})"
+
+    def add(self, ideas: Iterable[Idea]) -> int:
+        """
+        Add ideas to the index.
+
+        Returns:
+            Number of ideas added; ideas already indexed are skipped
+        """
+        with self._lock:
+            texts = []
+            for idea in ideas:
+                if idea.idea_id in self._positions:
+                    continue
+                self._positions[idea.idea_id] = len(self.idea_ids)
+                self.idea_ids.append(idea.idea_id)
+                self.titles.append(idea.title)
+                self.session_ids.append(idea.session_id)
+                texts.append(idea_text(idea, self.include_content))
+
+            if texts:
+                self._append_rows(*self.vectorizer.transform_many(texts))
+        return len(texts)
+
+    def _append_rows(self, indptr, indices, data):
+        """
+        Append CSR rows and drop derived arrays.
+        """
+        self._indptr = np.concatenate([self._indptr, self._indptr[-1] + indptr[1:]])
+        self._indices = np.concatenate([self._indices, indices])
+        self._data = np.concatenate([self._data, data])
+
+        df = np.array(self._df)  # writable copy if memory-mapped
+        df += np.bincount(indices, minlength=len(df))
+        self._df = df
+        self._col_ptr = None
+
+    def _prepare(self):
+        """
+        Build the normalized, column-wise TF-IDF matrix.
+        """
+        if self._col_ptr is not None:
+            return
+
+        count = len(self)
+        self._idf = (np.log((1 + count) / (1 + self._df)) + 1).astype(np.float32)
+
+        rows = np.repeat(
+            np.arange(count, dtype=np.int32), np.diff(self._indptr).astype(np.int64)
+        )
+        weights = self._data * self._idf[self._indices]
+        norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=count))
+        norms[norms == 0] = 1.0
+        weights = (weights / norms[rows]).astype(np.float32)
+
+        order = np.argsort(self._indices, kind="stable")
+        self._col_rows = rows[order]
+        self._col_weights = weights[order]
+        self._col_ptr = np.concatenate(
+            [
+                np.zeros(1, dtype=np.int64),
+                np.cumsum(np.bincount(self._indices, minlength=len(self._df))),
+            ]
+        )
+
+    def _scores(self, text: str) -> "np.ndarray":
+        """
+        Cosine similarity of a text to every indexed idea.
+        """
+        features, weights = self.vectorizer.transform(text)
+        weights = weights * self._idf[features]
+        norm = np.sqrt(np.dot(weights, weights))
+        if norm:
+            weights /= norm
+
+        scores = np.zeros(len(self), dtype=np.float32)
+        col_ptr = self._col_ptr
+        for feature, weight in zip(features.tolist(), weights.tolist()):
+            start, end = col_ptr[feature], col_ptr[feature + 1]
+            if start != end:
+                scores[self._col_rows[start:end]] += (
+                    weight * self._col_weights[start:end]
+                )
+        return scores
+
+    def _top(
+        self, scores: "np.ndarray", k: int, exclude: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        if exclude is not None:
+            scores[exclude] = 0.0
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        best = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [
+            {
+                "idea_id": self.idea_ids[i],
+                "title": self.titles[i],
+                "session_id": self.session_ids[i],
+                "score": float(scores[i]),
+            }
+            for i in best.tolist()
+            if scores[i] > 0
+        ]
+
+    def query(self, text: Union[str, Idea], k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Ideas most similar to a text or idea.
+
+        Args:
+            text: Query text, or an idea whose text is used
+            k: Maximum number of results
+
+        Returns:
+            Up to k matches with "idea_id", "title", "session_id" and
+            cosine "score", best first; ideas sharing no terms are omitted
+        """
+        if isinstance(text, Idea):
+            text = idea_text(text, self.include_content)
+        with self._lock:
+            if not len(self) or k <= 0:
+                return []
+            self._prepare()
+            return self._top(self._scores(text), k)
+
+    def query_batch(
+        self, texts: Sequence[Union[str, Idea]], k: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several queries; see ``query``.
+        """
+        with self._lock:
+            return [self.query(text, k) for text in texts]
+
+    def similar(self, idea: Idea, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Ideas most similar to an idea, excluding the idea itself.
+        """
+        with self._lock:
+            if not len(self) or k <= 0:
+                return []
+            self._prepare()
+            scores = self._scores(idea_text(idea, self.include_content))
+            return self._top(scores, k, exclude=self._positions.get(idea.idea_id))
+
+    def save(self, path: str) -> str:
+        """
+        Save the index to a directory of .npy arrays and a JSON manifest.
+
+        Returns:
+            Directory path
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._prepare()
+            arrays = {
+                "indptr": self._indptr,
+                "indices": self._indices,
+                "data": self._data,
+                "df": self._df,
+                "col_ptr": self._col_ptr,
+                "col_rows": self._col_rows,
+                "col_weights": self._col_weights,
+            }
+            manifest = {
+                "vectorizer": self.vectorizer.config(),
+                "include_content": self.include_content,
+                "idea_ids": self.idea_ids,
+                "titles": self.titles,
+                "session_ids": self.session_ids,
+            }
+
+            # Write everything to temporary files first and then swap them
+            # in, so saving over the directory an index was memory-mapped
+            # from never truncates files that are still being read
+            written = []
+            try:
+                for name, array in arrays.items():
+                    temporary = directory / f".{name}.npy.tmp"
+                    written.append((temporary, directory / f"{name}.npy"))
+                    with open(temporary, "wb") as f:
+                        np.save(f, array)
+
+                temporary = directory / ".index.json.tmp"
+                written.append((temporary, directory / "index.json"))
+                with open(temporary, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f, ensure_ascii=False)
+
+                for temporary, target in written:
+                    os.replace(temporary, target)
+            finally:
+                for temporary, _ in written:
+                    if temporary.exists():
+                        temporary.unlink()
+        return str(directory)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "TfidfIndex":
+        """
+        Load an index saved with ``save``.
+
+        Args:
+            path: Index directory
+            mmap: Memory-map the arrays instead of reading them; pages are
+                read from disk as queries touch them. Adding ideas copies
+                the arrays into memory.
+        """
+        _require_numpy()
+
+        directory = Path(path)
+        try:
+            with open(directory / "index.json", "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise CosciError(f"No similarity index found in {directory}")
+
+        index = cls(
+            HashingVectorizer(**manifest["vectorizer"]),
+            include_content=manifest["include_content"],
+        )
+        index.idea_ids = manifest["idea_ids"]
+        index.titles = manifest["titles"]
+        index.session_ids = manifest["session_ids"]
+        index._positions = {idea_id: i for i, idea_id in enumerate(index.idea_ids)}
+
+        mode = "r" if mmap else None
+        for name in _ARRAYS:
+            setattr(
+                index, f"_{name}", np.load(directory / f"{name}.npy", mmap_mode=mode)
+            )
+        index._idf = (
+            np.log((1 + len(index)) / (1 + np.asarray(index._df))) + 1
+        ).astype(np.float32)
+        return index
@@ -0,0 +1,505 @@
+"""
+Streaming Idea Statistics for Cosci SDK
+=======================================
+One-pass, mergeable summary statistics over ideas.
+
+``IdeaStats`` consumes ideas in one pass, from lists, generators or
+exported session files, keeping only counters, running moments and a
+quantile sketch. Memory stays constant however many ideas are summarized,
+and accumulators built in separate processes can be merged (or shipped as
+``to_dict()`` JSON) into one fleet-wide summary.
+
+Example:
+    stats = IdeaStats.from_exports(Path("out/ideas").glob("ideas_*.json"))
+    print(stats.summary())
+    print(stats.describe(q=(0.5, 0.9, 0.99)))
+
+    # In worker processes, then combined
+    total = IdeaStats()
+    for partial in results:
+        total.merge(IdeaStats.from_dict(partial))
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from cosci.exceptions import CosciError
+from cosci.models import Idea
+
+# Elo ratings buffered before they are folded into the running statistics
+_CHUNK = 4096
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Values are counted in logarithmic buckets whose boundaries grow by
+    ``gamma = (1 + a) / (1 - a)``, so every quantile estimate is within a
+    relative error ``a`` of a true value. Negative values and zero are
+    tracked separately. Sketches with the same accuracy merge by adding
+    bucket counts, which makes the result independent of how the values
+    were split across sketches.
+    """
+
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.005):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+        """
+        if not 0 < relative_accuracy < 1:
+            raise CosciError(
+                f"relative_accuracy must be in (0, 1), got {relative_accuracy}"
+            )
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self.count = 0
+        self.zero_count = 0
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of the bucket (gamma^(i-1), gamma^i]
+        return 2 * self.gamma**index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """
+        Record a value ``count`` times.
+        """
+        if value > self.MIN_VALUE:
+            store, index = self._positive, self._index(value)
+        elif value < -self.MIN_VALUE:
+            store, index = self._negative, self._index(-value)
+        else:
+            self.zero_count += count
+            self.count += count
+            return
+        store[index] = store.get(index, 0) + count
+        self.count += count
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Add another sketch's values to this one.
+
+        Returns:
+            This sketch
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise CosciError(
+                "Cannot merge sketches with different relative accuracy: "
+                f"{self.relative_accuracy} and {other.relative_accuracy}"
+            )
+        for index, count in other._positive.items():
+            self._positive[index] = self._positive.get(index, 0) + count
+        for index, count in other._negative.items():
+            self._negative[index] = self._negative.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile (0 <= q <= 1); None when empty.
+        """
+        if not 0 <= q <= 1:
+            raise CosciError(f"Quantile must be in [0, 1], got {q}")
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self._positive))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable state.
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "zero_count": self.zero_count,
+            "positive": {str(i): c for i, c in self._positive.items()},
+            "negative": {str(i): c for i, c in self._negative.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """
+        Rebuild a sketch from ``to_dict()`` output.
+        """
+        sketch = cls(data["relative_accuracy"])
+        sketch.count = data["count"]
+        sketch.zero_count = data["zero_count"]
+        sketch._positive = {int(i): c for i, c in data["positive"].items()}
+        sketch._negative = {int(i): c for i, c in data["negative"].items()}
+        return sketch
+
+
+class IdeaStats:
+    """
+    One-pass accumulator of idea statistics.
+
+    Always tracks the idea count, how many ideas have a description or
+    loaded content, and the count, sum and extremes of Elo ratings. With
+    ``distribution=True`` (the default) it also keeps the Elo mean and
+    variance, combined chunk by chunk with Chan's parallel formula, and a
+    ``QuantileSketch``; counters-only
+    accumulators skip that work and cannot answer ``variance``,
+    ``quantile`` or ``describe``.
+
+    Ideas without a numeric Elo rating count towards everything but the
+    rating statistics. Content that a lazy loader has not fetched yet is
+    not counted, so summarizing never triggers detail requests.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.005, distribution: bool = True):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            relative_accuracy: Relative error of Elo quantile estimates
+            distribution: Track Elo variance and quantiles
+        """
+        self.count = 0
+        self.has_descriptions = 0
+        self.has_content = 0
+
+        self.rated = 0
+        self.elo_sum = 0.0
+        self.elo_min: Optional[float] = None
+        self.elo_max: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.sketch = QuantileSketch(relative_accuracy) if distribution else None
+
+    def __repr__(self) -> str:
+        return f"IdeaStats(count={self.count}, rated={self.rated})"
+
+    @property
+    def distribution(self) -> bool:
+        """
+        Whether Elo variance and quantiles are tracked.
+        """
+        return self.sketch is not None
+
+    def _require_distribution(self):
+        if self.sketch is None:
+            raise CosciError(
+                "Elo variance and quantiles are not tracked by this IdeaStats; "
+                "create it with distribution=True"
+            )
+
+    def _record(self, values: List[float]):
+        """
+        Add a chunk of Elo ratings.
+        """
+        if not values:
+            return
+        count = len(values)
+        low, high = min(values), max(values)
+        self.elo_min = low if self.elo_min is None else min(self.elo_min, low)
+        self.elo_max = high if self.elo_max is None else max(self.elo_max, high)
+
+        if self.sketch is not None:
+            mean = sum(values) / count
+            m2 = sum((value - mean) ** 2 for value in values)
+            self._merge_moments(count, mean, m2)
+            add = self.sketch.add
+            for value in values:
+                add(value)
+
+        # Continue the running sum so totals match a plain left-to-right sum
+        self.elo_sum = sum(values, self.elo_sum)
+        self.rated += count
+
+    def _merge_moments(self, count: int, mean: float, m2: float):
+        # Chan's parallel formula; call before updating ``rated``
+        total = self.rated + count
+        delta = mean - self._mean
+        self._m2 += m2 + delta**2 * self.rated * count / total
+        self._mean += delta * count / total
+
+    def add(self, idea: Idea) -> "IdeaStats":
+        """
+        Record one idea.
+
+        Returns:
+            The accumulator
+        """
+        return self.update((idea,))
+
+    def add_dict(self, data: Dict[str, Any]) -> "IdeaStats":
+        """
+        Record one idea in ``Idea.to_dict()`` form, as found in exports.
+
+        Returns:
+            The accumulator
+        """
+        return self.update_dicts((data,))
+
+    def update(self, ideas: Iterable[Idea]) -> "IdeaStats":
+        """
+        Record ideas from any iterable, including generators.
+
+        Returns:
+            The accumulator
+        """
+        count = descriptions = content = 0
+        values: List[float] = []
+        for idea in ideas:
+            count += 1
+            if idea.description:
+                descriptions += 1
+            if idea.content_loaded and idea.content:
+                content += 1
+            value = idea.attributes.get("eloRating")
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                values.append(value)
+                if len(values) == _CHUNK:
+                    self._record(values)
+                    values = []
+        self._record(values)
+
+        self.count += count
+        self.has_descriptions += descriptions
+        self.has_content += content
+        return self
+
+    def update_dicts(self, ideas: Iterable[Dict[str, Any]]) -> "IdeaStats":
+        """
+        Record ideas in ``Idea.to_dict()`` form.
+
+        Returns:
+            The accumulator
+        """
+        count = descriptions = content = 0
+        values: List[float] = []
+        for data in ideas:
+            count += 1
+            if data.get("description"):
+                descriptions += 1
+            if data.get("content"):
+                content += 1
+            value = (data.get("attributes") or {}).get("eloRating")
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                values.append(value)
+                if len(values) == _CHUNK:
+                    self._record(values)
+                    values = []
+        self._record(values)
+
+        self.count += count
+        self.has_descriptions += descriptions
+        self.has_content += content
+        return self
+
+    def update_exports(
+        self, sessions: Iterable[Union[str, Path, Dict[str, Any]]]
+    ) -> "IdeaStats":
+        """
+        Record the ideas of exported sessions, reading one file at a time.
+
+        Args:
+            sessions: Export file paths or already loaded session data
+
+        Returns:
+            The accumulator
+        """
+        for source in sessions:
+            if isinstance(source, (str, Path)):
+                with open(source, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                data = source
+            self.update_dicts(data.get("ideas", []))
+        return self
+
+    @classmethod
+    def from_ideas(
+        cls,
+        ideas: Iterable[Idea],
+        relative_accuracy: float = 0.005,
+        distribution: bool = True,
+    ) -> "IdeaStats":
+        """
+        Accumulator over ideas.
+        """
+        return cls(relative_accuracy, distribution).update(ideas)
+
+    @classmethod
+    def from_exports(
+        cls,
+        sessions: Iterable[Union[str, Path, Dict[str, Any]]],
+        relative_accuracy: float = 0.005,
+        distribution: bool = True,
+    ) -> "IdeaStats":
+        """
+        Accumulator over the ideas of exported sessions.
+        """
+        return cls(relative_accuracy, distribution).update_exports(sessions)
+
+    def merge(self, other: "IdeaStats") -> "IdeaStats":
+        """
+        Combine another accumulator into this one.
+
+        Moments are combined with Chan's parallel formula, so the result
+        matches a single pass over both inputs. A counters-only
+        accumulator can absorb any other, but one tracking the
+        distribution can only absorb others that do too.
+
+        Returns:
+            The accumulator
+        """
+        if self.sketch is not None:
+            if other.sketch is None:
+                raise CosciError(
+                    "Cannot merge a counters-only IdeaStats into one tracking "
+                    "the Elo distribution"
+                )
+            self.sketch.merge(other.sketch)
+            if other.rated:
+                self._merge_moments(other.rated, other._mean, other._m2)
+
+        self.count += other.count
+        self.has_descriptions += other.has_descriptions
+        self.has_content += other.has_content
+
+        if other.rated:
+            self.rated += other.rated
+            self.elo_sum += other.elo_sum
+            self.elo_min = (
+                other.elo_min
+                if self.elo_min is None
+                else min(self.elo_min, other.elo_min)
+            )
+            self.elo_max = (
+                other.elo_max
+                if self.elo_max is None
+                else max(self.elo_max, other.elo_max)
+            )
+        return self
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        Mean Elo rating; None without rated ideas.
+        """
+        return self.elo_sum / self.rated if self.rated else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """
+        Sample variance of Elo ratings; None with fewer than two.
+        """
+        self._require_distribution()
+        return self._m2 / (self.rated - 1) if self.rated > 1 else None
+
+    @property
+    def std(self) -> Optional[float]:
+        """
+        Sample standard deviation of Elo ratings.
+        """
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate Elo q-quantile, clamped to the observed range.
+        """
+        self._require_distribution()
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.elo_min), self.elo_max)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Statistics in the form of ``IdeaProcessor.summarize_ideas``.
+        """
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "avg_elo": self.mean if self.rated else 0,
+            "max_elo": self.elo_max if self.rated else 0,
+            "min_elo": self.elo_min if self.rated else 0,
+            "has_descriptions": self.has_descriptions,
+            "has_content": self.has_content,
+        }
+
+    def describe(self, q: Sequence[float] = (0.5, 0.9, 0.99)) -> Dict[str, Any]:
+        """
+        ``summary()`` plus rated count, Elo spread and quantiles.
+
+        Returns:
+            Summary with "rated", "elo_std" and "elo_quantiles" (quantile
+            to approximate value) added; Elo fields are None without
+            rated ideas
+        """
+        result = self.summary()
+        result.update(
+            {
+                "rated": self.rated,
+                "elo_std": self.std,
+                "elo_quantiles": {p: self.quantile(p) for p in q},
+            }
+        )
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable state, for shipping between processes.
+        """
+        return {
+            "count": self.count,
+            "has_descriptions": self.has_descriptions,
+            "has_content": self.has_content,
+            "rated": self.rated,
+            "elo_sum": self.elo_sum,
+            "elo_min": self.elo_min,
+            "elo_max": self.elo_max,
+            "mean": self._mean,
+            "m2": self._m2,
+            "sketch": self.sketch.to_dict() if self.sketch is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IdeaStats":
+        """
+        Rebuild an accumulator from ``to_dict()`` output.
+        """
+        stats = cls(distribution=data["sketch"] is not None)
+        if data["sketch"] is not None:
+            stats.sketch = QuantileSketch.from_dict(data["sketch"])
+        stats.count = data["count"]
+        stats.has_descriptions = data["has_descriptions"]
+        stats.has_content = data["has_content"]
+        stats.rated = data["rated"]
+        stats.elo_sum = data["elo_sum"]
+        stats.elo_min = data["elo_min"]
+        stats.elo_max = data["elo_max"]
+        stats._mean = data["mean"]
+        stats._m2 = data["m2"]
+        return stats
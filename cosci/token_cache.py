@@ -0,0 +1,196 @@
+"""
+Token Cache Module for Cosci SDK
+================================
+On-disk access-token cache shared between processes.
+
+Short-lived scripts and parallel batch workers each authenticate on start-up.
+With a shared cache, the first process mints a token and the others reuse it
+until it nears expiry, skipping the OAuth round-trip.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import fcntl
+
+    LOCKING_AVAILABLE = True
+except ImportError:
+    # Windows: fall back to atomic replace without inter-process locking
+    LOCKING_AVAILABLE = False
+
+
+def _utcnow() -> datetime:
+    """
+    Current time as a naive UTC datetime, matching google-auth's expiry.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class TokenCache:
+    """
+    File-locked, permission-restricted cache of OAuth access tokens.
+
+    Entries are keyed by service account email and scopes, so one cache file
+    can serve several principals. The cache file is created with mode 0600
+    inside a directory with mode 0700; existing directories writable by
+    group or others are refused.
+    """
+
+    DEFAULT_MIN_REMAINING = 300
+
+    def __init__(self, path: str, min_remaining: int = DEFAULT_MIN_REMAINING):
+        """
+        Initialize the token cache.
+
+        Args:
+            path: Path to the cache file
+            min_remaining: Minimum seconds of validity for a cached token
+                to be returned
+        """
+        self.path = Path(path).expanduser()
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.min_remaining = min_remaining
+
+    @staticmethod
+    def make_key(service_account_email: str, scopes: Iterable[str]) -> str:
+        """
+        Build the cache key for a principal and its scopes.
+        """
+        raw = f"{service_account_email}|{' '.join(sorted(scopes))}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[Tuple[str, datetime]]:
+        """
+        Return a cached (token, expiry) pair if it is still fresh.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Token and naive UTC expiry, or None if missing or expiring
+        """
+        with self._locked(exclusive=False):
+            entries = self._read()
+
+        entry = entries.get(key)
+        if not entry:
+            return None
+
+        try:
+            expiry = datetime.fromisoformat(entry["expiry"])
+            token = entry["token"]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if (expiry - _utcnow()).total_seconds() < self.min_remaining:
+            return None
+
+        return token, expiry
+
+    def store(self, key: str, token: str, expiry: datetime):
+        """
+        Save a token, pruning entries that have already expired.
+
+        Args:
+            key: Cache key from make_key()
+            token: Access token
+            expiry: Naive UTC expiry
+        """
+        now = _utcnow()
+
+        with self._locked(exclusive=True):
+            entries = {
+                k: v
+                for k, v in self._read().items()
+                if self._expiry_of(v) and self._expiry_of(v) > now
+            }
+            entries[key] = {"token": token, "expiry": expiry.isoformat()}
+            self._write(entries)
+
+    def clear(self):
+        """
+        Remove all cached tokens.
+        """
+        with self._locked(exclusive=True):
+            if self.path.exists():
+                self.path.unlink()
+
+    @staticmethod
+    def _expiry_of(entry: Dict) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(entry["expiry"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _ensure_dir(self):
+        """
+        Create the cache directory with mode 0700, or check an existing one.
+
+        mkdir's mode is reduced by the umask and ignored for existing
+        directories, so a new directory is chmod-ed explicitly and an
+        existing group- or world-writable one is refused, since anyone who
+        can write there could replace the cache file.
+
+        Raises:
+            PermissionError: If an existing directory is writable by others
+        """
+        directory = self.path.parent
+        if not directory.exists():
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if os.name != "nt":
+                os.chmod(directory, 0o700)
+            return
+
+        if os.name != "nt" and directory.stat().st_mode & 0o022:
+            raise PermissionError(
+                f"Token cache directory {directory} is writable by other users; "
+                "restrict it with chmod go-w"
+            )
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """
+        Hold an advisory lock on the companion lock file.
+        """
+        self._ensure_dir()
+
+        if not LOCKING_AVAILABLE:
+            yield
+            return
+
+        fd = os.open(str(self.lock_path), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, entries: Dict[str, Dict[str, str]]):
+        # mkstemp creates the file with mode 0600
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(self.path.parent), prefix=".tokens-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
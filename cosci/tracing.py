@@ -0,0 +1,434 @@
+"""
+Tracing Module for Cosci SDK
+============================
+Lightweight spans for timing SDK phases and HTTP calls.
+
+Spans are context managers; a span opened inside another becomes its child.
+Finished spans are handed to pluggable exporters (in-memory, log, or
+OpenTelemetry when it is installed).
+
+Example:
+    tracer = Tracer([InMemoryExporter()])
+    with tracer.span("load", kind="phase", items=3) as span:
+        ...
+        span.set_attribute("loaded", True)
+"""
+
+import functools
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from cosci.exceptions import CosciError
+from cosci.logger import LogLevel, get_logger
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "cosci_current_span", default=None
+)
+
+
+def current_span() -> Optional["Span"]:
+    """
+    Span active in the current context, if any.
+    """
+    return _current_span.get()
+
+
+class Span:
+    """
+    A timed operation with attributes and a parent.
+
+    IDs use the W3C/OpenTelemetry sizes: 32 hex digits for the trace and
+    16 for the span.
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        parent = _current_span.get()
+
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.children: List["Span"] = []
+        self.status = "OK"
+        self.error: Optional[str] = None
+        self.start_time = 0.0
+        self.end_time: Optional[float] = None
+        self._start = 0.0
+        self._duration: Optional[float] = None
+        self._token = None
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        return self.parent.span_id if self.parent else None
+
+    @property
+    def duration(self) -> float:
+        """
+        Seconds from start to end, or to now while the span is open.
+        """
+        if self._duration is not None:
+            return self._duration
+        return time.perf_counter() - self._start
+
+    def set_attribute(self, key: str, value: Any):
+        """
+        Set one attribute.
+        """
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        """
+        Set several attributes.
+        """
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        if self.parent is not None:
+            self.parent.children.append(self)
+        self._token = _current_span.set(self)
+        self.tracer._on_start(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._duration = time.perf_counter() - self._start
+        self.end_time = self.start_time + self._duration
+        if exc_type is not None:
+            self.status = "ERROR"
+            self.error = f"{exc_type.__name__}: {exc_val}"
+        _current_span.reset(self._token)
+        self.tracer._on_end(self)
+        return False
+
+    def __repr__(self) -> str:
+        return f"Span(name={self.name}, duration={self.duration:.3f}s, status={self.status})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+        }
+
+
+class SpanExporter:
+    """
+    Base class for span exporters.
+    """
+
+    def on_start(self, span: Span):
+        """
+        Called when a span starts.
+        """
+
+    def export(self, span: Span):
+        """
+        Called when a span ends.
+        """
+
+    def shutdown(self):
+        """
+        Release exporter resources.
+        """
+
+
+class InMemoryExporter(SpanExporter):
+    """
+    Keeps finished spans in a list, e.g. for tests or notebooks.
+    """
+
+    def __init__(self, max_spans: int = 10000):
+        self.max_spans = max_spans
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+            if len(self._spans) > self.max_spans:
+                del self._spans[: len(self._spans) - self.max_spans]
+
+    def get_finished_spans(self) -> List[Span]:
+        """
+        Finished spans, oldest first.
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """
+        Drop collected spans.
+        """
+        with self._lock:
+            self._spans.clear()
+
+
+class LoggingExporter(SpanExporter):
+    """
+    Writes each finished span as a "span" log event.
+    """
+
+    def __init__(self, logger_name: str = "Tracing", level: LogLevel = LogLevel.DEBUG):
+        self.logger = get_logger(logger_name, level)
+        self.level = level
+
+    def export(self, span: Span):
+        self.logger.event(
+            "span",
+            lambda: f"{span.name} {span.duration * 1000:.1f}ms {span.status}",
+            level=self.level,
+            span=span.name,
+            trace_id=span.trace_id,
+            span_id=span.span_id,
+            parent_id=span.parent_id,
+            latency_ms=round(span.duration * 1000, 3),
+            span_status=span.status,
+            attributes=span.attributes,
+        )
+
+
+class OpenTelemetryExporter(SpanExporter):
+    """
+    Mirrors spans into OpenTelemetry, keeping the parent/child structure.
+
+    Requires the opentelemetry-api package; spans go to whatever tracer
+    provider the application has configured.
+    """
+
+    def __init__(self, instrumentation_name: str = "cosci"):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise CosciError(
+                "OpenTelemetry exporter requires opentelemetry-api. "
+                "Install with: pip install py-cosci[tracing]"
+            )
+
+        self._trace = trace
+        self._tracer = trace.get_tracer(instrumentation_name)
+        self._live: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span):
+        context = None
+        if span.parent is not None:
+            with self._lock:
+                parent = self._live.get(span.parent.span_id)
+            if parent is not None:
+                context = self._trace.set_span_in_context(parent)
+
+        otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start_time * 1e9),
+        )
+        with self._lock:
+            self._live[span.span_id] = otel_span
+
+    def export(self, span: Span):
+        with self._lock:
+            otel_span = self._live.pop(span.span_id, None)
+        if otel_span is None:
+            return
+
+        otel_span.set_attribute("cosci.kind", span.kind)
+        for key, value in span.attributes.items():
+            if isinstance(value, (str, bool, int, float)):
+                otel_span.set_attribute(key, value)
+        if span.status == "ERROR":
+            otel_span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, span.error)
+            )
+        otel_span.end(end_time=int(span.end_time * 1e9))
+
+
+EXPORTERS = {
+    "memory": InMemoryExporter,
+    "log": LoggingExporter,
+    "otel": OpenTelemetryExporter,
+}
+
+
+class Tracer:
+    """
+    Creates spans and hands finished spans to its exporters.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporters: Span exporters; spans are still timed without any
+        """
+        self.exporters: List[SpanExporter] = list(exporters or [])
+
+    def span(self, name: str, kind: str = "internal", **attributes) -> Span:
+        """
+        Create a span; use it as a context manager.
+
+        Args:
+            name: Operation name
+            kind: "phase" for SDK phases, "http" for HTTP calls,
+                "internal" otherwise
+            **attributes: Initial attributes
+        """
+        return Span(self, name, kind, attributes)
+
+    def add_exporter(self, exporter: SpanExporter):
+        """
+        Add a span exporter.
+        """
+        self.exporters.append(exporter)
+
+    def _on_start(self, span: Span):
+        for exporter in self.exporters:
+            exporter.on_start(span)
+
+    def _on_end(self, span: Span):
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    def shutdown(self):
+        """
+        Shut down all exporters.
+        """
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+def create_tracer(exporter: Optional[str] = None) -> Tracer:
+    """
+    Create a tracer with a named exporter.
+
+    Args:
+        exporter: "memory", "log", "otel", or None/"none" for no exporter
+
+    Returns:
+        Configured tracer
+    """
+    if not exporter or exporter == "none":
+        return Tracer()
+    if exporter not in EXPORTERS:
+        raise CosciError(
+            f"Unknown span exporter: {exporter}\n"
+            f"Must be one of: none, {', '.join(EXPORTERS)}"
+        )
+    return Tracer([EXPORTERS[exporter]()])
+
+
+_default_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Tracer used by components that were not given one.
+    """
+    return _default_tracer
+
+
+def set_tracer(tracer: Tracer):
+    """
+    Replace the default tracer.
+    """
+    global _default_tracer
+    _default_tracer = tracer
+
+
+def traced(name: str, kind: str = "phase") -> Callable:
+    """
+    Decorator running a method inside a span of ``self.tracer``.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(name, kind=kind):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TimingBreakdown:
+    """
+    Where the time of one traced call went.
+
+    ``phases`` maps each innermost SDK phase (spans of kind "phase" without
+    phase children) to its total seconds, in the order phases started.
+    HTTP calls made anywhere below the root are counted in ``http_calls``
+    and ``http_time``.
+    """
+
+    def __init__(self, root: Span):
+        self.name = root.name
+        self.trace_id = root.trace_id
+        self.total = root.duration
+        self.phases: Dict[str, float] = {}
+        self.http_calls = 0
+        self.http_time = 0.0
+        self._collect(root)
+
+    def _collect(self, span: Span):
+        for child in span.children:
+            if child.kind == "http":
+                self.http_calls += 1
+                self.http_time += child.duration
+            elif child.kind == "phase" and not any(
+                c.kind == "phase" for c in child.children
+            ):
+                self.phases[child.name] = (
+                    self.phases.get(child.name, 0.0) + child.duration
+                )
+            self._collect(child)
+
+    @property
+    def unaccounted(self) -> float:
+        """
+        Seconds of the root not covered by any phase.
+        """
+        return max(0.0, self.total - sum(self.phases.values()))
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{name}={seconds:.2f}s" for name, seconds in self.phases.items()
+        )
+        return f"TimingBreakdown(total={self.total:.2f}s, {phases}, http_calls={self.http_calls})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "total": self.total,
+            "phases": dict(self.phases),
+            "unaccounted": self.unaccounted,
+            "http_calls": self.http_calls,
+            "http_time": self.http_time,
+        }
@@ -0,0 +1,398 @@
+"""
+HTTP Transport Module for Cosci SDK
+===================================
+Pluggable HTTP backends used by the API client.
+
+The default backend is built on ``requests``. An HTTP/2 backend built on
+``httpx`` multiplexes concurrent requests over a single connection and is
+available when ``httpx[http2]`` is installed. Backend libraries are imported
+when a transport is created, not when this module is imported.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+from cosci.exceptions import (
+    CosciError,
+    TransportConnectionError,
+    TransportError,
+    TransportTimeout,
+)
+
+# Use orjson for response decoding when installed
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+Timeout = Tuple[float, float]
+
+
+class TransportResponse:
+    """
+    Backend-independent HTTP response.
+    """
+
+    def __init__(self, status_code: int, headers: Any, content: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def __repr__(self) -> str:
+        return (
+            f"TransportResponse(status={self.status_code}, bytes={len(self.content)})"
+        )
+
+    @property
+    def text(self) -> str:
+        """
+        Response body decoded as UTF-8.
+        """
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Parse the response body as JSON.
+
+        Decodes directly from the raw bytes, without an intermediate str.
+        """
+        return json_loads(self.content)
+
+
+class StreamingResponse:
+    """
+    Response whose body is read incrementally.
+    """
+
+    def __init__(self, status_code: int, headers: Any, chunks: Iterator[bytes]):
+        self.status_code = status_code
+        self.headers = headers
+        self._chunks = chunks
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """
+        Iterate over body chunks as they arrive.
+        """
+        return self._chunks
+
+
+class Transport:
+    """
+    Interface for HTTP backends.
+
+    Subclasses implement ``send``, ``stream`` and ``close``. Errors must be
+    raised as ``TransportError`` subclasses so the API client can retry
+    without knowing which library sits underneath.
+    """
+
+    name = "base"
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        """
+        Send a request and read the full response body.
+        """
+        raise NotImplementedError
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+        chunk_size: int = 8192,
+    ):
+        """
+        Context manager yielding a ``StreamingResponse``.
+        """
+        raise NotImplementedError
+
+    def warm_up(self, url: str, connections: int, timeout: float = 10) -> int:
+        """
+        Open connections to ``url`` ahead of the first real request.
+
+        Returns:
+            Number of connections successfully opened
+        """
+        return 0
+
+    def close(self):
+        """
+        Release all connections held by the transport.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    HTTP/1.1 transport backed by a pooled ``requests.Session``.
+    """
+
+    name = "requests"
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        with self._translate_errors():
+            response = self.session.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                data=body,
+                timeout=timeout,
+            )
+            return TransportResponse(
+                response.status_code, response.headers, response.content
+            )
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+        chunk_size: int = 8192,
+    ):
+        with self._translate_errors():
+            response = self.session.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                data=body,
+                timeout=timeout,
+                stream=True,
+            )
+        try:
+            yield StreamingResponse(
+                response.status_code,
+                response.headers,
+                response.iter_content(chunk_size=chunk_size),
+            )
+        finally:
+            response.close()
+
+    def warm_up(self, url: str, connections: int, timeout: float = 10) -> int:
+        if not self.keep_alive:
+            return 0
+
+        # Connections beyond the pool size cannot be kept for reuse
+        connections = min(connections, self.pool_maxsize)
+
+        def _open(_):
+            try:
+                self.session.head(url, timeout=(timeout, timeout))
+                return True
+            except self._requests.exceptions.RequestException:
+                return False
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(_open, range(connections)))
+
+    def close(self):
+        self.session.close()
+
+    @contextmanager
+    def _translate_errors(self):
+        exceptions = self._requests.exceptions
+        try:
+            yield
+        except exceptions.Timeout as e:
+            raise TransportTimeout(str(e)) from e
+        except exceptions.ConnectionError as e:
+            raise TransportConnectionError(str(e)) from e
+        except exceptions.RequestException as e:
+            raise TransportError(str(e)) from e
+
+
+class HTTP2Transport(Transport):
+    """
+    HTTP/2 transport backed by ``httpx``.
+
+    Concurrent requests to the same host share one multiplexed connection,
+    so high-fanout polling is not limited by per-connection head-of-line
+    blocking or the size of an HTTP/1.1 pool.
+    """
+
+    name = "http2"
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise CosciError(
+                "The http2 transport requires httpx with HTTP/2 support.\n"
+                "Install it with: pip install 'py-cosci[http2]'"
+            )
+
+        self._httpx = httpx
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        )
+
+        try:
+            self.client = httpx.Client(http2=True, limits=limits)
+        except ImportError:
+            raise CosciError(
+                "The http2 transport requires the 'h2' package.\n"
+                "Install it with: pip install 'py-cosci[http2]'"
+            )
+
+    def _timeout(self, timeout: Optional[Timeout]):
+        if timeout is None:
+            return self._httpx.Timeout(None)
+        connect, read = timeout
+        return self._httpx.Timeout(read, connect=connect)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        with self._translate_errors():
+            response = self.client.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                content=body,
+                timeout=self._timeout(timeout),
+            )
+            return TransportResponse(
+                response.status_code, response.headers, response.content
+            )
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+        chunk_size: int = 8192,
+    ):
+        with self._translate_errors():
+            with self.client.stream(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                content=body,
+                timeout=self._timeout(timeout),
+            ) as response:
+                yield StreamingResponse(
+                    response.status_code,
+                    response.headers,
+                    response.iter_bytes(chunk_size=chunk_size),
+                )
+
+    def warm_up(self, url: str, connections: int, timeout: float = 10) -> int:
+        # A single multiplexed connection serves every concurrent request
+        try:
+            self.client.head(url, timeout=timeout)
+            return 1
+        except self._httpx.HTTPError:
+            return 0
+
+    def close(self):
+        self.client.close()
+
+    @contextmanager
+    def _translate_errors(self):
+        try:
+            yield
+        except self._httpx.TimeoutException as e:
+            raise TransportTimeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise TransportConnectionError(str(e)) from e
+        except self._httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+
+
+TRANSPORTS: Dict[str, Type[Transport]] = {
+    RequestsTransport.name: RequestsTransport,
+    HTTP2Transport.name: HTTP2Transport,
+}
+
+
+def create_transport(name: str = "requests", **options) -> Transport:
+    """
+    Create a transport by name.
+
+    Args:
+        name: Registered transport name ("requests" or "http2")
+        **options: Pool settings passed to the transport constructor
+
+    Returns:
+        Transport instance
+
+    Raises:
+        CosciError: If the transport name is unknown
+    """
+    if name not in TRANSPORTS:
+        raise CosciError(
+            f"Unknown transport: {name}\n"
+            f"Must be one of: {', '.join(sorted(TRANSPORTS))}"
+        )
+    return TRANSPORTS[name](**options)
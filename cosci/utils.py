@@ -2,13 +2,114 @@
 Utility functions for processing and analyzing ideas.
 """
 
+import heapq
 import json
+import math
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from cosci.exceptions import ValidationError
 from cosci.models import Idea
 
+if TYPE_CHECKING:
+    from cosci.index import IdeaIndex
+
+# Best Elo first, then best (lowest) ranking, then newest
+DEFAULT_RANK_KEYS = ("-eloRating", "ranking", "-created_at")
+
+MISSING_POLICIES = ("last", "first", "drop", "error")
+
+
+class _Descending:
+    """
+    Wrapper inverting the order of non-numeric values.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def _idea_value(idea: Idea, field: str) -> Any:
+    if field == "created_at":
+        return idea.created_timestamp
+    if field in ("title", "idea_id", "session_id"):
+        return getattr(idea, field)
+    value = idea.attributes.get(field)
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _parse_keys(keys: Sequence[str]) -> List[Tuple[str, bool]]:
+    if isinstance(keys, str):
+        keys = [keys]
+    if not keys:
+        raise ValidationError("At least one ranking key is required")
+    return [(key[1:], True) if key.startswith("-") else (key, False) for key in keys]
+
+
+def _sort_key(
+    keys: Sequence[str], missing: str
+) -> Callable[[Tuple[int, Idea]], Optional[tuple]]:
+    """
+    Build a key function over (position, idea) pairs.
+
+    Each ranking key contributes a missing flag and a value, so ideas
+    missing a metric sort last (or first) regardless of direction; the
+    position breaks remaining ties, which keeps the ordering stable. The
+    function returns None for ideas to drop.
+    """
+    if missing not in MISSING_POLICIES:
+        raise ValidationError(
+            f"Invalid missing-value policy: {missing}\n"
+            f"Must be one of: {', '.join(MISSING_POLICIES)}"
+        )
+    parsed = _parse_keys(keys)
+    missing_flag, present_flag = (0, 1) if missing == "first" else (1, 0)
+
+    def key(item: Tuple[int, Idea]) -> Optional[tuple]:
+        position, idea = item
+        parts = []
+        for field, descending in parsed:
+            value = _idea_value(idea, field)
+            if value is None:
+                if missing == "drop":
+                    return None
+                if missing == "error":
+                    raise ValidationError(
+                        f"Idea {idea.idea_id} has no value for {field!r}"
+                    )
+                parts += (missing_flag, 0)
+            elif descending:
+                is_number = isinstance(value, (int, float))
+                parts += (present_flag, -value if is_number else _Descending(value))
+            else:
+                parts += (present_flag, value)
+        parts.append(position)
+        return tuple(parts)
+
+    return key
+
 
 class IdeaProcessor:
     """
@@ -16,23 +117,95 @@ class IdeaProcessor:
     """
 
     @staticmethod
-    def rank_ideas(ideas: List[Idea], metric: str = "eloRating") -> List[Idea]:
+    def rank_ideas(
+        ideas: List[Idea], metric: str = "eloRating", k: Optional[int] = None
+    ) -> List[Idea]:
         """
         Rank ideas by specified metric.
+
+        Missing values count as 0. With ``k``, only the best k ideas are
+        selected, in O(n log k).
         """
-        return sorted(ideas, key=lambda x: x.attributes.get(metric, 0), reverse=True)
+
+        def key(x):
+            return x.attributes.get(metric, 0)
+
+        if k is not None:
+            return heapq.nlargest(k, ideas, key=key)
+        return sorted(ideas, key=key, reverse=True)
+
+    @staticmethod
+    def rank_by(
+        ideas: Iterable[Idea],
+        keys: Sequence[str] = DEFAULT_RANK_KEYS,
+        k: Optional[int] = None,
+        missing: str = "last",
+    ) -> List[Idea]:
+        """
+        Rank ideas by several keys with explicit missing-value handling.
+
+        Args:
+            ideas: Ideas to rank; any iterable, consumed once
+            keys: Attribute names, or "created_at", "title", "idea_id" or
+                "session_id"; a "-" prefix sorts that key descending.
+                Later keys break ties of earlier ones.
+            k: Return only the best k ideas, selected with a bounded heap
+                in O(n log k) instead of a full sort
+            missing: Ideas lacking a key are placed "last" or "first",
+                dropped ("drop"), or rejected ("error")
+
+        Returns:
+            Ranked ideas; ideas that tie on all keys keep their input order
+
+        Raises:
+            ValidationError: For invalid keys or policy, or a missing value
+                with missing="error"
+        """
+        sort_key = _sort_key(keys, missing)
+        keyed = ((sort_key(item), item[1]) for item in enumerate(ideas))
+        if missing == "drop":
+            keyed = (pair for pair in keyed if pair[0] is not None)
+
+        if k is not None:
+            best = heapq.nsmallest(k, keyed, key=lambda pair: pair[0])
+        else:
+            best = sorted(keyed, key=lambda pair: pair[0])
+        return [idea for _, idea in best]
+
+    @staticmethod
+    def top_k(
+        ideas: Iterable[Idea],
+        k: int,
+        keys: Sequence[str] = DEFAULT_RANK_KEYS,
+        missing: str = "last",
+    ) -> List[Idea]:
+        """
+        Best k ideas; shorthand for ``rank_by(ideas, keys, k=k)``.
+        """
+        return IdeaProcessor.rank_by(ideas, keys=keys, k=k, missing=missing)
 
     @staticmethod
     def filter_ideas(
         ideas: List[Idea],
         min_elo: Optional[float] = None,
         keywords: Optional[List[str]] = None,
+        index: Optional["IdeaIndex"] = None,
     ) -> List[Idea]:
         """
         Filter ideas based on criteria.
+
+        Keywords match as case-insensitive substrings of the title or
+        description. With an ``index`` containing the ideas, they are
+        looked up as whole words or phrases in the index instead of
+        scanning every idea's text.
         """
         filtered = ideas
 
+        if keywords and index is not None:
+            matching = index.match_ids(keywords)
+            filtered = [idea for idea in filtered if idea.idea_id in matching]
+            keywords = None
+
         if min_elo:
             filtered = [
                 idea
@@ -54,27 +227,62 @@ class IdeaProcessor:
         return filtered
 
     @staticmethod
-    def summarize_ideas(ideas: List[Idea]) -> Dict[str, Any]:
+    def dedupe(
+        ideas: Sequence[Idea], threshold: float = 0.8, keep: str = "best"
+    ) -> List[Idea]:
         """
-        Generate summary statistics for ideas.
+        Drop near-duplicate ideas using MinHash/LSH (requires NumPy).
+
+        Args:
+            ideas: Ideas to deduplicate
+            threshold: Estimated Jaccard similarity of title and
+                description word shingles counting as duplicate
+            keep: "best" keeps the highest-Elo idea of each group, "first"
+                the earliest
+
+        Returns:
+            Remaining ideas in input order
         """
+        from cosci.dedupe import dedupe_ideas
+
+        return dedupe_ideas(ideas, threshold=threshold, keep=keep)
+
+    @staticmethod
+    def cluster_ideas(
+        ideas: Sequence[Idea], n_clusters: int = 8, titles: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Group ideas into themes with mini-batch k-means (requires NumPy).
+
+        Args:
+            ideas: Ideas to cluster
+            n_clusters: Number of themes; capped at the number of ideas
+            titles: Representative titles per theme
+
+        Returns:
+            Themes largest first, each with "size", "titles", "idea_ids"
+            and Elo "count", "mean", "min" and "max"
+        """
+        from cosci.clustering import IdeaClusterer
+
+        ideas = list(ideas)
         if not ideas:
-            return {"count": 0}
-
-        elo_ratings = [
-            idea.attributes.get("eloRating", 0)
-            for idea in ideas
-            if "eloRating" in idea.attributes
-        ]
-
-        return {
-            "count": len(ideas),
-            "avg_elo": sum(elo_ratings) / len(elo_ratings) if elo_ratings else 0,
-            "max_elo": max(elo_ratings) if elo_ratings else 0,
-            "min_elo": min(elo_ratings) if elo_ratings else 0,
-            "has_descriptions": sum(1 for idea in ideas if idea.description),
-            "has_content": sum(1 for idea in ideas if idea.content),
-        }
+            return []
+        clusterer = IdeaClusterer(n_clusters=min(n_clusters, len(ideas)))
+        return clusterer.fit(ideas).summarize(ideas, titles=titles)
+
+    @staticmethod
+    def summarize_ideas(ideas: Iterable[Idea]) -> Dict[str, Any]:
+        """
+        Generate summary statistics for ideas in one pass.
+
+        Accepts any iterable, including generators; see ``IdeaStats`` for
+        variance, quantiles and merging partial summaries. Content not yet
+        fetched by a lazy loader is not counted in "has_content".
+        """
+        from cosci.stats import IdeaStats
+
+        return IdeaStats.from_ideas(ideas, distribution=False).summary()
 
     @staticmethod
     def export_to_markdown(ideas: List[Idea], filepath: str):
@@ -159,3 +367,129 @@ class SessionAnalyzer:
             comparison["sessions"].append(session_summary)
 
         return comparison
+
+    @staticmethod
+    def ranked_entries(
+        data: Dict[str, Any],
+        metric: str = "eloRating",
+        normalize: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Leaderboard entries of one exported session, best first.
+
+        Args:
+            data: Exported session data (see ``load_session_data``)
+            metric: Idea attribute to rank by; ideas without it are skipped
+            normalize: Score ideas by the z-score of the metric within the
+                session, so sessions with differently sized tournaments
+                are comparable
+
+        Returns:
+            Entries with "session_id", "idea_id", "title", the raw metric
+            value and "score" (the z-score when normalizing)
+        """
+        session_id = data.get("session_id")
+        values = []
+        for idea in data.get("ideas", []):
+            value = (idea.get("attributes") or {}).get(metric)
+            if isinstance(value, (int, float)) and not math.isnan(value):
+                values.append((value, idea))
+
+        mean = std = 0.0
+        if normalize and values:
+            mean = sum(v for v, _ in values) / len(values)
+            std = math.sqrt(sum((v - mean) ** 2 for v, _ in values) / len(values))
+
+        entries = []
+        for value, idea in values:
+            if normalize:
+                score = (value - mean) / std if std else 0.0
+            else:
+                score = value
+            entries.append(
+                {
+                    "session_id": session_id,
+                    "idea_id": idea.get("idea_id"),
+                    "title": idea.get("title"),
+                    metric: value,
+                    "score": score,
+                }
+            )
+        entries.sort(key=lambda entry: entry["score"], reverse=True)
+        return entries
+
+    @staticmethod
+    def merge_ranked(
+        streams: Iterable[Iterable[Dict[str, Any]]], k: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge leaderboard streams that are each sorted best first.
+
+        Streams are read lazily with a k-way heap merge; only as many
+        entries as needed for the top k are pulled from each stream.
+
+        Args:
+            streams: Iterables of entries with a "score", best first
+            k: Number of entries to return
+
+        Returns:
+            Top k entries with a 1-based "rank"; ties keep stream order
+        """
+        merged = heapq.merge(*streams, key=lambda entry: entry["score"], reverse=True)
+        leaderboard = []
+        for rank, entry in enumerate(merged, 1):
+            if rank > k:
+                break
+            leaderboard.append({"rank": rank, **entry})
+        return leaderboard
+
+    @staticmethod
+    def global_leaderboard(
+        sessions: Iterable[Union[str, Dict[str, Any]]],
+        k: int = 10,
+        metric: str = "eloRating",
+        normalize: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Top k ideas across many exported sessions.
+
+        Sessions are loaded one at a time and merged into a heap bounded
+        at k entries, so memory stays proportional to k plus one session,
+        however many sessions are given.
+
+        Args:
+            sessions: Export file paths or already loaded session data
+            k: Number of ideas to return
+            metric: Idea attribute to rank by
+            normalize: Rank by per-session z-score of the metric instead
+                of its raw value (see ``ranked_entries``)
+
+        Returns:
+            Top k entries with a 1-based "rank", best first; ties keep
+            the order sessions were given in
+        """
+        if k <= 0:
+            return []
+
+        # Min-heap of (score, -order, entry); the root is the weakest kept
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        order = 0
+        for source in sessions:
+            data = (
+                SessionAnalyzer.load_session_data(source)
+                if isinstance(source, (str, Path))
+                else source
+            )
+            for entry in SessionAnalyzer.ranked_entries(data, metric, normalize):
+                item = (entry["score"], -order, entry)
+                order += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+                else:
+                    # The rest of this session ranks lower still
+                    break
+
+        ranked = sorted(heap, reverse=True)
+        return [{"rank": rank, **entry} for rank, (_, _, entry) in enumerate(ranked, 1)]
@@ -71,7 +71,7 @@ export_data = {
             "title": idea.title,
             "elo_rating": idea.attributes.get("eloRating", 0),
         }
-        for i, idea in enumerate(ranked_ideas[:3], 1)
+        for i, idea in enumerate(processor.top_k(ideas, 3), 1)
     ],
 }
 
@@ -46,5 +46,17 @@ setup(
         "colors": [
             "colorama>=0.4.4",
         ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
+        "tracing": [
+            "opentelemetry-api>=1.20.0",
+        ],
+        "analysis": [
+            "numpy>=1.21",
+        ],
     },
 )
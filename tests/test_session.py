@@ -0,0 +1,54 @@
+"""
+Tests for polling a session's instance for ideas.
+"""
+
+from unittest import mock
+
+from cosci.models import Idea, Instance, InstanceState
+from cosci.session import IdeaDetailsLoader, SessionManager
+
+PREVIEW = {
+    "ideaForgeIdea": (
+        "projects/p/locations/global/collections/default_collection/engines/e"
+        "/sessions/123/ideaForgeInstances/456/ideaForgeIdeas/789"
+    ),
+    "title": "Idea",
+    "summary": "Summary",
+    "ranking": 1,
+    "eloRating": 1200.0,
+}
+
+
+def test_poll_returns_preview_only_instance():
+    full = {"state": "SUCCEEDED", "ideaPreviews": [PREVIEW]}
+    masked = {
+        "state": "SUCCEEDED",
+        "ideaPreviews": [{"ideaForgeIdea": PREVIEW["ideaForgeIdea"]}],
+    }
+    api_client = mock.Mock()
+    api_client.get.side_effect = lambda endpoint, fields=None: (
+        masked if fields else full
+    )
+
+    manager = SessionManager(api_client)
+    instance = Instance("456", session_id="123", state=InstanceState.ACTIVE)
+    with mock.patch("cosci.session.time.sleep"):
+        ideas = manager.poll_for_ideas(instance, timeout=5, poll_interval=0)
+
+    assert [idea.idea_id for idea in ideas] == ["789"]
+    assert ideas[0].title == "Idea"
+    assert api_client.get.call_count == 2
+
+
+def test_details_loader_stops_prefetching_after_reading_all_ideas():
+    manager = mock.Mock()
+    manager.get_idea_details.side_effect = lambda session, instance, idea: {
+        "idea": idea
+    }
+    ideas = [Idea(str(i)) for i in range(10)]
+    loader = IdeaDetailsLoader(manager, "123", "456", ideas, prefetch=3)
+    loader.attach()
+
+    assert [idea.content["idea"] for idea in ideas] == [str(i) for i in range(10)]
+    assert loader._executor is None
+    assert manager.get_idea_details.call_count == 10
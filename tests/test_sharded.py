@@ -0,0 +1,68 @@
+"""
+Tests for routing sessions across engines.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from cosci import sharded
+from cosci.models import ResearchSession, SessionState
+from cosci.sharded import ShardedCoScientist
+
+
+class FakeSessionManager:
+    def __init__(self, engine):
+        self.engine = engine
+        self.sessions = {}
+        self.count = 0
+
+    def create_session(self, research_goal):
+        self.count += 1
+        session = ResearchSession(f"{self.engine}-{self.count}", research_goal)
+        self.sessions[session.session_id] = session
+        return session
+
+    def get_tracked_session(self, session_id):
+        return self.sessions.get(session_id)
+
+    def get_session_info(self, session_id, fields=None):
+        return {"name": session_id, "ideaForgeInstance": "instances/1"}
+
+
+def fake_client(engine):
+    return SimpleNamespace(
+        config=SimpleNamespace(engine=engine),
+        api_client=SimpleNamespace(
+            base_path=f"projects/p/locations/global/collections/c/engines/{engine}"
+        ),
+        session_manager=FakeSessionManager(engine),
+    )
+
+
+@pytest.fixture
+def client():
+    with mock.patch.object(sharded, "CoScientist", SimpleNamespace):
+        yield ShardedCoScientist([fake_client("a"), fake_client("b")])
+
+
+def test_get_session_returns_tracked_session(client):
+    session = client.create_session("goal")
+    assert client.get_session(session.session_id) is session
+
+
+def test_get_session_builds_untracked_session(client):
+    path = "projects/p/locations/global/collections/c/engines/b/sessions/42"
+    session = client.get_session(path)
+    assert session.session_id == "42"
+    assert session.state == SessionState.IN_PROGRESS
+    assert session.metadata["name"] == path
+    assert session.metadata["engine"] == "b"
+
+
+def test_session_owners_are_bounded(client):
+    client.OWNER_CACHE_SIZE = 3
+    sessions = [client.create_session(f"goal {i}") for i in range(5)]
+    assert list(client._owners) == [s.session_id for s in sessions[-3:]]
+    assert client.get_session(sessions[0].session_id) is sessions[0]
@@ -0,0 +1,34 @@
+"""
+Tests for saving and loading TfidfIndex.
+"""
+
+import pytest
+
+from cosci.models import Idea
+
+np = pytest.importorskip("numpy")
+
+from cosci.similarity import TfidfIndex  # noqa: E402
+
+
+def make_ideas():
+    return [
+        Idea("1", title="Graph neural networks for drug discovery"),
+        Idea("2", title="Retrieval augmented generation with reranking"),
+        Idea("3", title="Protein folding with graph transformers"),
+    ]
+
+
+def test_save_over_memory_mapped_index(tmp_path):
+    index = TfidfIndex()
+    index.add(make_ideas())
+    index.save(tmp_path)
+    expected = index.query("graph neural", k=3)
+
+    loaded = TfidfIndex.load(tmp_path, mmap=True)
+    loaded.save(tmp_path)
+
+    reloaded = TfidfIndex.load(tmp_path, mmap=True)
+    assert reloaded.idea_ids == ["1", "2", "3"]
+    assert reloaded.query("graph neural", k=3) == expected
+    assert not list(tmp_path.glob(".*.tmp"))